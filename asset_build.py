@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Asset Build
+Does the asset work once at build time instead of on every launch, using a
+process pool so the work runs on every CPU core:
+
+- world.jpg is decoded, flipped for OpenGL and mipmapped into raw RGB levels
+- the procedural Earth and galaxy textures are baked the same way
+- the globe's spheres are built as vertex and index arrays for buffer objects
+- the MP3 tracks are decoded to WAV, which loads without an MP3 decoder
+- the landing page is minified and precompressed (see web_assets)
+
+Outputs go to cache/assets/v<CACHE_VERSION>. A manifest there records a
+content hash for every input. A rebuild only redoes entries whose inputs
+changed, or whose build code changed. At run time the globe and the audio
+manager use an entry only while its inputs still match their size and
+modification time. Otherwise they do the work themselves, as before.
+
+Usage:
+    python asset_build.py build [--force] [--jobs N]
+    python asset_build.py list
+    python asset_build.py clear
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import telemetry
+
+CACHE_VERSION = 1
+APP_DIR = Path(__file__).parent
+CACHE_ROOT = APP_DIR / "cache" / "assets"
+CACHE_DIR = CACHE_ROOT / f"v{CACHE_VERSION}"
+MANIFEST_NAME = "manifest.json"
+
+# The gluSphere calls in globe.py: name -> (slices, stacks, inside)
+SPHERES = {
+    "earth": (100, 100, False),
+    "atmosphere": (50, 50, False),
+    "background": (100, 100, True),
+}
+
+
+# ------------------ Builders (run in the pool's worker processes) ------------------
+
+def _output_name(name, suffix):
+    return name.replace("/", "-").replace(".", "_") + suffix
+
+
+def _write_atomic(path, write):
+    """write(file) into a temporary file, then move it into place"""
+    temp = path.with_name(path.name + ".tmp")
+    with open(temp, "wb") as f:
+        write(f)
+    os.replace(temp, path)
+
+
+def mip_chain(pixels):
+    """pixels (height, width, 3 uint8), then every smaller level down to 1x1, each a 2x2 box filter of the last"""
+    import numpy as np
+
+    levels = [np.ascontiguousarray(pixels, dtype=np.uint8)]
+    while levels[-1].shape[0] > 1 or levels[-1].shape[1] > 1:
+        level = levels[-1].astype(np.uint32)
+        count = 1
+        if level.shape[0] > 1:
+            rows = level.shape[0] // 2 * 2
+            level = level[0:rows:2] + level[1:rows:2]
+            count *= 2
+        if level.shape[1] > 1:
+            columns = level.shape[1] // 2 * 2
+            level = level[:, 0:columns:2] + level[:, 1:columns:2]
+            count *= 2
+        levels.append(((level + count // 2) // count).astype(np.uint8))
+    return levels
+
+
+def build_texture(app_dir, cache_dir, name, source=None, generator=None, size=None):
+    """An image file, or a texture generator in globe.py, as raw RGB mip levels in one file"""
+    import numpy as np
+
+    import globe
+
+    if generator is None:
+        decoded = globe.load_texture_pixels(str(app_dir / source))
+        if decoded is None:
+            raise ValueError(f"could not decode {source}")
+        data, width, height = decoded
+        pixels = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+    else:
+        pixels = getattr(globe, generator)(size)
+    levels = mip_chain(pixels)
+
+    table = []  # [width, height, byte offset] per level
+    offset = 0
+    for level in levels:
+        table.append([level.shape[1], level.shape[0], offset])
+        offset += level.nbytes
+
+    def write(f):
+        for level in levels:
+            f.write(level.tobytes())
+
+    filename = _output_name(name, ".rgb")
+    _write_atomic(cache_dir / filename, write)
+    return {"files": [filename], "levels": table, "bytes": offset}
+
+
+def sphere_arrays(slices, stacks, inside=False):
+    """A unit sphere laid out like gluSphere's (same vertices, normals and texture coordinates)
+
+    Returns interleaved float32 vertices for GL_T2F_N3F_V3F (s, t, normal, position)
+    and uint32 triangle indices.
+    """
+    import numpy as np
+
+    i = np.arange(slices + 1)
+    j = np.arange(stacks + 1)
+    theta = 2 * np.pi * (i % slices) / slices
+    phi = np.pi * j / stacks
+    sin_phi = np.sin(phi)
+    sin_phi[[0, -1]] = 0.0  # the poles come to a point
+
+    x = np.outer(sin_phi, np.sin(theta))
+    y = np.outer(sin_phi, np.cos(theta))
+    z = np.repeat(np.cos(phi)[:, None], slices + 1, axis=1)
+    s = np.broadcast_to(1.0 - i / slices, x.shape)
+    t = np.broadcast_to((1.0 - j / stacks)[:, None], x.shape)
+    sign = -1.0 if inside else 1.0
+    vertices = np.stack([s, t, sign * x, sign * y, sign * z, x, y, z], axis=-1)
+
+    # Two triangles per cell of the stacks x slices grid
+    row = slices + 1
+    a = (j[:-1, None] * row + i[None, :-1]).ravel()
+    b = a + row
+    indices = np.stack([a, b, a + 1, a + 1, b, b + 1], axis=-1)
+    return (np.ascontiguousarray(vertices.reshape(-1, 8), dtype=np.float32),
+            np.ascontiguousarray(indices.ravel(), dtype=np.uint32))
+
+
+def build_mesh(app_dir, cache_dir, name, slices, stacks, inside):
+    import numpy as np
+
+    vertices, indices = sphere_arrays(slices, stacks, inside)
+    filename = _output_name(name, ".npz")
+    _write_atomic(cache_dir / filename, lambda f: np.savez(f, vertices=vertices, indices=indices))
+    return {"files": [filename], "vertices": len(vertices), "triangles": len(indices) // 3}
+
+
+def build_audio(app_dir, cache_dir, name, source):
+    """Decode a track with SDL_mixer (no audio device needed) and store it as 16-bit WAV"""
+    import wave
+
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import pygame
+
+    if not pygame.mixer.get_init():
+        pygame.mixer.init(frequency=44100, size=-16, channels=2)
+    frequency, size, channels = pygame.mixer.get_init()
+    sound = pygame.mixer.Sound(str(app_dir / source))
+    samples = sound.get_raw()
+
+    def write(f):
+        with wave.open(f, "wb") as out:
+            out.setnchannels(channels)
+            out.setsampwidth(abs(size) // 8)
+            out.setframerate(frequency)
+            out.writeframes(samples)
+
+    filename = _output_name(name, ".wav")
+    _write_atomic(cache_dir / filename, write)
+    return {"files": [filename], "seconds": round(sound.get_length(), 1), "bytes": len(samples)}
+
+
+def build_web(app_dir, cache_dir, name):
+    """The landing page build, which web_assets keeps in its own directory"""
+    import web_assets
+
+    out_dir = app_dir / "cache" / "web"
+    manifest = web_assets.build(app_dir, out_dir)
+    return {"files": [], "output": str(out_dir.relative_to(app_dir)), "source": manifest["source"]}
+
+
+# Code an entry's output depends on besides its inputs; editing it rebuilds the entry
+BUILD_CODE = {
+    build_texture: (mip_chain,),
+    build_mesh: (sphere_arrays,),
+}
+
+
+def plan(app_dir=APP_DIR):
+    """Every cache entry as (name, builder, input files, parameters)"""
+    import web_assets
+    from audio import TRACKS
+
+    jobs = [
+        ("texture/earth", build_texture, ("world.jpg",), {"source": "world.jpg"}),
+        ("texture/earth_procedural", build_texture, ("globe.py",),
+         {"generator": "generate_earth_pixels", "size": 256}),
+        ("texture/galaxy_procedural", build_texture, ("globe.py",),
+         {"generator": "generate_galaxy_pixels", "size": 512}),
+    ]
+    for mesh, (slices, stacks, inside) in SPHERES.items():
+        jobs.append((f"mesh/{mesh}", build_mesh, (),
+                     {"slices": slices, "stacks": stacks, "inside": inside}))
+    for filename, _ in TRACKS.values():
+        jobs.append((f"audio/{filename}", build_audio, (filename,), {"source": filename}))
+    jobs.append(("web/landing", build_web, (web_assets.ENTRY_PAGE,) + web_assets.LINKED_ASSETS, {}))
+    return jobs
+
+
+# ------------------ Building ------------------
+
+def file_hash(path, known=None):
+    """Content hash of a file with its size and mtime; reuses known's hash while those still match"""
+    stat = path.stat()
+    if known and known.get("size") == stat.st_size and known.get("mtime_ns") == stat.st_mtime_ns:
+        return dict(known)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return {"sha256": digest.hexdigest(), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def entry_key(name, builder, inputs, params):
+    """Hash of everything that goes into an entry - a change means rebuilding it"""
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}:{name}:{json.dumps(params, sort_keys=True)}".encode())
+    for code in (builder,) + BUILD_CODE.get(builder, ()):
+        digest.update(inspect.getsource(code).encode())
+    for filename in sorted(inputs):
+        digest.update(f"{filename}:{inputs[filename]['sha256']}".encode())
+    return digest.hexdigest()[:16]
+
+
+def _run(builder, app_dir, cache_dir, name, params):
+    start = time.perf_counter()
+    result = builder(app_dir, cache_dir, name, **params)
+    return result, time.perf_counter() - start
+
+
+def build(app_dir=APP_DIR, cache_dir=CACHE_DIR, force=False, jobs=None):
+    """Bring the cache up to date, building changed entries in parallel; returns the manifest"""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    start = time.perf_counter()
+    previous = (load_manifest(cache_dir) or {}).get("entries", {})
+    entries = {}
+    pending = []
+    skipped = []
+    for name, builder, inputs, params in plan(app_dir):
+        missing = [filename for filename in inputs if not (app_dir / filename).exists()]
+        if missing:
+            skipped.append(name)
+            print(f"⚠️ {name}: {', '.join(missing)} not found, skipping")
+            continue
+        old = previous.get(name, {})
+        hashes = {filename: file_hash(app_dir / filename, old.get("inputs", {}).get(filename))
+                  for filename in inputs}
+        key = entry_key(name, builder, hashes, params)
+        if (not force and old.get("key") == key
+                and all((cache_dir / filename).exists() for filename in old["files"])):
+            entries[name] = old
+        else:
+            pending.append((name, builder, hashes, key, params))
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    failed = []
+    busy = 0.0
+    workers = min(jobs or os.cpu_count() or 1, len(pending)) or 1
+    if pending:
+        print(f"🔧 Building {len(pending)} asset entries on {workers} processes "
+              f"({len(entries)} up to date)")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run, builder, app_dir, cache_dir, name, params): (name, hashes, key)
+                       for name, builder, hashes, key, params in pending}
+            for future in as_completed(futures):
+                name, hashes, key = futures[future]
+                try:
+                    result, seconds = future.result()
+                except Exception as e:
+                    print(f"❌ {name}: {e}")
+                    failed.append(name)
+                    continue
+                busy += seconds
+                entries[name] = dict(result, key=key, inputs=hashes, built_at=time.time(),
+                                     seconds=round(seconds, 3))
+                print(f"✅ {name} ({seconds * 1000:.0f} ms)")
+
+    manifest = {"version": CACHE_VERSION, "entries": entries, "failed": failed}
+    temp = cache_dir / (MANIFEST_NAME + ".tmp")
+    temp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    temp.replace(cache_dir / MANIFEST_NAME)
+    remove_stale(cache_dir, manifest)
+
+    wall = time.perf_counter() - start
+    if pending:
+        print(f"📦 Assets ready in {wall:.1f} s: {len(pending) - len(failed)} built "
+              f"({busy:.1f} s of work on {workers} processes), "
+              f"{len(entries) - len(pending) + len(failed)} up to date"
+              f"{f', {len(failed)} failed' if failed else ''}{f', {len(skipped)} skipped' if skipped else ''}")
+    else:
+        print(f"📦 All {len(entries)} asset entries up to date")
+    telemetry.record("asset_build", seconds=round(wall, 3), built=len(pending) - len(failed),
+                     failed=len(failed), workers=workers, work_seconds=round(busy, 3))
+    return manifest
+
+
+def remove_stale(cache_dir=CACHE_DIR, manifest=None):
+    """Delete files no entry uses, and caches of other format versions"""
+    manifest = manifest or load_manifest(cache_dir) or {"entries": {}}
+    keep = {MANIFEST_NAME}
+    for entry in manifest["entries"].values():
+        keep.update(entry["files"])
+    for path in cache_dir.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+    for path in cache_dir.parent.glob("v*"):
+        if path.is_dir() and path != cache_dir:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+# ------------------ Using the cache ------------------
+
+def load_manifest(cache_dir=CACHE_DIR):
+    try:
+        manifest = json.loads((cache_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != CACHE_VERSION:
+        return None
+    return manifest
+
+
+def lookup(name, source=None, app_dir=APP_DIR, cache_dir=CACHE_DIR):
+    """The entry for name if it is built and its inputs haven't changed since, else None
+
+    source: the file the caller would otherwise load; the entry must have been built from it.
+    """
+    manifest = load_manifest(cache_dir)
+    entry = manifest["entries"].get(name) if manifest else None
+    if entry is None:
+        return None
+    if source is not None and not any(Path(source).resolve() == (app_dir / filename).resolve()
+                                      for filename in entry["inputs"]):
+        return None
+    for filename, known in entry["inputs"].items():
+        try:
+            stat = (app_dir / filename).stat()
+        except OSError:
+            return None
+        if stat.st_size != known["size"] or stat.st_mtime_ns != known["mtime_ns"]:
+            return None
+    if not all((cache_dir / filename).exists() for filename in entry["files"]):
+        return None
+    return entry
+
+
+def load_texture(name, source=None, cache_dir=CACHE_DIR):
+    """A baked texture as [(pixels, width, height)] from full size down to 1x1, or None"""
+    import numpy as np
+
+    entry = lookup(f"texture/{name}", source, cache_dir=cache_dir)
+    if entry is None:
+        return None
+    data = np.fromfile(cache_dir / entry["files"][0], dtype=np.uint8)
+    return [(data[offset:offset + width * height * 3].reshape(height, width, 3), width, height)
+            for width, height, offset in entry["levels"]]
+
+
+def load_mesh(name, cache_dir=CACHE_DIR):
+    """A baked sphere as (vertices, indices) (see sphere_arrays), or None"""
+    import numpy as np
+
+    entry = lookup(f"mesh/{name}", cache_dir=cache_dir)
+    if entry is None:
+        return None
+    with np.load(cache_dir / entry["files"][0]) as arrays:
+        return arrays["vertices"], arrays["indices"]
+
+
+def cached_file(name, source=None, cache_dir=CACHE_DIR):
+    """Path of an entry's output file (e.g. a decoded track), or None"""
+    entry = lookup(name, source, cache_dir=cache_dir)
+    if entry is None or not entry["files"]:
+        return None
+    return cache_dir / entry["files"][0]
+
+
+def list_entries(cache_dir=CACHE_DIR):
+    manifest = load_manifest(cache_dir)
+    if not manifest or not manifest["entries"]:
+        print("No assets built (run: python setup_continental_quest.py build-assets)")
+        return
+    for name in sorted(manifest["entries"]):
+        entry = manifest["entries"][name]
+        size = sum((cache_dir / filename).stat().st_size for filename in entry["files"]
+                   if (cache_dir / filename).exists())
+        state = "current" if lookup(name, cache_dir=cache_dir) else "stale"
+        print(f"   {name:<28} {size / 2 ** 20:8.2f} MB  {entry['seconds'] * 1000:7.0f} ms  {state}")
+    for name in manifest.get("failed", []):
+        print(f"   {name:<28} failed in the last build")
+
+
+def main():
+    """Asset build CLI entry point"""
+    parser = argparse.ArgumentParser(description="Preprocess Continental Quest's assets into a cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="build changed assets in parallel")
+    build_parser.add_argument("--force", action="store_true", help="rebuild everything")
+    build_parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    commands.add_parser("list", help="show the cache entries")
+    commands.add_parser("clear", help="delete the asset cache")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        manifest = build(force=args.force, jobs=args.jobs)
+        raise SystemExit(1 if manifest["failed"] else 0)
+    elif args.command == "list":
+        list_entries()
+    elif args.command == "clear":
+        shutil.rmtree(CACHE_ROOT, ignore_errors=True)
+        print(f"🗑️ Removed {CACHE_ROOT}")
+
+
+if __name__ == "__main__":
+    main()
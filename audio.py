@@ -0,0 +1,189 @@
+"""
+Continental Quest - Audio
+One owner for the mixer in each process. Tracks are decoded once into
+in-memory PCM (pygame Sounds), loop gaplessly on their own reserved channels
+and crossfade into each other, so moving between the launcher music and the
+globe's space ambience never reloads or restarts a file. Tracks already
+decoded to WAV by the asset build are loaded from the cache instead.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pygame
+
+import asset_build
+
+AUDIO_DIR = Path(__file__).parent
+
+# name: (file, volume)
+TRACKS = {
+    "launcher": ("final.mp3", 0.7),
+    "globe": ("space_sound.mp3", 1.0),
+}
+
+CROSSFADE_MS = 800
+
+
+class AudioManager:
+    """Plays one looping track at a time, crossfading on every change"""
+
+    def __init__(self, tracks=TRACKS, audio_dir=AUDIO_DIR):
+        self.tracks = tracks
+        self.audio_dir = audio_dir
+        self.current = None      # the track playing (or fading in)
+        self.decode_times = {}
+        self._sounds = {}        # name -> decoded Sound
+        self._streamed = set()   # tracks SDL_mixer can't decode up front; played through mixer.music
+        self._missing = set()
+        self._decoding = {}      # name -> Event set once decoding has finished
+        self._reserved = False
+        self._lock = threading.RLock()
+
+    def _ensure_mixer(self):
+        if not pygame.mixer.get_init():
+            # Sounds decoded for an earlier mixer can't play on a new one
+            self._sounds.clear()
+            self._decoding.clear()
+            self._reserved = False
+            self.current = None
+            pygame.mixer.init()
+        if not self._reserved:
+            # Keep one channel per track out of reach of anything else that plays sounds
+            pygame.mixer.set_reserved(len(self.tracks))
+            self._reserved = True
+
+    def _channel(self, name):
+        return pygame.mixer.Channel(list(self.tracks).index(name))
+
+    def preload(self, *names, background=False):
+        """Decode tracks now (or on a background thread) so playing them never waits"""
+        names = names or tuple(self.tracks)
+        if background:
+            thread = threading.Thread(target=self.preload, args=names, name="audio-decode", daemon=True)
+            thread.start()
+            return thread
+        for name in names:
+            self._decode(name)
+
+    def _decode(self, name):
+        with self._lock:
+            if name in self._sounds or name in self._streamed or name in self._missing:
+                return
+            done = self._decoding.get(name)
+            decoding_here = done is None
+            if decoding_here:
+                done = self._decoding[name] = threading.Event()
+        if not decoding_here:
+            done.wait()
+            return
+
+        filename, volume = self.tracks[name]
+        path = self.audio_dir / filename
+        try:
+            with self._lock:
+                self._ensure_mixer()
+            if not path.exists():
+                print(f"⚠️ {filename} not found")
+                self._missing.add(name)
+                return
+            start = time.perf_counter()
+            cached = asset_build.cached_file(f"audio/{filename}", source=path)
+            try:
+                sound = pygame.mixer.Sound(str(cached or path))
+            except pygame.error as e:
+                print(f"⚠️ Could not decode {filename} ({e}), streaming it instead")
+                self._streamed.add(name)
+                return
+            sound.set_volume(volume)
+            self.decode_times[name] = time.perf_counter() - start
+            with self._lock:
+                self._sounds[name] = sound
+            print(f"🎵 {'Loaded' if cached else 'Decoded'} {filename} ({sound.get_length():.0f} s) "
+                  f"in {self.decode_times[name] * 1000:.0f} ms{' from the asset cache' if cached else ''}")
+        finally:
+            done.set()
+
+    def play(self, name, fade_ms=CROSSFADE_MS):
+        """Crossfade to track name, looping; does nothing if it is already playing
+
+        Returns False if the track can't be played.
+        """
+        if self.is_playing(name):
+            return True
+        with self._lock:
+            self._ensure_mixer()
+        self._decode(name)
+        with self._lock:
+            if name in self._missing:
+                return False
+            if self.current is not None and self.current != name:
+                self._fade_out(self.current, fade_ms)
+            filename, volume = self.tracks[name]
+            try:
+                if name in self._sounds:
+                    self._channel(name).play(self._sounds[name], loops=-1, fade_ms=fade_ms)
+                else:
+                    pygame.mixer.music.load(str(self.audio_dir / filename))
+                    pygame.mixer.music.set_volume(volume)
+                    pygame.mixer.music.play(-1, fade_ms=fade_ms)
+            except pygame.error as e:
+                print(f"⚠️ Could not play {filename}: {e}")
+                return False
+            self.current = name
+        return True
+
+    def stop(self, name=None, fade_ms=CROSSFADE_MS):
+        """Fade out a track (default: whatever is playing)"""
+        with self._lock:
+            name = name or self.current
+            if name is None or not pygame.mixer.get_init():
+                return
+            self._fade_out(name, fade_ms)
+            if self.current == name:
+                self.current = None
+
+    def _fade_out(self, name, fade_ms):
+        if name in self._sounds:
+            channel = self._channel(name)
+            if fade_ms:
+                channel.fadeout(fade_ms)
+            else:
+                channel.stop()
+        elif name in self._streamed:
+            if fade_ms:
+                pygame.mixer.music.fadeout(fade_ms)
+            else:
+                pygame.mixer.music.stop()
+
+    def is_playing(self, name=None):
+        """Whether track name (default: any track) is the one playing"""
+        with self._lock:
+            if self.current is None or (name is not None and name != self.current):
+                return False
+            if not pygame.mixer.get_init():
+                return False
+            if self.current in self._sounds:
+                return self._channel(self.current).get_busy()
+            return pygame.mixer.music.get_busy()
+
+    def state(self):
+        return {
+            "current": self.current if self.is_playing() else None,
+            "decoded": sorted(self._sounds),
+            "streamed": sorted(self._streamed),
+        }
+
+
+_audio = None
+_audio_lock = threading.Lock()
+
+
+def get_audio():
+    """This process's AudioManager"""
+    global _audio
+    with _audio_lock:
+        if _audio is None:
+            _audio = AudioManager()
+        return _audio
@@ -4,13 +4,20 @@ Continental Quest - Integrated Desktop Application
 Combines the beautiful web landing page with your existing 3D OpenGL globe
 """
 
+import time
+
+# Start of the startup timeline (taken before any other import)
+PROCESS_START = time.time()
+
+import importlib.util
 import os
 import sys
+import asyncio
 import threading
-import time
 import subprocess
 from pathlib import Path
 import json
+import urllib.parse
 
 # Try to import webview for desktop integration
 try:
@@ -20,478 +27,364 @@ except ImportError:
     WEBVIEW_AVAILABLE = False
     print("⚠️  pywebview not installed. Install with: pip install pywebview")
 
-# Import your existing globe functionality
-try:
-    import globe
-    GLOBE_AVAILABLE = True
-except ImportError:
-    GLOBE_AVAILABLE = False
-    print("⚠️  globe.py not found or has import errors")
+# The globe (pygame, PyOpenGL, numpy) is only imported by the render worker when
+# a launch needs it, and the transition and audio lazily too, so none of it delays
+# the launcher page. Keep it that way: import_budget.py checks it.
+# find_spec locates each module without importing it; if any is missing the
+# launcher falls back as it did before the render worker existed
+GLOBE_REQUIREMENTS = {
+    'globe': 'globe.py',
+    'pygame': 'pygame',
+    'OpenGL': 'PyOpenGL',
+    'numpy': 'numpy',
+}
+GLOBE_MISSING = [name for module, name in GLOBE_REQUIREMENTS.items()
+                 if importlib.util.find_spec(module) is None]
+GLOBE_AVAILABLE = not GLOBE_MISSING
+if not GLOBE_AVAILABLE:
+    print(f"⚠️  3D globe unavailable, missing: {', '.join(GLOBE_MISSING)}")
 
-# Import the quantum space jump transition
-try:
-    # We'll define the transition code directly in this file
-    pass
-except ImportError:
-    pass
+import render_worker
+import telemetry
+import tracing
+import web_assets
+from events import EventBus, WebviewDispatcher, format_sse, HEARTBEAT_INTERVAL, MIN_PUSH_INTERVAL
+from jobs import JobManager
+from progress_store import CONTINENTS, ProgressStore
+from transition_timing import TRANSITION_DURATION
+
+
+def run_quantum_transition(*args, **kwargs):
+    """Run the quantum space jump (see quantum_transition.py), importing it on first use"""
+    from quantum_transition import run_quantum_transition as run
+    return run(*args, **kwargs)
 
 # =============================================================================
-# QUANTUM SPACE JUMP TRANSITION (COPIED FROM PREVIOUS CODE)
+# MAIN APPLICATION CLASS
 # =============================================================================
-import pygame
-import math
-import random
 
-# Initialize pygame (we'll do this when needed)
-pygame_initialized = False
+# Seconds to wait for the page's readiness handshake before injecting anyway
+PAGE_READY_TIMEOUT = 5.0
 
-# Enhanced Star class for light-speed travel
-class LightSpeedStar:
-    def __init__(self, screen_width, screen_height):
-        self.x = random.uniform(0, screen_width)
-        self.y = random.uniform(0, screen_height)
-        self.z = random.uniform(1, 1000)  # Far depth for 3D effect
-        self.original_z = self.z
-        self.speed = 0
-        self.trail_length = 0
-        self.brightness = random.uniform(0.3, 1.0)
-        self.color_variant = random.choice([
-            (255, 255, 255),
-            (200, 220, 255),
-            (255, 240, 200),
-            (220, 255, 220),
-            (255, 200, 255)
-        ])
-        
-    def update(self, warp_speed=1.0, progress=0.0, screen_width=1200, screen_height=800):
-        # Calculate speed based on warp factor - exponential increase
-        base_speed = max(1, warp_speed ** 2.5)
-        self.speed = base_speed * (1 + progress * 15)
-        
-        # Move star toward camera (z-axis movement)
-        self.z -= self.speed
-        
-        # Trail length increases with speed
-        self.trail_length = min(200, self.speed * 2)
-        
-        # Reset star when it passes the camera
-        if self.z <= 1:
-            self.z = random.uniform(800, 1000)
-            self.x = random.uniform(0, screen_width)
-            self.y = random.uniform(0, screen_height)
-    
-    def draw(self, surface, warp_speed=1.0, screen_width=1200, screen_height=800):
-        current_width, current_height = surface.get_size()
-        
-        # Calculate screen position with perspective projection
-        if self.z <= 0:
-            return
-            
-        # Perspective calculation
-        scale = 500.0 / self.z
-        screen_x = int(current_width/2 + (self.x - screen_width/2) * scale)
-        screen_y = int(current_height/2 + (self.y - screen_height/2) * scale)
-        
-        # Skip if off screen (with margin for trails)
-        if (screen_x < -100 or screen_x > current_width + 100 or 
-            screen_y < -100 or screen_y > current_height + 100):
-            return
-            
-        # Calculate star size based on distance
-        size = max(1, int(scale * 2))
-        
-        # Calculate brightness based on distance and base brightness
-        distance_brightness = min(1.0, (1000 - self.z) / 1000)
-        final_brightness = self.brightness * distance_brightness
-        
-        # Color with brightness
-        color = (
-            int(self.color_variant[0] * final_brightness),
-            int(self.color_variant[1] * final_brightness),
-            int(self.color_variant[2] * final_brightness)
-        )
-        
-        # Draw light-speed trail
-        if self.trail_length > 5 and warp_speed > 2:
-            trail_points = []
-            num_trail_points = max(5, int(self.trail_length / 10))
-            
-            for i in range(num_trail_points):
-                # Calculate trail position
-                trail_z = self.z + (i * self.speed / num_trail_points)
-                if trail_z > 0:
-                    trail_scale = 500.0 / trail_z
-                    trail_x = int(current_width/2 + (self.x - screen_width/2) * trail_scale)
-                    trail_y = int(current_height/2 + (self.y - screen_height/2) * trail_scale)
-                    trail_points.append((trail_x, trail_y))
-            
-            # Draw trail as connected lines with fading alpha
-            if len(trail_points) > 1:
-                for i in range(len(trail_points) - 1):
-                    alpha = int(255 * final_brightness * (1 - i / len(trail_points)) * 0.7)
-                    trail_color = (
-                        min(255, color[0] + 50),
-                        min(255, color[1] + 30),
-                        min(255, color[2])
-                    )
-                    
-                    if alpha > 10:
-                        try:
-                            pygame.draw.line(surface, trail_color, 
-                                           trail_points[i], trail_points[i + 1], 
-                                           max(1, size))
-                        except:
-                            pass
-        
-        # Draw main star with glow effect
-        if size >= 2:
-            # Outer glow
-            for glow_size in range(size + 4, size, -1):
-                glow_alpha = max(10, int(final_brightness * 100 * (size + 4 - glow_size) / 4))
-                glow_color = (
-                    min(255, color[0] + glow_alpha // 3),
-                    min(255, color[1] + glow_alpha // 4),
-                    min(255, color[2] + glow_alpha // 5)
-                )
-                try:
-                    pygame.draw.circle(surface, glow_color, (screen_x, screen_y), glow_size)
-                except:
-                    pass
-        
-        # Main star
-        try:
-            pygame.draw.circle(surface, color, (screen_x, screen_y), size)
-            
-            # Bright center for larger stars
-            if size > 2:
-                center_color = (
-                    min(255, color[0] + 100),
-                    min(255, color[1] + 100),
-                    min(255, color[2] + 100)
-                )
-                pygame.draw.circle(surface, center_color, (screen_x, screen_y), max(1, size // 2))
-        except:
-            pass
 
-# Enhanced Particle class for quantum effects
-class QuantumParticle:
-    def __init__(self, x, y, screen_width, screen_height, particle_type="energy"):
-        self.x = x
-        self.y = y
-        self.screen_width = screen_width
-        self.screen_height = screen_height
-        self.particle_type = particle_type
-        
-        if particle_type == "energy":
-            self.speed = random.uniform(3, 12)
-            angle = random.uniform(0, 2 * math.pi)
-            self.dx = math.cos(angle) * self.speed
-            self.dy = math.sin(angle) * self.speed
-            self.life = random.uniform(60, 120)
-            self.max_life = self.life
-            self.color = random.choice([(0, 255, 255), (0, 100, 255), (128, 0, 128), (255, 255, 255)])
-        elif particle_type == "quantum":
-            self.speed = random.uniform(8, 25)
-            angle = random.uniform(0, 2 * math.pi)
-            self.dx = math.cos(angle) * self.speed
-            self.dy = math.sin(angle) * self.speed
-            self.life = random.uniform(40, 90)
-            self.max_life = self.life
-            self.color = random.choice([(255, 215, 0), (255, 165, 0), (255, 255, 255), (0, 255, 255)])
-        else:
-            self.speed = random.uniform(1, 8)
-            angle = random.uniform(0, 2 * math.pi)
-            self.dx = math.cos(angle) * self.speed
-            self.dy = math.sin(angle) * self.speed
-            self.life = random.uniform(30, 80)
-            self.max_life = self.life
-            self.color = (255, 255, 255)
-        
-        self.decay = random.uniform(0.5, 1.5)
-        self.size = random.uniform(1, 3)
-        self.pulse_phase = random.uniform(0, math.pi * 2)
-        
-    def update(self):
-        self.x += self.dx
-        self.y += self.dy
-        self.life -= self.decay
-        
-        # Gentle acceleration toward center
-        center_x = self.screen_width / 2
-        center_y = self.screen_height / 2
-        
-        to_center_x = center_x - self.x
-        to_center_y = center_y - self.y
-        distance = math.sqrt(to_center_x**2 + to_center_y**2)
-        
-        if distance > 0:
-            force = 0.1
-            self.dx += (to_center_x / distance) * force
-            self.dy += (to_center_y / distance) * force
-        
-        # Slight friction
-        self.dx *= 0.998
-        self.dy *= 0.998
-        
-        # Update pulse
-        self.pulse_phase += 0.1
-        
-    def draw(self, surface):
-        if self.life > 0:
-            life_ratio = self.life / self.max_life
-            pulse = math.sin(self.pulse_phase) * 0.3 + 0.7
-            alpha = int(255 * life_ratio * pulse)
-            size = int(self.size * life_ratio * pulse)
-            
-            # Color with life fade
-            color = (
-                min(255, int(self.color[0] * life_ratio)),
-                min(255, int(self.color[1] * life_ratio)),
-                min(255, int(self.color[2] * life_ratio))
-            )
-            
-            if size > 0 and alpha > 10:
-                try:
-                    # Glow effect
-                    if size > 1:
-                        glow_color = (color[0] // 3, color[1] // 3, color[2] // 3)
-                        pygame.draw.circle(surface, glow_color, 
-                                         (int(self.x), int(self.y)), size + 2)
-                    
-                    pygame.draw.circle(surface, color, (int(self.x), int(self.y)), size)
-                except:
-                    pass
+class StartupTimeline:
+    """Wall-clock marks from process start until the launcher page is interactive"""
+    
+    def __init__(self, start=PROCESS_START):
+        self.marks = [('process start', start)]
+    
+    def mark(self, name, at=None):
+        self.marks.append((name, time.time() if at is None else at))
+        if at is None:
+            tracing.instant(name)
+    
+    def report(self, page_marks=(), backend=None):
+        """Print the timeline including this page load's marks; returns it as (name, ms) pairs"""
+        start = self.marks[0][1]
+        marks = sorted(self.marks + list(page_marks), key=lambda mark: mark[1])
+        timeline = [(name, round((at - start) * 1000.0, 1)) for name, at in marks]
+        print(f"🚦 Launcher interactive after {timeline[-1][1]:.0f} ms"
+              + (f" ({backend} backend)" if backend else "") + ":")
+        previous = 0.0
+        for name, ms in timeline:
+            print(f"   {name:<22} {ms:8.1f} ms  (+{ms - previous:.1f})")
+            previous = ms
+        tracing.complete('launcher start-up', time.time() - start, backend=backend)
+        telemetry.record('startup', interactive_ms=timeline[-1][1], backend=backend,
+                         **{name.replace(' ', '_') + '_ms': ms for name, ms in timeline[1:-1]})
+        return timeline
 
-def create_warp_tunnel_effect(surface, progress, screen_width, screen_height):
-    """Create tunnel effect for light speed travel"""
-    current_width, current_height = surface.get_size()
-    center_x, center_y = current_width // 2, current_height // 2
-    
-    # Create multiple concentric circles moving outward
-    for ring in range(8):
-        ring_progress = (progress + ring * 0.1) % 1.0
-        radius = int(ring_progress * max(current_width, current_height) * 1.5)
-        
-        if radius > 10:
-            alpha = int(100 * (1 - ring_progress) * progress)
-            color = (alpha // 2, alpha // 3, alpha)
-            
-            if alpha > 5:
-                try:
-                    pygame.draw.circle(surface, color, (center_x, center_y), radius, 3)
-                except:
-                    pass
 
-def create_hyperspace_grid(surface, progress, time_factor, screen_width, screen_height):
-    """Create moving grid lines for hyperspace effect"""
-    current_width, current_height = surface.get_size()
+# Local HTTP backend for the browser fallback (script.js's web_api mode)
+HTTP_HOST = '127.0.0.1'
+HTTP_PORT = int(os.environ.get('CQ_HTTP_PORT', '8765'))
+HTTP_KEEP_ALIVE_TIMEOUT = 15  # seconds an idle keep-alive connection stays open
+HTTP_MAX_BODY = 1024 * 1024
+
+HTTP_REASONS = {
+    200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    413: 'Payload Too Large', 500: 'Internal Server Error',
+}
+
+STATIC_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.json': 'application/json',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+    '.mp3': 'audio/mpeg',
+}
+
+
+class LauncherHTTPServer:
+    """asyncio HTTP/1.1 server for the landing page and its /api routes
     
-    # Vertical lines moving horizontally
-    for i in range(-5, 15):
-        x_offset = (time_factor * 200 + i * 100) % (current_width + 200) - 100
-        alpha = int(50 * progress * math.sin(time_factor + i) * 0.5 + 25)
-        
-        if alpha > 5:
-            color = (alpha, alpha // 2, alpha + 20)
-            try:
-                pygame.draw.line(surface, color, 
-                               (x_offset, 0), (x_offset, current_height), 1)
-            except:
-                pass
+    Serves the same WebAPI object as the pywebview bridge, so both launchers
+    share one ContinentalQuestApp state. Connections are kept alive, and bridge
+    calls that may block (launching, starting a game, batches) run on the
+    default executor so one slow request never stalls the other clients.
     
-    # Horizontal lines moving vertically
-    for i in range(-3, 10):
-        y_offset = (time_factor * 150 + i * 120) % (current_height + 240) - 120
-        alpha = int(40 * progress * math.cos(time_factor + i) * 0.5 + 20)
-        
-        if alpha > 5:
-            color = (alpha, alpha // 3, alpha + 15)
+    The landing page comes from the web_assets build, held in memory: hashed
+    files are cached forever and the page itself is revalidated by ETag.
+    """
+    
+    def __init__(self, app, api, host=HTTP_HOST, port=HTTP_PORT):
+        self.app = app
+        self.api = api
+        self.host = host
+        self.port = port
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self.ready = threading.Event()
+        self.error = None
+        self.assets = None
+    
+    @property
+    def url(self):
+        return f'http://{self.host}:{self.port}/'
+    
+    def start(self):
+        """Serve on a background thread; returns once the socket is listening"""
+        try:
+            self.assets = web_assets.AssetStore.load(self.app.app_dir)
+        except Exception as e:
+            print(f"⚠️ Could not build landing assets, serving the source files: {e}")
+        self.thread = threading.Thread(target=self._run, name='cq-http', daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        if self.error is not None:
+            raise self.error
+        print(f"🌐 Launcher HTTP server listening on {self.url}")
+        return self
+    
+    def stop(self):
+        if self.loop is not None and self.server is not None:
+            self.loop.call_soon_threadsafe(self.server.close)
+    
+    def _run(self):
+        try:
+            asyncio.run(self._serve())
+        except Exception as e:
+            if not self.ready.is_set():
+                self.error = e
+                self.ready.set()
+            else:
+                print(f"❌ Launcher HTTP server stopped: {e}")
+    
+    async def _serve(self):
+        self.loop = asyncio.get_running_loop()
+        try:
+            self.server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        except OSError as e:
+            if self.port == 0:
+                raise
+            # Port taken (another launcher?): any free port will do
+            print(f"⚠️ Port {self.port} unavailable ({e}), using a free port")
+            self.server = await asyncio.start_server(self._handle_connection, self.host, 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        async with self.server:
             try:
-                pygame.draw.line(surface, color, 
-                               (0, y_offset), (current_width, y_offset), 1)
-            except:
+                await self.server.serve_forever()
+            except asyncio.CancelledError:
                 pass
-
-def create_screen_flash(surface, intensity, screen_width, screen_height):
-    """Create screen flash effect"""
-    if intensity > 0:
-        current_width, current_height = surface.get_size()
-        flash_surface = pygame.Surface((current_width, current_height))
-        
-        # White flash with blue tint
-        flash_color = (
-            min(255, int(intensity * 255)),
-            min(255, int(intensity * 255)),
-            min(255, int(intensity * 255 * 1.2))
-        )
+    
+    async def _handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it or goes idle"""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), HTTP_KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                        asyncio.LimitOverrunError, ConnectionError):
+                    return
+                
+                request_line, *header_lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = request_line.split(' ', 2)
+                except ValueError:
+                    await self._respond(writer, 400, {'status': 'error', 'message': 'Bad request line'}, False)
+                    return
+                headers = {}
+                for line in header_lines:
+                    name, sep, value = line.partition(':')
+                    if sep:
+                        headers[name.strip().lower()] = value.strip()
+                
+                connection = headers.get('connection', '').lower()
+                keep_alive = (connection != 'close' if version == 'HTTP/1.1'
+                              else connection == 'keep-alive')
+                
+                try:
+                    length = int(headers.get('content-length') or 0)
+                except ValueError:
+                    length = -1
+                if length < 0 or length > HTTP_MAX_BODY:
+                    await self._respond(writer, 413, {'status': 'error', 'message': 'Bad request body'}, False)
+                    return
+                try:
+                    body = await reader.readexactly(length) if length else b''
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                
+                if method == 'GET' and urllib.parse.urlsplit(target).path == '/api/events':
+                    # The connection becomes the page's event stream until it goes away
+                    await self._stream_events(writer)
+                    return
+                
+                try:
+                    status, payload, response_headers = await self._dispatch(method, target, headers, body)
+                except Exception as e:
+                    print(f"❌ HTTP {method} {target} failed: {e}")
+                    status, payload, response_headers = 500, {'status': 'error', 'message': str(e)}, None
+                
+                await self._respond(writer, status, payload, keep_alive, response_headers,
+                                    head_only=(method == 'HEAD'))
+                if not keep_alive:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def _stream_events(self, writer):
+        """Server-Sent Events: push launcher state changes as they happen"""
+        wake = asyncio.Event()
+        loop = self.loop
         
-        flash_surface.fill(flash_color)
-        flash_surface.set_alpha(int(intensity * 200))
-        surface.blit(flash_surface, (0, 0))
-
-def run_quantum_transition(continent_name):
-    """Run the quantum space jump transition animation"""
-    global pygame_initialized
-    
-    # Initialize pygame if not already done
-    if not pygame_initialized:
-        pygame.init()
-        pygame.mixer.init()
-        pygame_initialized = True
-    
-    # Don't restart music here - it should already be playing from the launcher
-    # Just check if music is already playing, if not, start it
-    if not pygame.mixer.music.get_busy():
-        music_path = Path("final.mp3")
-        if music_path.exists():
+        def on_event():
             try:
-                pygame.mixer.music.load(str(music_path))
-                pygame.mixer.music.play(-1)  # -1 means loop indefinitely
-                pygame.mixer.music.set_volume(0.7)  # Set volume to 70%
-                print("🎵 Background music started in transition (final.mp3)")
-            except Exception as e:
-                print(f"⚠️ Could not load background music: {e}")
+                loop.call_soon_threadsafe(wake.set)
+            except RuntimeError:
+                pass  # loop already closed
+        
+        subscription = self.app.events.subscribe(wake=on_event)
+        writer.write(b'HTTP/1.1 200 OK\r\n'
+                     b'Content-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-cache\r\n'
+                     b'Connection: keep-alive\r\n'
+                     b'\r\n'
+                     b'retry: 2000\n\n')
+        last_push = 0.0
+        try:
+            await writer.drain()
+            while True:
+                try:
+                    await asyncio.wait_for(wake.wait(), HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    writer.write(b': keep-alive\n\n')
+                    await writer.drain()
+                    continue
+                # Let a burst settle into one write
+                delay = MIN_PUSH_INTERVAL - (loop.time() - last_push)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                wake.clear()
+                events = subscription.drain()
+                if events:
+                    writer.write(b''.join(format_sse(event) for event in events))
+                    await writer.drain()
+                    last_push = loop.time()
+        except ConnectionError:
+            pass
+        finally:
+            subscription.close()
+    
+    async def _respond(self, writer, status, payload, keep_alive, headers=None, head_only=False):
+        """Write one response; payload is bytes, or anything else to send as JSON"""
+        response_headers = {'Content-Type': 'application/json', 'Cache-Control': 'no-cache'}
+        response_headers.update(headers or {})
+        if isinstance(payload, bytes):
+            body = payload
         else:
-            print("⚠️ final.mp3 not found in current directory")
-    else:
-        print("🎵 Music already playing, continuing...")
-    
-    # Get screen dimensions
-    info = pygame.display.Info()
-    SCREEN_WIDTH = info.current_w
-    SCREEN_HEIGHT = info.current_h
-    
-    # Set up display (start windowed for controls)
-    screen = pygame.display.set_mode((1200, 800), pygame.RESIZABLE)
-    pygame.display.set_caption(f"Quantum Jump to {continent_name}")
-    
-    # Colors
-    BLACK = (0, 0, 0)
-    
-    # Create light-speed star field
-    stars = [LightSpeedStar(SCREEN_WIDTH, SCREEN_HEIGHT) for _ in range(400)]
-    particles = []
-    
-    # Animation variables
-    start_time = pygame.time.get_ticks()
-    total_duration = 8000  # 8 seconds total
-    
-    # Phase timings (in milliseconds)
-    phase_timings = {
-        "acceleration": 2000,      # 0-2s: Gradual acceleration
-        "lightspeed": 4000,        # 2-6s: Full light speed travel
-        "flash": 1000,             # 6-7s: Intense flash
-        "arrival": 1000            # 7-8s: Arrival and completion
-    }
-    
-    warp_speed = 1.0
-    flash_intensity = 0.0
-    time_factor = 0
-    
-    clock = pygame.time.Clock()
-    running = True
-    
-    while running:
-        current_time = pygame.time.get_ticks()
-        elapsed = current_time - start_time
-        dt = clock.tick(60) / 1000.0  # Delta time in seconds
-        
-        time_factor += dt
-        
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                elif event.key == pygame.K_SPACE:
-                    # Skip to flash phase
-                    start_time = current_time - (phase_timings["acceleration"] + phase_timings["lightspeed"])
-        
-        # Calculate current phase and progress
-        if elapsed < phase_timings["acceleration"]:
-            # Phase 1: Gradual acceleration
-            phase = "acceleration"
-            progress = elapsed / phase_timings["acceleration"]
-            warp_speed = 1 + progress * 4  # Speed up to 5x
-            
-        elif elapsed < phase_timings["acceleration"] + phase_timings["lightspeed"]:
-            # Phase 2: Light speed travel
-            phase = "lightspeed"
-            phase_elapsed = elapsed - phase_timings["acceleration"]
-            progress = phase_elapsed / phase_timings["lightspeed"]
-            warp_speed = 5 + progress * 15  # Speed up to 20x
-            
-        elif elapsed < phase_timings["acceleration"] + phase_timings["lightspeed"] + phase_timings["flash"]:
-            # Phase 3: Flash
-            phase = "flash"
-            phase_elapsed = elapsed - phase_timings["acceleration"] - phase_timings["lightspeed"]
-            progress = phase_elapsed / phase_timings["flash"]
-            warp_speed = 20 + progress * 30  # Max speed
-            flash_intensity = math.sin(progress * math.pi) * 0.8
-            
+            body = json.dumps(payload).encode('utf-8')
+        if status == 304:
+            # Not Modified carries no body (nor a length for one)
+            body = b''
+            response_headers.pop('Content-Type', None)
         else:
-            # Phase 4: Arrival
-            phase = "arrival"
-            phase_elapsed = elapsed - phase_timings["acceleration"] - phase_timings["lightspeed"] - phase_timings["flash"]
-            progress = phase_elapsed / phase_timings["arrival"]
-            warp_speed = max(1, 50 - progress * 49)  # Slow down
-            flash_intensity = max(0, 0.8 - progress * 0.8)
-            
-            # Exit after arrival phase
-            if elapsed > total_duration:
-                running = False
-        
-        # Get current screen dimensions
-        current_width, current_height = screen.get_size()
-        
-        # Fill screen with deep space
-        screen.fill(BLACK)
-        
-        # Add subtle quantum particles during acceleration and lightspeed
-        if phase in ["acceleration", "lightspeed"] and random.random() < 0.1:
-            particles.append(QuantumParticle(
-                random.randint(0, current_width),
-                random.randint(0, current_height),
-                SCREEN_WIDTH, SCREEN_HEIGHT,
-                "quantum" if random.random() < 0.7 else "energy"
-            ))
-        
-        # Update and draw particles
-        particles = [p for p in particles if p.life > 0]
-        for particle in particles:
-            particle.update()
-            particle.draw(screen)
-        
-        # Create hyperspace grid effect during lightspeed
-        if phase == "lightspeed":
-            create_hyperspace_grid(screen, min(1.0, warp_speed / 10), time_factor, SCREEN_WIDTH, SCREEN_HEIGHT)
-        
-        # Create warp tunnel during flash phase
-        if phase == "flash":
-            create_warp_tunnel_effect(screen, progress, SCREEN_WIDTH, SCREEN_HEIGHT)
-        
-        # Update and draw stars
-        for star in stars:
-            star.update(warp_speed, progress if phase == "lightspeed" else 0, SCREEN_WIDTH, SCREEN_HEIGHT)
-            star.draw(screen, warp_speed, SCREEN_WIDTH, SCREEN_HEIGHT)
-        
-        # Screen flash effect
-        if flash_intensity > 0:
-            create_screen_flash(screen, flash_intensity, SCREEN_WIDTH, SCREEN_HEIGHT)
-        
-        
-        
-        pygame.display.flip()
+            response_headers['Content-Length'] = str(len(body))
+        response_headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        head = f'HTTP/1.1 {status} {HTTP_REASONS.get(status, "")}\r\n'
+        head += ''.join(f'{name}: {value}\r\n' for name, value in response_headers.items())
+        head = (head + '\r\n').encode('latin-1')
+        writer.write(head if head_only else head + body)
+        await writer.drain()
+    
+    async def _dispatch(self, method, target, headers, body):
+        """Route one request; returns (status, payload, response headers)"""
+        path = urllib.parse.unquote(urllib.parse.urlsplit(target).path)
+        if path.startswith('/api/'):
+            try:
+                data = json.loads(body) if body else {}
+            except ValueError:
+                return 400, {'status': 'error', 'message': 'Invalid JSON body'}, None
+            parts = path[len('/api/'):].strip('/').split('/')
+            # Routes read fields from an object; only batch also takes a bare list of calls
+            if not isinstance(data, dict) and not (parts[0] == 'batch' and isinstance(data, list)):
+                return 400, {'status': 'error', 'message': 'JSON body must be an object'}, None
+            status, payload = await self._api(method, parts, data)
+            return status, payload, None
+        if method not in ('GET', 'HEAD'):
+            return 405, {'status': 'error', 'message': f'{method} not allowed'}, None
+        if self.assets is not None:
+            found = self.assets.lookup(path, headers.get('accept-encoding'), headers.get('if-none-match'))
+            if found is not None:
+                return found
+        return await self._static(path)
+    
+    async def _api(self, method, parts, data):
+        """The web_api routes used by script.js's PythonInterface"""
+        api = self.api
+        route, arg = parts[0], ('/'.join(parts[1:]) or None)
+        
+        if route == 'test' and method == 'GET':
+            return 200, api.test_connection()
+        if route == 'progress' and method == 'GET':
+            return 200, api.get_progress(arg)
+        if route == 'progress' and method == 'POST' and arg:
+            return 200, api.update_progress(arg, data.get('progress', 0))
+        if route == 'difficulty' and method == 'POST':
+            return 200, api.set_difficulty(data.get('difficulty', 'medium'))
+        if route == 'ready' and method == 'POST':
+            return 200, api.page_ready(data)
+        if route == 'page-load' and method == 'POST':
+            return 200, api.report_page_load(data)
+        if route == 'jobs' and method == 'GET':
+            if arg:
+                return 200, api.get_job(arg)
+            return 200, api.list_jobs()
+        
+        # These may block for a moment (worker start-up, music), so keep them off the loop
+        if route == 'launch' and method in ('GET', 'POST') and arg:
+            return 200, await self.loop.run_in_executor(None, api.launch_continent, arg)
+        if route == 'start-game' and method == 'POST':
+            return 200, await self.loop.run_in_executor(None, api.start_game, data or None)
+        if route == 'batch' and method == 'POST':
+            calls = data.get('calls', []) if isinstance(data, dict) else data
+            if not isinstance(calls, list):
+                return 400, {'status': 'error', 'message': 'batch expects a list of calls'}
+            return 200, await self.loop.run_in_executor(None, api.batch, calls)
+        
+        return 404, {'status': 'error', 'message': f'Unknown API route /api/{"/".join(parts)}'}
     
-    # Don't stop the music when quantum transition ends - it should continue
-    # pygame.mixer.music.stop()  # Commented out so music continues
-    pygame.quit()
-    return True
+    async def _static(self, path):
+        """Landing page files from the app directory"""
+        if path in ('', '/'):
+            path = '/' + self.app.launcher_path.name
+        root = self.app.app_dir.resolve()
+        file_path = (root / path.lstrip('/')).resolve()
+        content_type = STATIC_TYPES.get(file_path.suffix.lower())
+        if content_type is None or root not in file_path.parents or not file_path.is_file():
+            return 404, {'status': 'error', 'message': f'Not found: {path}'}, None
+        body = await self.loop.run_in_executor(None, file_path.read_bytes)
+        return 200, body, {'Content-Type': content_type}
 
-# =============================================================================
-# MAIN APPLICATION CLASS
-# =============================================================================
 
 class ContinentalQuestApp:
     """Main application class that manages both the launcher and 3D globe"""
@@ -503,56 +396,83 @@ class ContinentalQuestApp:
         self.web_window = None
         self.game_process = None
         self.music_started = False
+        # Held while music_started is checked and changed (bridge, job and music threads)
+        self.music_lock = threading.Lock()
+        
+        # The transition and globe run in a separate render worker process
+        self.render_worker = None
+        self.transition_done = threading.Event()
+        
+        # Long bridge calls run as background jobs and report back to the page
+        self.jobs = JobManager(notify=self.push_job_update)
+        
+        # State changes pushed to the page (SSE in the browser, evaluate_js in webview)
+        self.events = EventBus()
+        self.event_dispatcher = None
+        
+        # Player progress per profile (CQ_PROFILE) and continent, shared by both bridges
+        self.progress = ProgressStore()
+        
+        # Serves the landing page and web_api routes in browser fallback mode
+        self.http_server = None
+        self.page_loads = 0
         
         # Paths
         self.app_dir = Path(__file__).parent
         self.launcher_path = self.app_dir / 'continental_quest_landing.html'
         
+        # Readiness handshake and startup instrumentation
+        tracing.set_process_name('launcher')
+        self.startup = StartupTimeline()
+        self.page_ready = threading.Event()
+        self.closed = threading.Event()
+        
         print("🌍 Continental Quest - Starting Application")
         print(f"📁 App Directory: {self.app_dir}")
-        
-    def start_background_music(self):
-        """Start the background music if not already playing"""
-        if not self.music_started:
+        self.startup.mark('app ready')
+    
+    @property
+    def audio(self):
+        """The process's AudioManager (imports pygame on first use)"""
+        from audio import get_audio
+        return get_audio()
+        
+    def start_background_music(self, background=False):
+        """Start the background music if not already playing
+        
+        background=True loads pygame and decodes the track on a thread, so the
+        launcher window doesn't wait for them.
+        """
+        if background:
+            threading.Thread(target=self.start_background_music, name='launcher-music', daemon=True).start()
+            return
+        with self.music_lock:
+            if self.music_started:
+                print("🎵 Background music already started, continuing...")
+                return
             try:
-                # Initialize pygame mixer if not already done
-                import pygame
-                if not pygame.get_init():
-                    pygame.init()
-                if not pygame.mixer.get_init():
-                    pygame.mixer.init()
-                
                 # Check if music is already playing (from another part of the app)
-                if pygame.mixer.music.get_busy():
+                if self.audio.is_playing('launcher'):
                     print("🎵 Music already playing from another source")
                     self.music_started = True
                     return
                 
-                music_path = Path("final.mp3")
-                if music_path.exists():
-                    pygame.mixer.music.load(str(music_path))
-                    pygame.mixer.music.play(-1)  # Loop indefinitely
-                    pygame.mixer.music.set_volume(0.7)
+                if self.audio.play('launcher'):
                     self.music_started = True
                     print("🎵 Background music started (final.mp3)")
-                else:
-                    print("⚠️ final.mp3 not found in current directory")
             except Exception as e:
                 print(f"⚠️ Could not start background music: {e}")
-        else:
-            print("🎵 Background music already started, continuing...")
     
     def stop_background_music(self):
         """Stop the background music"""
-        if self.music_started:
-            try:
-                import pygame
-                if pygame.mixer.get_init():
-                    pygame.mixer.music.stop()
+        with self.music_lock:
+            if self.music_started:
+                try:
+                    self.audio.stop('launcher')
                     self.music_started = False
                     print("🎵 Background music stopped")
-            except Exception as e:
-                print(f"⚠️ Could not stop background music: {e}")
+                except Exception as e:
+                    print(f"⚠️ Could not stop background music: {e}")
         
     def setup_api_bridge(self):
         """Setup JavaScript-Python communication bridge"""
@@ -562,15 +482,24 @@ class ContinentalQuestApp:
                 self.app = app_instance
             
             def launch_continent(self, continent_name):
-                """Called when user selects a continent from the web interface"""
+                """Called when user selects a continent from the web interface
+                
+                Returns a job id at once; progress arrives as 'cq:job' events
+                (or poll get_job).
+                """
                 print(f"🌍 Web: Launching {continent_name}")
                 self.app.current_continent = continent_name
                 
                 # Start the 3D globe with the selected continent
-                return self.app.start_3d_globe(continent_name)
+                job_id = self.app.jobs.submit('launch_continent', lambda job: self.app.start_3d_globe(continent_name))
+                return {'status': 'accepted', 'job_id': job_id, 'continent': continent_name}
             
             def start_game(self, options=None):
-                """Start the main 3D globe game"""
+                """Start the main 3D globe game
+                
+                The transition takes several seconds, so this returns a job id at
+                once; progress arrives as 'cq:job' events (or poll get_job).
+                """
                 print("\n🚀 [DEBUG] start_game() called from JavaScript!")
                 print(f"📊 [DEBUG] Options received: {options}")
                 
@@ -586,43 +515,55 @@ class ContinentalQuestApp:
                 
                 print(f"🎮 Starting 3D Globe: {continent} ({difficulty})")
                 
-                # Start background music only if not already playing
-                if not self.app.music_started:
-                    self.app.start_background_music()
-                else:
-                    print("🎵 Music already playing, continuing without restart")
-                
-                # Run the quantum transition first
-                print("🚀 Starting quantum space jump transition...")
-                run_quantum_transition(continent)
+                # Start background music only if not already playing; decoding it
+                # happens on the music thread so this call still returns at once
+                self.app.start_background_music(background=True)
                 
-                # Then start the 3D globe
-                result = self.app.start_3d_globe(continent)
-                print(f"🔄 [DEBUG] Globe start result: {result}")
-                return result
+                # Run the quantum transition first, then the 3D globe in the same window
+                job_id = self.app.jobs.submit('start_game', self.app.run_start_game, continent)
+                print(f"🔄 [DEBUG] Globe start job: {job_id}")
+                return {'status': 'accepted', 'job_id': job_id, 'continent': continent}
+            
+            def get_job(self, job_id):
+                """Poll a background job started by another bridge call"""
+                job = self.app.jobs.get(job_id)
+                if job is None:
+                    return {'status': 'error', 'message': f'Unknown job {job_id}'}
+                return job
+            
+            def list_jobs(self, active_only=False):
+                """All recent background jobs"""
+                return self.app.jobs.list(active_only)
             
             def set_difficulty(self, difficulty):
                 """Set game difficulty level"""
                 self.app.current_difficulty = difficulty
+                # Only a live worker gets it now; a restarted one is sent current_difficulty
+                worker = self.app.render_worker
+                if worker is not None and worker.is_alive():
+                    try:
+                        worker.send(render_worker.SET_DIFFICULTY, difficulty=difficulty)
+                    except (BrokenPipeError, OSError) as e:
+                        print(f"⚠️ Could not send difficulty to the render worker: {e}")
                 print(f"⚡ Difficulty set to: {difficulty}")
+                self.app.events.publish('difficulty', {'difficulty': difficulty})
                 return {'status': 'success', 'difficulty': difficulty}
             
             def get_progress(self, continent=None):
-                """Get player progress (mock data for now)"""
-                # You can integrate this with your actual game progress later
-                progress_data = {
-                    'north-america': 75,
-                    'south-america': 60,
-                    'europe': 85,
-                    'africa': 45,
-                    'asia': 55,
-                    'australia': 90,
-                    'antarctica': 25
-                }
-                
-                if continent:
-                    return progress_data.get(continent, 0)
-                return progress_data
+                """Get player progress: one continent's (0-100), or all of them as a dict"""
+                return self.app.progress.get_progress(continent)
+            
+            def update_progress(self, continent, progress):
+                """Record a continent's progress (0-100)"""
+                # Only known continents: anything else would add a row to the store for good
+                if continent not in CONTINENTS:
+                    return {'status': 'error', 'message': f'Unknown continent {continent!r}'}
+                try:
+                    progress = self.app.progress.update_progress(continent, progress)
+                except (TypeError, ValueError):
+                    return {'status': 'error', 'message': f'Invalid progress {progress!r}'}
+                self.app.events.publish('progress', self.app.progress.get_progress())
+                return {'status': 'success', 'continent': continent, 'progress': progress}
             
             def minimize_launcher(self):
                 """Minimize the launcher window"""
@@ -635,6 +576,21 @@ class ContinentalQuestApp:
                 self.app.shutdown()
                 return {'status': 'success'}
             
+            def page_ready(self, info=None):
+                """Readiness handshake: called by the page once window.pythonInterface exists"""
+                return self.app.on_page_ready(info or {})
+            
+            def report_page_load(self, metrics):
+                """Navigation timing sent by the page once it has loaded"""
+                self.app.page_loads += 1
+                kind = 'cold' if self.app.page_loads == 1 else 'warm'
+                print(f"⏱️ Launcher page load ({kind}): "
+                      f"DOM ready {metrics.get('dom_ready_ms', 0):.0f} ms, "
+                      f"load {metrics.get('load_ms', 0):.0f} ms, "
+                      f"{metrics.get('transfer_bytes', 0) / 1024:.1f} KB transferred, "
+                      f"{metrics.get('cached', 0)}/{metrics.get('resources', 0)} resources from cache")
+                return {'status': 'success', 'kind': kind}
+            
             def test_connection(self):
                 """Test if the Python API bridge is working"""
                 print("\n🔥 [TEST] Python API connection successful!")
@@ -643,16 +599,57 @@ class ContinentalQuestApp:
                     'message': 'Python API bridge is working!',
                     'timestamp': time.time()
                 }
+            
+            def batch(self, calls):
+                """Run several bridge calls in one round-trip
+                
+                calls is a list of {'method': name, 'args': [...]}; the result is a
+                list of {'ok': True, 'result': ...} or {'ok': False, 'error': ...}
+                in the same order.
+                """
+                if calls is None:
+                    calls = []
+                if not isinstance(calls, list):
+                    return {'status': 'error',
+                            'message': f'batch expects a list of calls, not {type(calls).__name__}'}
+                results = []
+                for call in calls:
+                    if not isinstance(call, dict):
+                        results.append({'ok': False, 'error': f'Call must be an object, not {type(call).__name__}'})
+                        continue
+                    method = call.get('method', '')
+                    args = call.get('args', [])
+                    if not isinstance(method, str):
+                        results.append({'ok': False, 'error': f'Method name must be a string, not {method!r}'})
+                        continue
+                    if not isinstance(args, list):
+                        results.append({'ok': False, 'error': f'Arguments of {method} must be a list'})
+                        continue
+                    handler = getattr(self, method, None)
+                    if method.startswith('_') or method == 'batch' or not callable(handler):
+                        results.append({'ok': False, 'error': f'Unknown method {method!r}'})
+                        continue
+                    try:
+                        results.append({'ok': True, 'result': handler(*args)})
+                    except Exception as e:
+                        print(f"❌ Batched call {method} failed: {e}")
+                        results.append({'ok': False, 'error': str(e)})
+                return results
         
         return WebAPI(self)
     
-    def start_3d_globe(self, continent='earth'):
-        """Start the 3D OpenGL globe"""
+    def start_3d_globe(self, continent='earth', with_transition=False):
+        """Start the 3D OpenGL globe
+        
+        The globe runs in the render worker (see render_worker.py), which keeps
+        it warm between launches. with_transition plays the quantum transition
+        first in the same window; wait_for_transition() blocks until it ends.
+        """
         try:
             if not GLOBE_AVAILABLE:
                 return {
                     'status': 'error',
-                    'message': 'globe.py not available'
+                    'message': f"3D globe not available (missing: {', '.join(GLOBE_MISSING)})"
                 }
             
             # Minimize the web launcher
@@ -662,29 +659,21 @@ class ContinentalQuestApp:
             print(f"🌍 Starting 3D Globe for: {continent}")
             
             # Ensure music is playing before starting globe
-            import pygame
-            if self.music_started and pygame.mixer.get_init():
-                if not pygame.mixer.music.get_busy():
-                    print("🎵 Music not playing, restarting before globe...")
-                    music_path = Path("final.mp3")
-                    if music_path.exists():
-                        try:
-                            pygame.mixer.music.load(str(music_path))
-                            pygame.mixer.music.play(-1)
-                            pygame.mixer.music.set_volume(0.7)
-                            print("🎵 Music restarted before globe")
-                        except Exception as e:
-                            print(f"⚠️ Could not restart music: {e}")
-                else:
-                    print("🎵 Music playing, continuing to globe...")
+            with self.music_lock:
+                if self.music_started:
+                    if not self.audio.is_playing('launcher'):
+                        print("🎵 Music not playing, restarting before globe...")
+                        self.audio.play('launcher')
+                    else:
+                        print("🎵 Music playing, continuing to globe...")
             
-            # Start the 3D globe in a separate thread to avoid blocking
-            globe_thread = threading.Thread(
-                target=self.run_globe_with_continent,
-                args=(continent,)
-            )
-            globe_thread.daemon = True
-            globe_thread.start()
+            worker = self.get_render_worker()
+            if with_transition:
+                self.transition_done.clear()
+            # Send the launcher's wall-clock time so the worker can time the relaunch
+            tracing.instant('launch requested', continent=continent, transition=with_transition)
+            worker.send(render_worker.LAUNCH, continent=continent, transition=with_transition,
+                        requested_at=time.time())
             
             return {
                 'status': 'success',
@@ -699,60 +688,75 @@ class ContinentalQuestApp:
                 'message': f'Failed to start 3D globe: {str(e)}'
             }
     
-    def run_globe_with_continent(self, continent):
-        """Run the 3D globe with continent-specific settings"""
-        try:
+    def get_render_worker(self):
+        """The render worker, started on first use"""
+        if self.render_worker is None or not self.render_worker.is_alive():
+            self.render_worker = render_worker.RenderWorker(on_event=self.on_render_event).start()
+            self.render_worker.send(render_worker.SET_DIFFICULTY, difficulty=self.current_difficulty)
+        return self.render_worker
+    
+    @tracing.traced('start game')
+    def run_start_game(self, job, continent):
+        """start_game job: transition, then globe"""
+        print("🚀 Starting quantum space jump transition...")
+        job.update(0.0, f"Warping to {continent}")
+        if not GLOBE_AVAILABLE:
+            run_quantum_transition(continent)
+        
+        result = self.start_3d_globe(continent, with_transition=True)
+        if result.get('status') == 'success':
+            self.wait_for_transition(job=job)
+        print(f"🔄 [DEBUG] Globe start result: {result}")
+        return result
+    
+    def wait_for_transition(self, timeout=None, job=None):
+        """Block until the worker reports that the transition has finished
+        
+        If a job is given, its progress follows the transition's clock.
+        """
+        if timeout is None:
+            timeout = TRANSITION_DURATION / 1000.0 + 15
+        start = time.time()
+        while not self.transition_done.wait(0.25):
+            elapsed = time.time() - start
+            if elapsed > timeout:
+                print("⚠️ Render worker didn't report the end of the transition")
+                return False
+            if job is not None:
+                job.update(min(0.95, elapsed * 1000.0 / TRANSITION_DURATION))
+        if job is not None:
+            job.update(1.0, "Arrived")
+        return True
+    
+    def push_job_update(self, job):
+        """Send a job change to the page as a 'cq:job' DOM event"""
+        # Only the newest state of each job matters to the page
+        self.events.publish('job', job, key=f"job:{job['job_id']}", retain=not job['finished_at'])
+    
+    def on_render_event(self, event, data):
+        """Status events from the render worker (called on a background thread)"""
+        tracing.instant(f'render worker: {event}', **data)
+        if event == render_worker.TRANSITION_DONE:
+            self.transition_done.set()
+        
+        elif event == render_worker.GLOBE_SHOWN:
             self.game_running = True
-            print(f"🎮 3D Globe running for: {continent}")
-            
-            # Ensure music continues playing by checking and restarting if needed
-            import pygame
-            if pygame.mixer.get_init() and not pygame.mixer.music.get_busy():
-                print("🎵 Music stopped, restarting for globe...")
-                music_path = Path("final.mp3")
-                if music_path.exists():
-                    try:
-                        pygame.mixer.music.load(str(music_path))
-                        pygame.mixer.music.play(-1)
-                        pygame.mixer.music.set_volume(0.7)
-                        print("🎵 Music restarted for globe")
-                    except Exception as e:
-                        print(f"⚠️ Could not restart music for globe: {e}")
-            else:
-                print("🎵 Music continuing into globe...")
-            
-            # Store original pygame mixer state before running globe
-            music_was_playing = False
-            music_position = 0
-            
-            try:
-                if pygame.mixer.get_init():
-                    music_was_playing = pygame.mixer.music.get_busy()
-                    # Save current music state
-                    if music_was_playing:
-                        print("🎵 Preserving music state for globe execution")
-            except:
-                pass
-            
-            # You can modify globe.py's main() function or create continent-specific versions
-            # For now, we'll run the existing globe
-            globe.main()
-            
-        except Exception as e:
-            print(f"❌ Globe error: {e}")
-        finally:
+            print(f"🎮 3D Globe running for: {data.get('continent')}")
+            self.events.publish('globe', {'state': 'shown', 'continent': data.get('continent')})
+            # The globe fades in its own space ambience in the worker process; fade
+            # ours out to match (in-process, the globe's own crossfade does this)
+            if self.render_worker is not None and self.render_worker.out_of_process:
+                self.audio.stop('launcher')
+        
+        elif event == render_worker.GLOBE_HIDDEN:
             self.game_running = False
+            self.events.publish('globe', {'state': 'hidden', 'continent': data.get('continent')})
             
-            # Restore music after globe closes if it was interrupted
+            # Fade the launcher music back in (still decoded, so no reload)
             try:
-                import pygame
-                if pygame.mixer.get_init() and not pygame.mixer.music.get_busy() and self.music_started:
-                    print("🎵 Restoring music after globe closed...")
-                    music_path = Path("final.mp3")
-                    if music_path.exists():
-                        pygame.mixer.music.load(str(music_path))
-                        pygame.mixer.music.play(-1)
-                        pygame.mixer.music.set_volume(0.7)
+                with self.music_lock:
+                    if self.music_started and not self.audio.is_playing('launcher'):
+                        self.audio.play('launcher')
                         print("🎵 Music restored after globe")
             except Exception as e:
                 print(f"⚠️ Could not restore music after globe: {e}")
@@ -760,6 +764,20 @@ class ContinentalQuestApp:
             # Restore the launcher window when globe closes
             if self.web_window:
                 self.web_window.show()
+        
+        elif event in (render_worker.GAME_STARTED, render_worker.GAME_FINISHED):
+            state = 'started' if event == render_worker.GAME_STARTED else 'finished'
+            print(f"🎮 {data.get('continent')} game {state}")
+            self.events.publish('game', dict(data, state=state), key=f"game:{data.get('continent')}")
+        
+        elif event == render_worker.ERROR:
+            print(f"❌ Globe error: {data.get('message')}")
+            self.events.publish('error', {'message': data.get('message')}, retain=False)
+        
+        elif event == render_worker.STOPPED:
+            self.game_running = False
+            self.transition_done.set()
+            self.events.publish('globe', {'state': 'stopped'})
     
     def create_launcher_files(self):
         """Copy the landing page files to the app directory if needed"""
@@ -783,14 +801,88 @@ class ContinentalQuestApp:
                 except Exception as e:
                     print(f"⚠️  Could not copy {filename}: {e}")
     
+    def inject_integration(self):
+        """Enhance the page's Python interface and start pushing events into it"""
+        if not self.web_window:
+            return
+        
+        # Inject a direct call to our API
+        script = f"""
+        // Override the Python interface to force webview mode
+        if (window.pythonInterface) {{
+            window.pythonInterface.backend_type = 'webview';
+            console.log('🔥 [FORCED] Backend type set to webview');
+            
+            // Override startGame to directly call the Python API
+            const originalStartGame = window.pythonInterface.startGame.bind(window.pythonInterface);
+            window.pythonInterface.startGame = async function(options) {{
+                console.log('🚀 [OVERRIDE] startGame called, triggering Python...');
+                try {{
+                    // Call the Python API directly
+                    const result = await pywebview.api.start_game(options);
+                    console.log('✅ [PYTHON] Success:', result);
+                    return result;
+                }} catch (error) {{
+                    console.error('❌ [PYTHON] Error:', error);
+                    // If that fails, try the original method
+                    return await originalStartGame(options);
+                }}
+            }};
+        }}
+        
+        // Also inject a global direct function
+        window.directStartGame = function() {{
+            console.log('🚀 [DIRECT] Starting game directly!');
+            return window.pythonInterface.startGame({{}});
+        }};
+        
+        console.log('🔥 [INJECTED] Python integration enhanced');
+        """
+        
+        try:
+            self.web_window.evaluate_js(script)
+            print("✅ [DEBUG] Successfully enhanced Python integration")
+        except Exception as e:
+            print(f"❌ [DEBUG] Failed to enhance integration: {e}")
+        
+        # From here on, state changes are pushed into the page (a reload gets a fresh dispatcher)
+        if self.event_dispatcher is not None:
+            self.event_dispatcher.stop()
+        self.event_dispatcher = WebviewDispatcher(self.events, self.web_window).start()
+    
+    def on_page_ready(self, info):
+        """Readiness handshake: the page's Python interface exists and the bridge answers"""
+        ready_at = time.time()
+        page_marks = []
+        origin = info.get('time_origin')
+        if origin:
+            # The page measures from its own navigation start (epoch ms)
+            page_marks.append(('page navigation', origin / 1000.0))
+            if info.get('interface_ms'):
+                page_marks.append(('pythonInterface created', (origin + info['interface_ms']) / 1000.0))
+            if info.get('dom_ready_ms'):
+                page_marks.append(('DOM ready', (origin + info['dom_ready_ms']) / 1000.0))
+        page_marks.append(('bridge ready', ready_at))
+        self.page_ready.set()
+        
+        def finish():
+            if self.web_window is not None:
+                self.inject_integration()
+                page_marks.append(('integration injected', time.time()))
+            self.startup.report(page_marks, backend=info.get('backend'))
+        
+        # Off the bridge thread, so the page's call returns right away
+        threading.Thread(target=finish, name='cq-page-ready', daemon=True).start()
+        return {'status': 'success'}
+    
     def run_webview_launcher(self):
         """Run the web launcher using pywebview"""
         if not WEBVIEW_AVAILABLE:
             print("❌ pywebview is not available")
             return False
         
-        # Start background music when launcher starts
-        self.start_background_music()
+        # Start background music when launcher starts (without holding up the window)
+        self.start_background_music(background=True)
         
         # Ensure launcher files are available
         self.create_launcher_files()
@@ -802,10 +894,17 @@ class ContinentalQuestApp:
         # Setup API bridge
         api = self.setup_api_bridge()
         
+        # Load the minified build of the page (rebuilt only when the sources change)
+        try:
+            page_path = web_assets.entry_page(self.app_dir)
+        except Exception as e:
+            print(f"⚠️ Could not build landing assets, loading the source page: {e}")
+            page_path = self.launcher_path
+        
         # Create the webview window
         self.web_window = webview.create_window(
             title='Continental Quest - Choose Your Adventure',
-            url=str(self.launcher_path),
+            url=str(page_path),
             width=1400,
             height=900,
             resizable=True,
@@ -813,57 +912,22 @@ class ContinentalQuestApp:
             js_api=api,
             on_top=False
         )
+        self.startup.mark('webview created')
         
-        # Add a callback to handle window events
         def on_window_loaded():
-            print("\n🔥 [DEBUG] Window loaded - setting up Python integration")
-            
-            # Inject a direct call to our API
-            script = f"""
-            // Override the Python interface to force webview mode
-            if (window.pythonInterface) {{
-                window.pythonInterface.backend_type = 'webview';
-                console.log('🔥 [FORCED] Backend type set to webview');
-                
-                // Override startGame to directly call the Python API
-                const originalStartGame = window.pythonInterface.startGame.bind(window.pythonInterface);
-                window.pythonInterface.startGame = async function(options) {{
-                    console.log('🚀 [OVERRIDE] startGame called, triggering Python...');
-                    try {{
-                        // Call the Python API directly
-                        const result = await pywebview.api.start_game(options);
-                        console.log('✅ [PYTHON] Success:', result);
-                        return result;
-                    }} catch (error) {{
-                        console.error('❌ [PYTHON] Error:', error);
-                        // If that fails, try the original method
-                        return await originalStartGame(options);
-                    }}
-                }};
-            }}
-            
-            // Also inject a global direct function
-            window.directStartGame = function() {{
-                console.log('🚀 [DIRECT] Starting game directly!');
-                return window.pythonInterface.startGame({{}});
-            }};
-            
-            console.log('🔥 [INJECTED] Python integration enhanced');
-            """
-            
-            try:
-                # Wait a bit for the page to fully load
-                import time
-                time.sleep(1)
-                self.web_window.evaluate_js(script)
-                print("✅ [DEBUG] Successfully enhanced Python integration")
-            except Exception as e:
-                print(f"❌ [DEBUG] Failed to enhance integration: {e}")
+            self.startup.mark('webview loaded')
+            # The page calls page_ready as soon as window.pythonInterface exists and we
+            # inject then; this only catches pages that never report in
+            if not self.page_ready.wait(PAGE_READY_TIMEOUT):
+                print(f"⚠️ Launcher page did not report ready within {PAGE_READY_TIMEOUT}s, injecting anyway")
+                self.inject_integration()
         
         # Handle window closing to stop music
         def on_window_closing():
             print("🔄 Window closing - stopping background music")
             self.stop_background_music()
+            if self.event_dispatcher is not None:
+                self.event_dispatcher.stop()
         
         # Set the callbacks
         webview.windows[0].events.loaded += on_window_loaded
@@ -874,7 +938,8 @@ class ContinentalQuestApp:
         
         # Start the webview (this blocks until window closes)
         try:
-            webview.start(debug=False)  # Changed from debug=True to debug=False
+            webview.start(func=self.startup.mark, args=('GUI loop started',),
+                          debug=False)  # Changed from debug=True to debug=False
         finally:
             # Ensure music is stopped when webview ends
             self.stop_background_music()
@@ -886,20 +951,30 @@ class ContinentalQuestApp:
         print("🔄 Using fallback browser launcher...")
         
         # Start background music for fallback mode too
-        self.start_background_music()
+        self.start_background_music(background=True)
         
         self.create_launcher_files()
         
         if self.launcher_path.exists():
             import webbrowser
-            webbrowser.open(f'file://{self.launcher_path.absolute()}')
+            # Served over HTTP so script.js talks to us through its web_api backend
+            try:
+                self.http_server = LauncherHTTPServer(self, self.setup_api_bridge()).start()
+                launcher_url = self.http_server.url
+                self.startup.mark('HTTP server listening')
+            except Exception as e:
+                print(f"⚠️ Could not start the launcher HTTP server: {e}")
+                launcher_url = f'file://{self.launcher_path.absolute()}'
+            webbrowser.open(launcher_url)
+            self.startup.mark('browser opened')
             print("🌐 Opened launcher in default browser")
             print("👉 The 3D globe integration works best with the desktop app")
             
-            # Keep the app running
+            # Keep the app running until it is closed; the timeout only keeps
+            # Ctrl+C working on Windows, where an untimed wait can't be interrupted
             try:
-                while True:
-                    time.sleep(1)
+                while not self.closed.wait(0.5):
+                    pass
             except KeyboardInterrupt:
                 print("👋 Application closed")
                 self.stop_background_music()
@@ -909,6 +984,7 @@ class ContinentalQuestApp:
     def shutdown(self):
         """Clean shutdown of the application"""
         print("🛑 Shutting down Continental Quest...")
+        self.closed.set()
         
         # Stop background music
         self.stop_background_music()
@@ -925,6 +1001,26 @@ class ContinentalQuestApp:
             except:
                 pass
         
+        if self.render_worker is not None:
+            self.render_worker.stop()
+        
+        if self.http_server is not None:
+            self.http_server.stop()
+        
+        self.jobs.shutdown()
+        
+        # Write any buffered progress to disk before exiting
+        try:
+            self.progress.close()
+        except Exception as e:
+            print(f"⚠️ Could not save progress: {e}")
+        
+        telemetry.record('launcher', session_seconds=round(time.time() - PROCESS_START, 1),
+                         page_loads=self.page_loads)
+        
+        # os._exit skips atexit: write (and merge) the trace now
+        tracing.finish()
+        
         # Force exit
         os._exit(0)
     
@@ -935,15 +1031,23 @@ class ContinentalQuestApp:
         
         # Check dependencies
         if not GLOBE_AVAILABLE:
-            print("❌ Warning: globe.py not available - 3D features may not work")
+            print(f"❌ Warning: 3D globe not available (missing: {', '.join(GLOBE_MISSING)}) - "
+                  f"3D features may not work")
+        else:
+            # Bring the render worker up while the launcher loads
+            self.get_render_worker()
         
         # Try to run with webview first (best experience)
-        if WEBVIEW_AVAILABLE:
-            print("🚀 Starting with WebView integration")
-            success = self.run_webview_launcher()
-        else:
-            print("🔄 WebView not available, using browser fallback")
-            self.run_fallback_launcher()
+        try:
+            if WEBVIEW_AVAILABLE:
+                print("🚀 Starting with WebView integration")
+                success = self.run_webview_launcher()
+            else:
+                print("🔄 WebView not available, using browser fallback")
+                self.run_fallback_launcher()
+        finally:
+            # Make buffered progress durable however the launcher ends
+            self.progress.close()
 
 def main():
     """Main entry point"""
@@ -0,0 +1,161 @@
+"""
+Continental Quest - Launcher Events
+Pushes state changes (globe shown/hidden, games, jobs, progress) from the app
+to the landing page: Server-Sent Events in browser mode, evaluate_js in the
+desktop app. The page sees each one as a 'cq:<name>' DOM event.
+
+Every subscriber keeps only the newest event per coalescing key, so a page
+that falls behind gets the current state instead of a backlog.
+"""
+
+import collections
+import json
+import threading
+import time
+
+# Never push to a page more often than it can render
+MIN_PUSH_INTERVAL = 1 / 60
+
+# Idle SSE streams send a comment this often so proxies and dead clients are noticed
+HEARTBEAT_INTERVAL = 15
+
+# First event on every channel, so the page knows pushes are arriving
+CONNECTED = "connected"
+
+
+class Subscription:
+    """One page's queue of pending events, coalesced by key"""
+
+    def __init__(self, bus, wake=None):
+        self.bus = bus
+        self.wake = wake  # called (from any thread) whenever an event arrives
+        self.coalesced = 0
+        self._pending = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def deliver(self, key, event):
+        with self._lock:
+            if key in self._pending:
+                # Superseded before the page saw it
+                del self._pending[key]
+                self.coalesced += 1
+            self._pending[key] = event
+        self._ready.set()
+        if self.wake is not None:
+            self.wake()
+
+    def drain(self):
+        """Everything pending, oldest first"""
+        with self._lock:
+            events = list(self._pending.values())
+            self._pending.clear()
+            self._ready.clear()
+        return events
+
+    def wait(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    def close(self):
+        """Stop receiving events (and wake anyone waiting)"""
+        self.bus.unsubscribe(self)
+        self._ready.set()
+
+
+class EventBus:
+    """Fans events out to every subscribed page"""
+
+    def __init__(self):
+        self._subscriptions = []
+        self._state = collections.OrderedDict()  # latest retained event per key
+        self._lock = threading.Lock()
+
+    def publish(self, name, data=None, key=None, retain=True):
+        """Send an event to every page
+
+        Events with the same key (default: the name) replace each other while
+        undelivered. Retained events are replayed to pages that connect later;
+        an unretained one also drops whatever was retained under its key.
+        """
+        key = key or name
+        event = {"event": name, "data": data if data is not None else {}, "time": time.time()}
+        with self._lock:
+            self._state.pop(key, None)
+            if retain:
+                self._state[key] = event
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            subscription.deliver(key, event)
+
+    def subscribe(self, wake=None):
+        """New subscription, primed with the current state"""
+        subscription = Subscription(self, wake)
+        with self._lock:
+            self._subscriptions.append(subscription)
+            state = list(self._state.items())
+        subscription.deliver(CONNECTED, {"event": CONNECTED, "data": {}, "time": time.time()})
+        for key, event in state:
+            subscription.deliver(key, event)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+
+def format_sse(event):
+    """One event in text/event-stream framing"""
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n".encode("utf-8")
+
+
+def dispatch_script(events):
+    """JS that fires each event on the page as a 'cq:<name>' CustomEvent"""
+    return "".join(
+        f"window.dispatchEvent(new CustomEvent('cq:{event['event']}', {{detail: {json.dumps(event['data'])}}}));"
+        for event in events
+    )
+
+
+class WebviewDispatcher:
+    """Pushes bus events into a pywebview window with evaluate_js
+
+    Runs on its own thread; events that arrive while a push is in flight are
+    coalesced into the next one.
+    """
+
+    def __init__(self, bus, window):
+        self.bus = bus
+        self.window = window
+        self.running = False
+        self.subscription = None
+
+    def start(self):
+        if not self.running:
+            self.running = True
+            self.subscription = self.bus.subscribe()
+            threading.Thread(target=self._run, name="cq-events", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.running = False
+        if self.subscription is not None:
+            self.subscription.close()
+
+    def _run(self):
+        last_push = 0.0
+        while self.running:
+            if not self.subscription.wait(HEARTBEAT_INTERVAL):
+                continue
+            # Let a burst settle into one push
+            delay = MIN_PUSH_INTERVAL - (time.perf_counter() - last_push)
+            if delay > 0:
+                time.sleep(delay)
+            events = self.subscription.drain()
+            if not events or not self.running:
+                continue
+            try:
+                self.window.evaluate_js(dispatch_script(events))
+            except Exception as e:
+                print(f"⚠️ Could not push {len(events)} events to the launcher: {e}")
+            last_push = time.perf_counter()
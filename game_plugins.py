@@ -0,0 +1,120 @@
+"""
+Continental Quest - Game Plugins
+Continent games that run inside the globe's window instead of as their own
+process. A game module opts in by defining GameScene, a ContinentGame
+subclass. It is imported with importlib the first time it's needed, cached, and
+run as a scene in the shared RenderHost: no new process, window or re-decoded
+assets. Modules without a GameScene are still launched as scripts through the
+game pool.
+"""
+
+import ast
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+import pygame
+
+from render_host import Scene
+
+SCENE_ATTR = "GameScene"
+
+
+class ContinentGame(Scene):
+    """Base class for in-process continent games
+
+    The globe stays resident underneath, so its textures, quadric and audio
+    are all still loaded and reachable through self.globe. Returning False
+    from handle_event/update goes back to the globe.
+    """
+
+    def __init__(self, continent, difficulty="medium", globe=None):
+        self.continent = continent
+        self.difficulty = difficulty
+        self.globe = globe
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            # Closing the window closes the globe too, not just the game
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            return False
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            return False
+        return True
+
+
+_plugins = {}  # absolute game file -> (mtime, GameScene class or None)
+_lock = threading.Lock()
+
+
+def declares_scene(path):
+    """Whether a game file defines GameScene at top level (checked without running it)"""
+    try:
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return False
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            names = [node.name]
+        elif isinstance(node, ast.Assign):
+            names = [target.id for target in node.targets if isinstance(target, ast.Name)]
+        elif isinstance(node, ast.ImportFrom):
+            names = [alias.asname or alias.name for alias in node.names]
+        else:
+            continue
+        if SCENE_ATTR in names:
+            return True
+    return False
+
+
+def _import(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    start = time.perf_counter()
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        sys.modules.pop(name, None)
+        print(f"⚠️ Could not load {os.path.basename(path)} ({e}), running it as a script")
+        return None
+    scene_class = getattr(module, SCENE_ATTR, None)
+    if not (isinstance(scene_class, type) and issubclass(scene_class, Scene)):
+        print(f"⚠️ {name}.{SCENE_ATTR} is not a Scene, running {os.path.basename(path)} as a script")
+        return None
+    print(f"🧩 Loaded {name}.{SCENE_ATTR} in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return scene_class
+
+
+def load_scene(game_file):
+    """The GameScene class of a game module, or None if it has to run as a script
+
+    Cached per file; an edited file is re-imported on its next use.
+    """
+    path = os.path.abspath(game_file)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    with _lock:
+        cached = _plugins.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        scene_class = _import(path) if declares_scene(path) else None
+        _plugins[path] = (mtime, scene_class)
+        return scene_class
+
+
+def preload(game_files):
+    """Import the plugins in the background so the first click doesn't wait for them"""
+    def load_all():
+        for game_file in game_files:
+            load_scene(game_file)
+
+    thread = threading.Thread(target=load_all, name="game-plugins", daemon=True)
+    thread.start()
+    return thread
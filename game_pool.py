@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Game Pool
+Keeps warm interpreters (Python started, pygame/numpy/OpenGL already imported)
+ready to run a continent game, so a click on a globe marker doesn't pay for
+interpreter start-up and imports before the game can draw. Each worker runs one
+game and exits; a replacement starts warming up straight away.
+
+Click-to-first-frame (the game's first display flip) is measured for every
+launch, warm or cold.
+
+Usage:
+    python game_pool.py compare GAME_FILE [--runs 5]
+
+Set CQ_GAME_POOL=0 to launch every game cold, CQ_GAME_POOL_SIZE to keep more
+than one worker warm.
+"""
+
+import argparse
+import importlib
+import importlib.abc
+import importlib.util
+import os
+import queue
+import runpy
+import secrets
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Listener
+
+import telemetry
+import tracing
+
+POOL_SIZE = int(os.environ.get("CQ_GAME_POOL_SIZE", "1"))
+POOL_ENABLED = os.environ.get("CQ_GAME_POOL", "1").strip().lower() not in ("0", "false", "off")
+PRELOAD_MODULES = ("pygame", "numpy", "OpenGL.GL", "OpenGL.GLU")
+
+# Workers find the pool through these (a local socket with a per-pool key)
+ADDRESS_ENV = "CQ_GAME_POOL_ADDRESS"
+AUTHKEY_ENV = "CQ_GAME_POOL_AUTHKEY"
+# Set for a cold launch: run this game straight away, without preloading
+RUN_ENV = "CQ_GAME_POOL_RUN"
+
+
+# ------------------ Worker side ------------------
+
+def _patch_display(display, report):
+    """Wrap pygame.display.flip/update to report the first frame"""
+    reported = []
+
+    def wrap(original):
+        def hooked(*args, **kwargs):
+            result = original(*args, **kwargs)
+            if not reported:
+                reported.append(True)
+                report("first_frame")
+            return result
+        return hooked
+
+    display.flip = wrap(display.flip)
+    display.update = wrap(display.update)
+
+
+class _DisplayImportHook(importlib.abc.MetaPathFinder):
+    """Patches pygame.display when the game imports it, so a cold game pays no extra import"""
+
+    def __init__(self, report):
+        self.report = report
+
+    def find_spec(self, name, path=None, target=None):
+        if name != "pygame.display":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            return spec
+        loader, report = spec.loader, self.report
+
+        class PatchingLoader(importlib.abc.Loader):
+            def create_module(self, spec):
+                return loader.create_module(spec)
+
+            def exec_module(self, module):
+                loader.exec_module(module)
+                _patch_display(module, report)
+
+        spec.loader = PatchingLoader()
+        return spec
+
+
+def _run_game(conn, game_file):
+    def report(event):
+        tracing.instant(event.replace("_", " "))
+        try:
+            conn.send((event, time.time()))
+        except OSError:
+            pass
+
+    display = sys.modules.get("pygame.display")
+    if display is not None:
+        _patch_display(display, report)
+    else:
+        sys.meta_path.insert(0, _DisplayImportHook(report))
+
+    # Look like `python game_file` to the game
+    sys.argv = [game_file]
+    sys.path[0] = os.path.dirname(game_file)
+    tracing.set_process_name(f"game {os.path.basename(game_file)}")
+    report("started")
+    with tracing.span(os.path.basename(game_file)):
+        runpy.run_path(game_file, run_name="__main__")
+
+
+def worker_main():
+    """Entry point of a pool worker process"""
+    host, port = os.environ.pop(ADDRESS_ENV).rsplit(":", 1)
+    authkey = bytes.fromhex(os.environ.pop(AUTHKEY_ENV))
+    try:
+        conn = Client((host, int(port)), authkey=authkey)
+    except (OSError, EOFError, AuthenticationError):
+        return  # the pool closed before this worker was needed
+
+    game_file = os.environ.pop(RUN_ENV, None)
+    if game_file:
+        conn.send(("cold", os.getpid()))
+    else:
+        start = time.perf_counter()
+        with tracing.span("preload imports"):
+            for module in PRELOAD_MODULES:
+                try:
+                    importlib.import_module(module)
+                except ImportError:
+                    pass
+        conn.send(("ready", os.getpid(), time.perf_counter() - start))
+        try:
+            command, game_file, env = conn.recv()
+        except (EOFError, OSError):
+            return  # the pool went away
+        if command != "run":
+            return
+        os.environ.clear()
+        os.environ.update(env)
+    _run_game(conn, game_file)
+
+
+# ------------------ Pool side ------------------
+
+class GameLaunch:
+    """One game launch and its timings"""
+
+    def __init__(self, game_file, mode, clicked_at, process):
+        self.game_file = game_file
+        self.mode = mode  # "warm" or "cold"
+        self.clicked_at = clicked_at
+        self.process = process
+        self.started = None      # seconds from click to the game's code running
+        self.first_frame = None  # seconds from click to its first frame
+        self.done = threading.Event()  # set at the first frame, or when the game exits
+
+    @property
+    def name(self):
+        return os.path.basename(self.game_file)
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class GamePool:
+    """Warm game interpreters, handed out one per click"""
+
+    def __init__(self, size=POOL_SIZE, enabled=POOL_ENABLED):
+        self.size = size
+        self.enabled = enabled
+        self.launches = []
+        self._idle = queue.Queue()  # (Popen, connection) of warm workers
+        self._processes = {}        # pid -> Popen of every worker started
+        self._pending_cold = {}     # pid -> GameLaunch waiting for its worker to connect
+        self._authkey = secrets.token_bytes(16)
+        self._listener = None
+        self._closed = False
+        self._lock = threading.RLock()
+
+    def start(self):
+        """Start listening and warming up workers (safe to call again)"""
+        with self._lock:
+            if self._listener is not None:
+                return self
+            self._listener = Listener(("127.0.0.1", 0), authkey=self._authkey)
+        threading.Thread(target=self._accept, name="game-pool", daemon=True).start()
+        if self.enabled:
+            for _ in range(self.size):
+                self._spawn()
+        return self
+
+    def _spawn(self, env=None, cold_game=None):
+        env = dict(os.environ if env is None else env)
+        host, port = self._listener.address
+        env[ADDRESS_ENV] = f"{host}:{port}"
+        env[AUTHKEY_ENV] = self._authkey.hex()
+        if cold_game:
+            env[RUN_ENV] = cold_game
+        with self._lock:
+            process = subprocess.Popen([sys.executable, os.path.abspath(__file__), "worker"], env=env)
+            self._processes[process.pid] = process
+        return process
+
+    def _accept(self):
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+                hello = conn.recv()
+            except (OSError, EOFError, AuthenticationError):
+                continue
+            with self._lock:
+                process = self._processes.get(hello[1])
+                launch = self._pending_cold.pop(hello[1], None)
+            if hello[0] == "ready" and process is not None:
+                print(f"🎮 Game worker {process.pid} warm ({hello[2] * 1000:.0f} ms of imports done)")
+                self._idle.put((process, conn))
+            elif hello[0] == "cold" and launch is not None:
+                self._watch(launch, conn)
+
+    def launch(self, game_file, env=None):
+        """Run a game, on a warm worker if one is ready; returns its Popen"""
+        clicked_at = time.time()
+        self.start()
+        game_file = os.path.abspath(game_file)
+        env = dict(os.environ if env is None else env)
+        while True:
+            try:
+                process, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if process.poll() is not None:
+                    continue  # died while waiting
+                tracing.instant("game launch", game=os.path.basename(game_file), mode="warm", pid=process.pid)
+                conn.send(("run", game_file, env))
+            except OSError:
+                continue
+            launch = GameLaunch(game_file, "warm", clicked_at, process)
+            self.launches.append(launch)
+            self._watch(launch, conn)
+            if self.enabled and not self._closed:
+                self._spawn()  # warm up the next one
+            return process
+        return self.launch_cold(game_file, env, clicked_at)
+
+    def launch_cold(self, game_file, env=None, clicked_at=None):
+        """Start a game in a fresh interpreter (what a plain Popen would do)"""
+        clicked_at = clicked_at or time.time()
+        self.start()
+        with self._lock:
+            process = self._spawn(env, cold_game=os.path.abspath(game_file))
+            launch = GameLaunch(game_file, "cold", clicked_at, process)
+            tracing.instant("game launch", game=launch.name, mode="cold", pid=process.pid)
+            self._pending_cold[process.pid] = launch
+        self.launches.append(launch)
+        return process
+
+    def _watch(self, launch, conn):
+        threading.Thread(target=self._read_timings, args=(launch, conn),
+                         name="game-timings", daemon=True).start()
+
+    def _read_timings(self, launch, conn):
+        try:
+            while True:
+                event, at = conn.recv()
+                if event == "started":
+                    launch.started = at - launch.clicked_at
+                elif event == "first_frame":
+                    launch.first_frame = at - launch.clicked_at
+                    print(f"⏱️ {launch.name}: first frame {launch.first_frame * 1000:.0f} ms "
+                          f"after the click ({launch.mode})")
+                    launch.done.set()
+        except (EOFError, OSError):
+            pass
+        if launch.first_frame is None and launch.started is not None:
+            print(f"⏱️ {launch.name}: running {launch.started * 1000:.0f} ms after the click "
+                  f"({launch.mode}), exited without drawing")
+        launch.done.set()
+        telemetry.record("game_launch", game=launch.name, mode=launch.mode,
+                         started_ms=_ms(launch.started), first_frame_ms=_ms(launch.first_frame))
+
+    def wait_until_warm(self, timeout=30.0):
+        """Block until a worker is ready (for benchmarks)"""
+        deadline = time.time() + timeout
+        while self._idle.empty():
+            if time.time() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def summary(self):
+        """Median click-to-first-frame (or to running, for games that never draw) per mode"""
+        result = {}
+        for mode in ("cold", "warm"):
+            frames = [launch.first_frame for launch in self.launches
+                      if launch.mode == mode and launch.first_frame is not None]
+            started = [launch.started for launch in self.launches
+                       if launch.mode == mode and launch.started is not None]
+            result[mode] = {
+                "launches": sum(1 for launch in self.launches if launch.mode == mode),
+                "first_frame_ms": round(statistics.median(frames) * 1000, 1) if frames else None,
+                "started_ms": round(statistics.median(started) * 1000, 1) if started else None,
+            }
+        return result
+
+    def stop(self):
+        """Let idle workers exit (running games are left alone)"""
+        self._closed = True
+        while True:
+            try:
+                process, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+        if self._listener is not None:
+            self._listener.close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """This process's game pool"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = GamePool()
+        return _pool
+
+
+def compare(game_file, runs=5, timeout=30.0):
+    """Launch a game cold and warm a few times each and compare click-to-first-frame"""
+    pool = GamePool(size=1, enabled=True).start()
+    for mode in ("cold", "warm"):
+        for _ in range(runs):
+            if mode == "warm" and not pool.wait_until_warm(timeout):
+                print("❌ No worker became ready")
+                return None
+            process = pool.launch(game_file) if mode == "warm" else pool.launch_cold(game_file)
+            launch = pool.launches[-1]
+            launch.done.wait(timeout)
+            if process.poll() is None:
+                process.terminate()
+            process.wait()
+            launch.done.wait(1.0)
+    pool.stop()
+
+    summary = pool.summary()
+    for mode, stats in summary.items():
+        frame = f"{stats['first_frame_ms']:.0f} ms" if stats["first_frame_ms"] is not None else "never drew"
+        running = f"{stats['started_ms']:.0f} ms" if stats["started_ms"] is not None else "-"
+        print(f"📊 {mode:<4}: first frame {frame}, game code running after {running} "
+              f"(median of {stats['launches']})")
+    return summary
+
+
+def main():
+    """Game pool CLI entry point"""
+    if len(sys.argv) > 1 and sys.argv[1] == "worker":
+        worker_main()
+        return
+
+    parser = argparse.ArgumentParser(description="Compare warm and cold game launches")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compare_parser = commands.add_parser("compare", help="time click-to-first-frame, cold vs warm")
+    compare_parser.add_argument("game_file")
+    compare_parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        compare(args.game_file, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+Continental Quest - GL Resources
+Owns the OpenGL objects of one context (textures, buffers, GLU quadrics), so
+a kiosk can run for days without slowly leaking GPU memory.
+
+Every object has a name and is reference counted per owner (usually a scene).
+Asking for a name that already exists shares the object instead of creating
+another. Quadrics are pooled by configuration rather than made every frame.
+Objects created with cache=True stay loaded at zero references until trim()
+or shutdown. The manager estimates the GPU memory of each object and reports
+whatever an owner still holds after it should have let go, and whatever is
+still alive when the context shuts down.
+"""
+
+import collections
+import itertools
+import time
+
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+# Bytes per texel of the client formats we upload (drivers may pad RGB to 4)
+BYTES_PER_TEXEL = {
+    GL_RGB: 3,
+    GL_RGBA: 4,
+    GL_LUMINANCE: 1,
+    GL_LUMINANCE_ALPHA: 2,
+}
+
+TEXTURE = "texture"
+BUFFER = "buffer"
+QUADRIC = "quadric"
+
+
+def owner_key(owner):
+    """How owners are told apart: names as given, objects by identity (the full id)"""
+    if owner is None or isinstance(owner, str):
+        return owner or "unowned"
+    return f"{type(owner).__name__}#{id(owner):x}"
+
+
+def owner_label(owner):
+    """How an owner shows up in reports (short, so not unique - never used as a key)"""
+    if owner is None or isinstance(owner, str):
+        return owner or "unowned"
+    return f"{type(owner).__name__}#{id(owner) & 0xffff:04x}"
+
+
+class GLResource:
+    """One GL object and who holds it"""
+
+    __slots__ = ("kind", "name", "handle", "nbytes", "owners", "cache", "created_at")
+
+    def __init__(self, kind, name, handle, nbytes=0, cache=False):
+        self.kind = kind
+        self.name = name
+        self.handle = handle
+        self.nbytes = nbytes
+        self.owners = collections.Counter()  # owner key -> references
+        self.cache = cache
+        self.created_at = time.time()
+
+    @property
+    def refs(self):
+        return sum(self.owners.values())
+
+
+class GLResources:
+    """The GL objects of one context"""
+
+    def __init__(self, label="window"):
+        self.label = label
+        self.created = collections.Counter()  # kind -> objects created over the context's life
+        self.deleted = collections.Counter()
+        self.peak_bytes = 0
+        self._resources = {}  # name -> GLResource
+        self._labels = {}  # owner key -> owner label, for reports
+        self._anonymous = itertools.count(1)
+
+    # -- creating and sharing ------------------------------------------------
+
+    def acquire(self, name, owner):
+        """Take another reference to an existing object; returns its handle, or None if there is none"""
+        resource = self._resources.get(name)
+        if resource is None:
+            return None
+        resource.owners[self._key(owner)] += 1
+        return resource.handle
+
+    def _key(self, owner):
+        key = owner_key(owner)
+        self._labels[key] = owner_label(owner)
+        return key
+
+    def _add(self, kind, name, handle, owner, nbytes=0, cache=False):
+        if name is None:
+            name = f"{kind}#{next(self._anonymous)}"
+        resource = GLResource(kind, name, handle, nbytes, cache)
+        resource.owners[self._key(owner)] += 1
+        self._resources[name] = resource
+        self.created[kind] += 1
+        self.peak_bytes = max(self.peak_bytes, self.total_bytes())
+        return handle
+
+    def texture(self, name, pixels, width, height, owner, fmt=GL_RGB, wrap=GL_REPEAT,
+                filtering=GL_LINEAR, cache=False, mipmaps=()):
+        """A 2D texture of pixels (bytes or a numpy array); shared if name already exists
+
+        mipmaps: the smaller levels as (pixels, width, height), e.g. from asset_build.load_texture.
+        """
+        handle = self.acquire(name, owner) if name is not None else None
+        if handle is not None:
+            return handle
+        handle = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, handle)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, wrap)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, wrap)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, filtering)
+        if mipmaps:
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAX_LEVEL, len(mipmaps))
+        else:
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, filtering)
+        # Rows are tightly packed (small mip levels aren't 4-byte aligned)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, fmt, width, height, 0, fmt, GL_UNSIGNED_BYTE, pixels)
+        nbytes = width * height * BYTES_PER_TEXEL.get(fmt, 4)
+        for level, (level_pixels, level_width, level_height) in enumerate(mipmaps, 1):
+            glTexImage2D(GL_TEXTURE_2D, level, fmt, level_width, level_height, 0, fmt, GL_UNSIGNED_BYTE,
+                         level_pixels)
+            nbytes += level_width * level_height * BYTES_PER_TEXEL.get(fmt, 4)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 4)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        return self._add(TEXTURE, name, handle, owner, nbytes, cache)
+
+    def buffer(self, name, owner, data=None, nbytes=0, target=GL_ARRAY_BUFFER, usage=GL_STATIC_DRAW,
+               cache=False):
+        """A buffer object, filled with data (a numpy array) if given; shared if name already exists"""
+        handle = self.acquire(name, owner) if name is not None else None
+        if handle is not None:
+            return handle
+        handle = glGenBuffers(1)
+        if data is not None:
+            glBindBuffer(target, handle)
+            glBufferData(target, data.nbytes, data, usage)
+            glBindBuffer(target, 0)
+            nbytes = data.nbytes
+        return self._add(BUFFER, name, handle, owner, nbytes, cache)
+
+    def quadric(self, owner, texture=False, orientation=GLU_OUTSIDE, normals=GLU_SMOOTH):
+        """A pooled GLU quadric with this configuration (never create one per frame)"""
+        name = f"quadric/{'textured' if texture else 'plain'}/{orientation}/{normals}"
+        handle = self.acquire(name, owner)
+        if handle is not None:
+            return handle
+        handle = gluNewQuadric()
+        gluQuadricTexture(handle, GL_TRUE if texture else GL_FALSE)
+        gluQuadricOrientation(handle, orientation)
+        gluQuadricNormals(handle, normals)
+        return self._add(QUADRIC, name, handle, owner, cache=True)
+
+    def resize(self, name, nbytes):
+        """Record that an object's storage changed size (e.g. a streamed buffer or re-specified texture)"""
+        resource = self._resources.get(name)
+        if resource is not None and resource.nbytes != nbytes:
+            resource.nbytes = nbytes
+            self.peak_bytes = max(self.peak_bytes, self.total_bytes())
+
+    # -- releasing -----------------------------------------------------------
+
+    def _find(self, name_or_handle):
+        """By name, or by handle (ids can repeat across kinds, so textures are matched first)"""
+        resource = self._resources.get(name_or_handle)
+        if resource is None:
+            matches = sorted((r for r in self._resources.values() if r.handle == name_or_handle),
+                             key=lambda r: r.kind != TEXTURE)
+            resource = matches[0] if matches else None
+        return resource
+
+    def release(self, name_or_handle, owner):
+        """Drop one of owner's references; the object is deleted at zero unless cached"""
+        resource = self._find(name_or_handle)
+        key = owner_key(owner)
+        if resource is None or not resource.owners[key]:
+            print(f"⚠️ GL: {owner_label(owner)} released {name_or_handle!r}, which it doesn't hold")
+            return
+        resource.owners[key] -= 1
+        if not resource.owners[key]:
+            del resource.owners[key]
+        if not resource.refs and not resource.cache:
+            self._delete(resource)
+
+    def release_owner(self, owner):
+        """Drop every reference owner holds (e.g. when a scene exits); returns how many"""
+        key = owner_key(owner)
+        count = 0
+        for resource in list(self._resources.values()):
+            refs = resource.owners.pop(key, 0)
+            if refs:
+                count += refs
+                if not resource.refs and not resource.cache:
+                    self._delete(resource)
+        self._labels.pop(key, None)
+        return count
+
+    def held_by(self, owner):
+        key = owner_key(owner)
+        return [resource for resource in self._resources.values() if resource.owners.get(key)]
+
+    def _delete(self, resource):
+        try:
+            if resource.kind == TEXTURE:
+                glDeleteTextures([resource.handle])
+            elif resource.kind == BUFFER:
+                glDeleteBuffers(1, [resource.handle])
+            elif resource.kind == QUADRIC:
+                gluDeleteQuadric(resource.handle)
+        except Exception as e:
+            print(f"⚠️ GL: could not delete {resource.name}: {e}")
+        self._resources.pop(resource.name, None)
+        self.deleted[resource.kind] += 1
+
+    def trim(self):
+        """Delete cached objects nobody holds; returns the bytes freed"""
+        freed = 0
+        for resource in list(self._resources.values()):
+            if not resource.refs:
+                freed += resource.nbytes
+                self._delete(resource)
+        return freed
+
+    # -- reporting -----------------------------------------------------------
+
+    def total_bytes(self):
+        return sum(resource.nbytes for resource in self._resources.values())
+
+    def stats(self):
+        counts = collections.Counter(resource.kind for resource in self._resources.values())
+        return {
+            "textures": counts[TEXTURE],
+            "buffers": counts[BUFFER],
+            "quadrics": counts[QUADRIC],
+            "mb": round(self.total_bytes() / 2 ** 20, 2),
+            "peak_mb": round(self.peak_bytes / 2 ** 20, 2),
+        }
+
+    def report_leaks(self, resources):
+        for resource in sorted(resources, key=lambda r: -r.nbytes):
+            owners = ", ".join(f"{self._labels.get(key, key)} x{refs}" for key, refs in resource.owners.items())
+            print(f"   {resource.kind:<8} {resource.name:<32} {resource.nbytes / 2 ** 20:7.2f} MB  "
+                  f"held by {owners}")
+
+    def check_owner(self, owner):
+        """After owner has released everything: report (and drop) whatever it still holds"""
+        leaked = self.held_by(owner)
+        if leaked:
+            print(f"⚠️ GL leak: {owner_label(owner)} still holds {len(leaked)} objects after exit")
+            self.report_leaks(leaked)
+            self.release_owner(owner)
+        return leaked
+
+    def shutdown(self):
+        """Report objects still alive and delete everything (before the context goes away)"""
+        alive = [resource for resource in self._resources.values() if resource.refs]
+        stats = self.stats()
+        if alive:
+            print(f"⚠️ GL leak: {len(alive)} objects still held when the {self.label} context closed")
+            self.report_leaks(alive)
+        for resource in list(self._resources.values()):
+            self._delete(resource)
+        print(f"🧮 GL resources ({self.label}): {sum(self.created.values())} created, "
+              f"{sum(self.deleted.values())} deleted, peak {stats['peak_mb']:.1f} MB")
+        return alive
+
+    def context_lost(self):
+        """The context was destroyed under us: forget every handle (they are gone with it)"""
+        if self._resources:
+            print(f"⚠️ GL context re-created with {len(self._resources)} objects still registered")
+        self._resources.clear()
+
+
+_current = None
+
+
+def set_current(resources):
+    global _current
+    _current = resources
+
+
+def current():
+    """The manager of the context in use (a standalone one if no RenderHost has set it)"""
+    global _current
+    if _current is None:
+        _current = GLResources("default")
+    return _current
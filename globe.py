@@ -1,4 +1,5 @@
 import pygame
+import ctypes
 import math
 import time
 from pygame.locals import *
@@ -7,106 +8,105 @@ from OpenGL.GLU import *
 import numpy as np
 import random
 import os
-import subprocess
-import sys
+import threading
+
+from audio import get_audio
+import asset_build
+import game_plugins
+import gl_resources
+import tracing
+from game_pool import get_pool
+from render_host import RenderHost, Scene
 
 # ------------------ Texture helpers ------------------
 
-def read_texture(path):
-    """Load an image file as an OpenGL texture. Returns texture id or 0 on failure."""
+GALAXY_SEED = 2024
+
+def load_texture_pixels(path):
+    """Decode an image file into (RGB bytes, width, height) without touching OpenGL. Returns None on failure."""
     try:
         surface = pygame.image.load(path)
         surface = pygame.transform.flip(surface, False, True)  # OpenGL origin fix
         image = pygame.image.tostring(surface, "RGB", True)
         width, height = surface.get_rect().size
+        return image, width, height
+    except Exception as e:
+        print(f"[read_texture] Failed to load '{path}': {e}")
+        return None
 
-        tex_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, tex_id)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, width, height, 0,
-                     GL_RGB, GL_UNSIGNED_BYTE, image)
-        glBindTexture(GL_TEXTURE_2D, 0)
-        return tex_id
+def upload_texture(pixels, width, height, name=None, owner='upload_texture'):
+    """Upload RGB pixel data (bytes or a numpy array) as a repeating OpenGL texture.
+
+    The texture belongs to the current context's GLResources; release it there
+    (anything never released is reported when the window closes).
+    """
+    return gl_resources.current().texture(name, pixels, width, height, owner)
+
+def read_texture(path):
+    """Load an image file as an OpenGL texture. Returns texture id or 0 on failure."""
+    decoded = load_texture_pixels(path)
+    if decoded is None:
+        return 0
+    try:
+        return upload_texture(*decoded)
     except Exception as e:
         print(f"[read_texture] Failed to load '{path}': {e}")
         return 0
 
+def generate_earth_pixels(size=256):
+    """Pixels of a procedural Earth-like texture (used as fallback)."""
+    u = np.arange(size) / size
+    v = np.arange(size) / size
+    u, v = np.meshgrid(u, v)
+    noise1 = np.sin(u * math.pi * 8) * np.cos(v * math.pi * 6)
+    noise2 = np.sin(u * math.pi * 12) * np.sin(v * math.pi * 4)
+    noise3 = np.cos(u * math.pi * 16) * np.cos(v * math.pi * 8)
+    land_value = (noise1 + noise2 * 0.5 + noise3 * 0.3) / 1.8
+
+    ocean_depth = (np.abs(land_value) * 100).astype(np.int32)
+    land = land_value > 0.1
+    land_shade = (land_value * 50).astype(np.int32)
+    texture_data = np.where(
+        land[..., None],
+        np.stack([34 + land_shade, 102 + land_shade, 34 + (land_value * 30).astype(np.int32)], axis=-1),
+        np.stack([np.zeros_like(ocean_depth), 50 + ocean_depth, 150 + ocean_depth], axis=-1))
+    return texture_data.astype(np.uint8)
+
 def create_earth_texture():
     """Create a procedural Earth-like texture (used as fallback)."""
-    size = 256
-    texture_data = np.zeros((size, size, 3), dtype=np.uint8)
-    for y in range(size):
-        for x in range(size):
-            u = x / size
-            v = y / size
-            noise1 = math.sin(u * math.pi * 8) * math.cos(v * math.pi * 6)
-            noise2 = math.sin(u * math.pi * 12) * math.sin(v * math.pi * 4)
-            noise3 = math.cos(u * math.pi * 16) * math.cos(v * math.pi * 8)
-            land_value = (noise1 + noise2 * 0.5 + noise3 * 0.3) / 1.8
-            if land_value > 0.1:
-                texture_data[y, x] = [
-                    34 + int(land_value * 50),
-                    102 + int(land_value * 50),
-                    34 + int(land_value * 30)
-                ]
-            else:
-                ocean_depth = abs(land_value) * 100
-                texture_data[y, x] = [0, 50 + int(ocean_depth), 150 + int(ocean_depth)]
-
-    tex_id = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, tex_id)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, size, size, 0, GL_RGB, GL_UNSIGNED_BYTE, texture_data)
-    glBindTexture(GL_TEXTURE_2D, 0)
-    return tex_id
+    return upload_texture(generate_earth_pixels(256), 256, 256)
+
+def generate_galaxy_pixels(size=512, seed=GALAXY_SEED):
+    """Pixels of a procedural galaxy background: a faint spiral sprinkled with stars."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:size, 0:size]
+    dx = x - size // 2
+    dy = y - size // 2
+    distance = np.sqrt(dx * dx + dy * dy) / (size / 2)
+    angle = np.arctan2(dy, dx)
+    spiral = np.sin(angle * 3 + distance * 10) * np.exp(-distance * 1.5)
+    star_chance = rng.random((size, size))
+
+    base = (distance * 15).astype(np.int32)
+    texture_data = np.stack([base, base // 2, base + 5], axis=-1)
+
+    intensity = (spiral * 100).astype(np.int32)
+    arms = spiral > 0.1
+    texture_data[arms] = np.stack([intensity + 20, intensity // 2, intensity + 30], axis=-1)[arms]
+
+    colored = star_chance > 0.995
+    texture_data[colored] = np.stack([rng.integers(150, 256, (size, size)),
+                                      rng.integers(100, 201, (size, size)),
+                                      rng.integers(100, 256, (size, size))], axis=-1)[colored]
+
+    white = star_chance > 0.998
+    brightness = rng.integers(200, 256, (size, size))
+    texture_data[white] = np.stack([brightness] * 3, axis=-1)[white]
+    return texture_data.astype(np.uint8)
 
 def create_galaxy_texture():
     """Create a procedural galaxy background texture."""
-    size = 512
-    texture_data = np.zeros((size, size, 3), dtype=np.uint8)
-    center_x, center_y = size // 2, size // 2
-    for y in range(size):
-        for x in range(size):
-            dx = x - center_x
-            dy = y - center_y
-            distance = math.sqrt(dx*dx + dy*dy) / (size/2)
-            angle = math.atan2(dy, dx)
-            spiral = math.sin(angle * 3 + distance * 10) * math.exp(-distance * 1.5)
-
-            random.seed(x * 1000 + y)
-            star_chance = random.random()
-
-            if star_chance > 0.998:
-                intensity = random.randint(200, 255)
-                texture_data[y, x] = [intensity, intensity, intensity]
-            elif star_chance > 0.995:
-                r = random.randint(150, 255)
-                g = random.randint(100, 200)
-                b = random.randint(100, 255)
-                texture_data[y, x] = [r, g, b]
-            else:
-                if spiral > 0.1:
-                    intensity = int(spiral * 100)
-                    texture_data[y, x] = [intensity + 20, intensity//2, intensity + 30]
-                else:
-                    base = int(distance * 15)
-                    texture_data[y, x] = [base, base//2, base + 5]
-
-    tex_id = glGenTextures(1)
-    glBindTexture(GL_TEXTURE_2D, tex_id)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, size, size, 0, GL_RGB, GL_UNSIGNED_BYTE, texture_data)
-    glBindTexture(GL_TEXTURE_2D, 0)
-    return tex_id
+    return upload_texture(generate_galaxy_pixels(512), 512, 512)
 
 # ------------------ Continent markers ------------------
 
@@ -226,37 +226,59 @@ def setup_lighting():
     glLightfv(GL_LIGHT0, GL_SPECULAR, (0.8, 0.8, 0.8, 1.0))
     glLightfv(GL_LIGHT0, GL_POSITION, (10.0, 5.0, 5.0, 1.0))
 
-def draw_atmosphere(radius):
+class SphereMesh:
+    """A sphere baked by asset_build, in buffer objects; draws the same triangles as gluSphere"""
+
+    def __init__(self, gl, name, arrays, owner):
+        vertices, indices = arrays
+        self.vbo = gl.buffer(f'globe/mesh/{name}/vertices', owner, data=vertices)
+        self.ibo = gl.buffer(f'globe/mesh/{name}/indices', owner, data=indices, target=GL_ELEMENT_ARRAY_BUFFER)
+        self.count = len(indices)
+
+    def draw(self, radius):
+        glPushMatrix()
+        glScalef(radius, radius, radius)  # a unit sphere; GL_NORMALIZE keeps the lighting right
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        glInterleavedArrays(GL_T2F_N3F_V3F, 0, ctypes.c_void_p(0))
+        glDrawElements(GL_TRIANGLES, self.count, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glPopMatrix()
+
+def draw_atmosphere(radius, quad, mesh=None):
     glPushMatrix()
     glDisable(GL_TEXTURE_2D)
     glEnable(GL_BLEND)
     glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
     glDepthMask(GL_FALSE)
     glColor4f(0.2, 0.4, 0.8, 0.3)
-    quad = gluNewQuadric()
-    gluSphere(quad, radius * 1.05, 50, 50)
-    gluDeleteQuadric(quad)
+    if mesh is not None:
+        mesh.draw(radius * 1.05)
+    else:
+        gluSphere(quad, radius * 1.05, 50, 50)
     glDepthMask(GL_TRUE)
     glDisable(GL_BLEND)
     glColor4f(1, 1, 1, 1)
     glPopMatrix()
 
-def draw_stars(count=1000):
-    glDisable(GL_TEXTURE_2D)
-    glDisable(GL_LIGHTING)
-
-    random.seed(42)
+def build_star_geometry(count=1000):
+    """Star field points as (normal, red giant, blue giant, bright) lists of (x, y, z, r, g, b)."""
+    rng = random.Random(42)
     normal_stars, red_giants, blue_giants, bright_stars = [], [], [], []
 
     for _ in range(count):
-        theta = random.uniform(0, 2 * math.pi)
-        phi = random.uniform(0, math.pi)
+        theta = rng.uniform(0, 2 * math.pi)
+        phi = rng.uniform(0, math.pi)
         r = 45
         x = r * math.sin(phi) * math.cos(theta)
         y = r * math.sin(phi) * math.sin(theta)
         z = r * math.cos(phi)
-        brightness = random.uniform(0.3, 1.0)
-        t = random.random()
+        brightness = rng.uniform(0.3, 1.0)
+        t = rng.random()
         if t > 0.95:
             blue_giants.append((x, y, z, brightness * 0.8, brightness * 0.9, brightness))
         elif t > 0.9:
@@ -264,16 +286,26 @@ def draw_stars(count=1000):
         else:
             normal_stars.append((x, y, z, brightness, brightness * 0.95, brightness * 0.8))
 
-    random.seed(123)
+    rng.seed(123)
     for _ in range(50):
-        theta = random.uniform(0, 2 * math.pi)
-        phi = random.uniform(0, math.pi)
+        theta = rng.uniform(0, 2 * math.pi)
+        phi = rng.uniform(0, math.pi)
         r = 48
         x = r * math.sin(phi) * math.cos(theta)
         y = r * math.sin(phi) * math.sin(theta)
         z = r * math.cos(phi)
         bright_stars.append((x, y, z, 1.0, 1.0, 0.9))
 
+    return normal_stars, red_giants, blue_giants, bright_stars
+
+def draw_stars(count=1000, geometry=None):
+    glDisable(GL_TEXTURE_2D)
+    glDisable(GL_LIGHTING)
+
+    if geometry is None:
+        geometry = build_star_geometry(count)
+    normal_stars, red_giants, blue_giants, bright_stars = geometry
+
     glPointSize(1.0)
     glBegin(GL_POINTS)
     for x, y, z, r, g, b in normal_stars:
@@ -301,7 +333,25 @@ def draw_stars(count=1000):
     glPointSize(1.0)
     glEnable(GL_LIGHTING)
 
-def draw_clouds(radius, time_offset):
+def build_cloud_geometry(radius):
+    """Cloud triangle vertices (x, y, z) just above a sphere of the given radius."""
+    rng = random.Random(123)
+    vertices = []
+    for _ in range(200):
+        theta = rng.uniform(0, 2 * math.pi)
+        phi = rng.uniform(0, math.pi)
+        if rng.random() > 0.7:
+            cloud_radius = radius * 1.02
+            for _ in range(3):
+                offset_theta = theta + rng.uniform(-0.1, 0.1)
+                offset_phi = phi + rng.uniform(-0.1, 0.1)
+                x = cloud_radius * math.sin(offset_phi) * math.cos(offset_theta)
+                y = cloud_radius * math.sin(offset_phi) * math.sin(offset_theta)
+                z = cloud_radius * math.cos(offset_phi)
+                vertices.append((x, y, z))
+    return vertices
+
+def draw_clouds(radius, time_offset, vertices=None):
     glPushMatrix()
     glRotatef(time_offset * 5, 0, 1, 0)
     glEnable(GL_BLEND)
@@ -309,20 +359,11 @@ def draw_clouds(radius, time_offset):
     glDepthMask(GL_FALSE)
     glColor4f(1, 1, 1, 0.6)
 
+    if vertices is None:
+        vertices = build_cloud_geometry(radius)
     glBegin(GL_TRIANGLES)
-    random.seed(123)
-    for _ in range(200):
-        theta = random.uniform(0, 2 * math.pi)
-        phi = random.uniform(0, math.pi)
-        if random.random() > 0.7:
-            cloud_radius = radius * 1.02
-            for _ in range(3):
-                offset_theta = theta + random.uniform(-0.1, 0.1)
-                offset_phi = phi + random.uniform(-0.1, 0.1)
-                x = cloud_radius * math.sin(offset_phi) * math.cos(offset_theta)
-                y = cloud_radius * math.sin(offset_phi) * math.sin(offset_theta)
-                z = cloud_radius * math.cos(offset_phi)
-                glVertex3f(x, y, z)
+    for x, y, z in vertices:
+        glVertex3f(x, y, z)
     glEnd()
 
     glDepthMask(GL_TRUE)
@@ -366,37 +407,236 @@ def draw_nebula():
     glDisable(GL_BLEND)
     glEnable(GL_LIGHTING)
 
-def draw_background(texture):
+def draw_background(texture, quad, mesh=None):
+    """quad: a textured quadric oriented inside (see GLResources.quadric), used if there is no baked mesh"""
     glPushMatrix()
     glColor4f(0.4, 0.4, 0.4, 1.0)
     glBindTexture(GL_TEXTURE_2D, texture)
-    quad = gluNewQuadric()
-    gluQuadricTexture(quad, GL_TRUE)
-    gluQuadricOrientation(quad, GLU_INSIDE)
-    gluSphere(quad, 40, 100, 100)
-    gluDeleteQuadric(quad)
+    if mesh is not None:
+        mesh.draw(40)
+    else:
+        gluSphere(quad, 40, 100, 100)
     glBindTexture(GL_TEXTURE_2D, 0)
     glColor4f(1, 1, 1, 1)
     glPopMatrix()
 
-# ------------------ Main ------------------
+# ------------------ Asset preparation ------------------
+
+class GlobeAssets:
+    """Everything the globe needs that doesn't require a GL context: decoded and
+    generated texture pixels, star and cloud geometry and the ambience track.
+
+    start() prepares it on a background thread (e.g. during the transition) so
+    GlobeScene only has to upload textures when it starts. Whatever
+    setup_continental_quest.py build-assets has cached (mipmapped textures,
+    sphere meshes) is loaded from there instead of being made here.
+    """
+
+    STEPS = ("earth texture", "galaxy texture", "sphere meshes", "star field", "clouds", "ambience")
+
+    def __init__(self, earth_path='world.jpg'):
+        self.earth_path = earth_path
+        self.earth_pixels = None      # (pixels, width, height)
+        self.earth_mipmaps = ()       # smaller levels, when baked
+        self.galaxy_pixels = None
+        self.galaxy_mipmaps = ()
+        self.sphere_meshes = {}       # name -> (vertices, indices), when baked (else gluSphere)
+        self.star_geometry = None
+        self.cloud_vertices = None
+        self.completed = []
+        self.timings = {}
+        self._done = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Begin preparing in the background"""
+        if self._thread is None and not self._done.is_set():
+            self._thread = threading.Thread(target=self.prepare, name="globe-assets", daemon=True)
+            self._thread.start()
+        return self
+
+    def prepare(self):
+        """Prepare every asset on the calling thread"""
+        try:
+            for step, work in zip(self.STEPS, (self._prepare_earth, self._prepare_galaxy,
+                                               self._prepare_meshes, self._prepare_stars,
+                                               self._prepare_clouds, self._prepare_sound)):
+                step_start = time.perf_counter()
+                try:
+                    with tracing.span(f"prepare {step}"):
+                        work()
+                except Exception as e:
+                    print(f"[GlobeAssets] Could not prepare {step}: {e}")
+                self.timings[step] = time.perf_counter() - step_start
+                self.completed.append(step)
+        finally:
+            self._done.set()
+
+    def _prepare_earth(self):
+        if os.path.exists(self.earth_path):
+            levels = asset_build.load_texture('earth', source=self.earth_path)
+            if levels is not None:
+                print(f"Loading Earth texture from the asset cache ({self.earth_path})")
+                self.earth_pixels, self.earth_mipmaps = levels[0], levels[1:]
+                return
+            print(f"Loading Earth texture from {self.earth_path}")
+            self.earth_pixels = load_texture_pixels(self.earth_path)
+        if self.earth_pixels is None:
+            print("Falling back to procedural Earth texture")
+            levels = asset_build.load_texture('earth_procedural')
+            if levels is not None:
+                self.earth_pixels, self.earth_mipmaps = levels[0], levels[1:]
+            else:
+                self.earth_pixels = (generate_earth_pixels(256), 256, 256)
 
-def main():
-    try:
-        pygame.init()
-        display = (800, 600)
-        pygame.display.set_mode(display, DOUBLEBUF | OPENGL | RESIZABLE)
-        pygame.display.set_caption('Continental Quest - Realistic Earth with Enhanced Space Background')
+    def _prepare_galaxy(self):
+        levels = asset_build.load_texture('galaxy_procedural')
+        if levels is not None:
+            self.galaxy_pixels, self.galaxy_mipmaps = levels[0], levels[1:]
+        else:
+            self.galaxy_pixels = (generate_galaxy_pixels(512), 512, 512)
+
+    def _prepare_meshes(self):
+        for name in asset_build.SPHERES:
+            arrays = asset_build.load_mesh(name)
+            if arrays is not None:
+                self.sphere_meshes[name] = arrays
+
+    def _prepare_stars(self):
+        self.star_geometry = build_star_geometry(1200)
+
+    def _prepare_clouds(self):
+        self.cloud_vertices = build_cloud_geometry(2.5)
+
+    def _prepare_sound(self):
+        # Decoded once into the audio manager's cache; playing it later is instant
+        get_audio().preload('globe')
+
+    @property
+    def fraction_ready(self):
+        return len(self.completed) / len(self.STEPS)
+
+    def wait(self):
+        """Block until preparation has finished, preparing here if it was never started"""
+        if self._thread is None and not self._done.is_set():
+            self.prepare()
+        self._done.wait()
+        return self
+
+    def report(self, label="arrival"):
+        """Print and return how much preparation was finished at this point"""
+        fraction = self.fraction_ready
+        pending = [step for step in self.STEPS if step not in self.completed]
+        message = f"📦 Globe assets {fraction * 100:.0f}% ready at {label}"
+        if pending:
+            message += f" (still preparing: {', '.join(pending)})"
+        print(message)
+        return fraction
+
+# ------------------ Scene ------------------
+
+CONTINENT_MARKERS = [
+    (34.0479, 100.6197, (1.0, 0.0, 0.0), 0.15, "asia_game.py", "Asia"),  # Asia (Central)
+    (1.0, 18.0, (0.0, 1.0, 0.0), 0.15, "africa_game.py", "Africa"),  # Africa (Central)
+    (50.0, 10.0, (0.0, 0.0, 1.0), 0.15, "europe_game.py", "Europe"),  # Europe (Central)
+    (45.0, -100.0, (1.0, 0.5, 0.0), 0.15, "northamerica_game.py", "North America"),  # North America (Central)
+    (-20.0, -60.0, (0.5, 0.0, 1.0), 0.15, "southamerica_game.py", "South America"),  # South America (Central)
+    (-25.0, 135.0, (1.0, 0.0, 1.0), 0.15, "australia_game.py", "Australia"),  # Australia (Central)
+    (-82.0, 0.0, (0.0, 1.0, 1.0), 0.15, "antarctica_game.py", "Antarctica")  # Antarctica
+]
+
+def set_projection(w, h):
+    glViewport(0, 0, w, h)
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    aspect = w / float(h if h else 1)
+    gluPerspective(40, aspect, 0.1, 100.0)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+    glTranslatef(0.0, 0.0, -6)
+
+class GlobeScene(Scene):
+    """The interactive Earth, run inside a RenderHost window"""
+
+    caption = 'Continental Quest - Realistic Earth with Enhanced Space Background'
+    frame_rate = 100  # about the same pace as the old 10 ms wait per frame
+
+    def __init__(self, assets=None, continent=None, difficulty='medium'):
+        self.assets = assets
+        self.continent = continent
+        self.difficulty = difficulty
+        self.games = []  # (continent name, Popen) for games launched from the markers (see game_pool)
+        self.next_scene = None  # in-process game to switch to (see game_plugins and run_globe)
+
+    def enter(self, host):
+        self.host = host
+        host.open(opengl=True)
+        # Warm a game interpreter while the globe loads, so the first click doesn't start one cold
+        get_pool().start()
         pygame.key.set_repeat(1, 10)
-        
-        # Initialize pygame mixer and load the sound
-        pygame.mixer.init()
-        try:
-            pygame.mixer.music.load('space_sound.mp3')
-            pygame.mixer.music.play(-1)  # -1 means loop indefinitely
+
+        # Decoding and generation happen off the GL thread; only uploads are left for here
+        load_start = time.perf_counter()
+        assets = self.assets
+        if assets is None:
+            assets = GlobeAssets()
+        else:
+            assets.report()
+        assets.wait()
+
+        # Fade in the space ambience (decoded while the assets were prepared)
+        self._play_ambience()
+
+        self._setup_gl_state()
+
+        # Upload Earth texture (world.jpg, or the procedural fallback); the host's GLResources owns them
+        gl = host.gl or gl_resources.current()
+        self.earth_tex = gl.texture('globe/earth', *assets.earth_pixels, owner=self, mipmaps=assets.earth_mipmaps)
+        self.galaxy_tex = gl.texture('globe/galaxy', *assets.galaxy_pixels, owner=self,
+                                     mipmaps=assets.galaxy_mipmaps)
+        self.meshes = {name: SphereMesh(gl, name, arrays, self) for name, arrays in assets.sphere_meshes.items()}
+        self.star_geometry = assets.star_geometry
+        self.cloud_vertices = assets.cloud_vertices
+        print(f"🌍 Globe ready in {(time.perf_counter() - load_start) * 1000:.0f} ms")
+
+        # Pooled quadrics, made once instead of every frame
+        self.qobj = gl.quadric(self, texture=True)
+        self.atmosphere_quad = gl.quadric(self)
+        self.background_quad = gl.quadric(self, texture=True, orientation=GLU_INSIDE)
+
+        self.earth_material_ambient = [0.2, 0.2, 0.2, 1.0]
+        self.earth_material_diffuse = [0.8, 0.8, 0.8, 1.0]
+        self.earth_material_specular = [0.1, 0.1, 0.1, 1.0]
+        self.earth_material_shininess = [5.0]
+
+        # Create continent markers with more accurate positions
+        self.continent_markers = [ContinentMarker(*marker) for marker in CONTINENT_MARKERS]
+        self.focus_continent(self.continent)
+        game_plugins.preload([marker.game_file for marker in self.continent_markers])
+
+        self.start_time = time.time()
+        self.current_time = 0.0
+        self.lastPosX, self.lastPosY = 0, 0
+        self.rotating = False
+
+        print("Controls:")
+        print("Arrow keys / Left-drag: rotate Earth")
+        print("Mouse wheel: zoom")
+        print("L: toggle lighting, ESC: quit")
+        print("Click on continent markers to launch games")
+
+    def _play_ambience(self):
+        # Crossfades from whatever this process was playing (the launcher music in-process)
+        if get_audio().play('globe'):
             print("Playing space_sound.mp3 on loop")
-        except Exception as e:
-            print(f"Could not load or play space_sound.mp3: {e}")
+
+    def _setup_gl_state(self):
+        # The previous scene may have left its own state behind in the shared context
+        glDisable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glLineWidth(1.0)
+        glPointSize(1.0)
 
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_TEXTURE_2D)
@@ -405,176 +645,208 @@ def main():
         glClearColor(0.0, 0.0, 0.02, 1.0)
 
         # Projection
-        def set_projection(w, h):
-            glViewport(0, 0, w, h)
-            glMatrixMode(GL_PROJECTION)
-            glLoadIdentity()
-            aspect = w / float(h if h else 1)
-            gluPerspective(40, aspect, 0.1, 100.0)
-            glMatrixMode(GL_MODELVIEW)
-            glLoadIdentity()
-            glTranslatef(0.0, 0.0, -6)
-
-        set_projection(*display)
+        set_projection(*self.host.size)
 
         setup_lighting()
 
-        # Load Earth texture, fallback if missing
-        earth_tex = 0
-        if os.path.exists('world.jpg'):
-            print("Loading Earth texture from world.jpg")
-            earth_tex = read_texture('world.jpg')
-        if earth_tex == 0:
-            print("Falling back to procedural Earth texture")
-            earth_tex = create_earth_texture()
+    def focus_continent(self, continent):
+        """Reset the camera and turn the globe so the continent faces the viewer"""
+        self.continent = continent
+        set_projection(*self.host.size)
+        key = (continent or '').lower().replace('-', ' ').replace('_', ' ')
+        for marker in self.continent_markers:
+            marker.selected = marker.name.lower() == key
+            if marker.selected:
+                # Inverse of the marker's placement: undo its longitude, then its polar angle
+                glRotatef(-(90 - marker.lat), 0, 1, 0)
+                glRotatef(-marker.lon, 0, 0, 1)
+
+    def resume(self):
+        """Shown again by a warm host: GPU resources are still loaded"""
+        pygame.key.set_repeat(1, 10)
+        self._setup_gl_state()
+        self.focus_continent(self.continent)
+        self._play_ambience()
+
+    def suspend(self):
+        """Hidden but kept resident, ready for the next launch"""
+        pygame.key.set_repeat()
+        self.rotating = False
+        get_audio().stop('globe')
+
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == VIDEORESIZE:
+            set_projection(event.w, event.h)
+        elif event.type == KEYDOWN:
+            if event.key == K_ESCAPE:
+                return False
+            elif event.key == K_LEFT:
+                glRotatef(2, 0, 1, 0)
+            elif event.key == K_RIGHT:
+                glRotatef(2, 0, -1, 0)
+            elif event.key == K_UP:
+                glRotatef(2, -1, 0, 0)
+            elif event.key == K_DOWN:
+                glRotatef(2, 1, 0, 0)
+            elif event.key == K_l:
+                if glIsEnabled(GL_LIGHTING):
+                    glDisable(GL_LIGHTING); print("Lighting disabled")
+                else:
+                    glEnable(GL_LIGHTING); print("Lighting enabled")
+        elif event.type == MOUSEBUTTONDOWN:
+            if event.button == 1:
+                self.rotating = True
+
+                # Check if a marker was clicked
+                viewport = glGetIntegerv(GL_VIEWPORT)
+                modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
+                projection = glGetDoublev(GL_PROJECTION_MATRIX)
+
+                for marker in self.continent_markers:
+                    if marker.check_click(2.5, event.pos, viewport, modelview, projection):
+                        marker.selected = True
+                        scene_class = game_plugins.load_scene(marker.game_file)
+                        if scene_class is not None:
+                            # Switch to it in this window; the globe stays resident underneath
+                            print(f"Entering {marker.name}...")
+                            self.continent = marker.name
+                            self.next_scene = scene_class(marker.name, self.difficulty, globe=self)
+                            continue
+                        print(f"Launching {marker.game_file}...")
+
+                        # Launch the game in its own process (a warm one if the pool has it)
+                        try:
+                            # Keep music playing by not terminating the mixer
+                            env = dict(os.environ, CQ_DIFFICULTY=self.difficulty)
+                            process = get_pool().launch(marker.game_file, env)
+                            self.games.append((marker.name, process))
+                        except Exception as e:
+                            print(f"Failed to launch {marker.game_file}: {e}")
+                    else:
+                        marker.selected = False
+                if self.next_scene is not None:
+                    return False
+            elif event.button == 4:
+                glScaled(1.05, 1.05, 1.05)
+            elif event.button == 5:
+                glScaled(0.95, 0.95, 0.95)
+        elif event.type == MOUSEBUTTONUP:
+            if event.button == 1:
+                self.rotating = False
+        elif event.type == MOUSEMOTION and self.rotating:
+            x, y = event.pos
+            dx = x - self.lastPosX
+            dy = y - self.lastPosY
+            # Simple, stable world-axis rotation (avoids GLfloat usage)
+            glRotatef(dy * 0.3, 1, 0, 0)
+            glRotatef(dx * 0.3, 0, 1, 0)
+            self.lastPosX, self.lastPosY = x, y
+
+            # Check for marker hover
+            viewport = glGetIntegerv(GL_VIEWPORT)
+            modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
+            projection = glGetDoublev(GL_PROJECTION_MATRIX)
+
+            for marker in self.continent_markers:
+                marker.hover = marker.check_click(2.5, (x, y), viewport, modelview, projection)
+        if event.type == MOUSEMOTION and not self.rotating:
+            self.lastPosX, self.lastPosY = event.pos
+        return True
+
+    def update(self, dt):
+        self.current_time = time.time() - self.start_time
+        return True
+
+    def draw(self):
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-        galaxy_tex = create_galaxy_texture()
+        glPushMatrix()
+        glDisable(GL_LIGHTING)
+        glEnable(GL_TEXTURE_2D)
+        draw_background(self.galaxy_tex, self.background_quad, self.meshes.get('background'))
+        draw_nebula()
+        draw_stars(1200, self.star_geometry)
+        glPopMatrix()
+        glEnable(GL_LIGHTING)
+        glColor4f(1, 1, 1, 1)
 
-        qobj = gluNewQuadric()
-        gluQuadricTexture(qobj, GL_TRUE)
-        gluQuadricNormals(qobj, GLU_SMOOTH)
+        glMaterialfv(GL_FRONT, GL_AMBIENT,  self.earth_material_ambient)
+        glMaterialfv(GL_FRONT, GL_DIFFUSE,  self.earth_material_diffuse)
+        glMaterialfv(GL_FRONT, GL_SPECULAR, self.earth_material_specular)
+        glMaterialfv(GL_FRONT, GL_SHININESS, self.earth_material_shininess)
 
-        earth_material_ambient = [0.2, 0.2, 0.2, 1.0]
-        earth_material_diffuse = [0.8, 0.8, 0.8, 1.0]
-        earth_material_specular = [0.1, 0.1, 0.1, 1.0]
-        earth_material_shininess = [5.0]
+        glDisable(GL_TEXTURE_2D)
+        draw_atmosphere(2.5, self.atmosphere_quad, self.meshes.get('atmosphere'))
 
-        # Create continent markers with more accurate positions
-        continent_markers = [
-            ContinentMarker(34.0479, 100.6197, (1.0, 0.0, 0.0), 0.15, "asia_game.py", "Asia"),  # Asia (Central)
-            ContinentMarker(1.0, 18.0, (0.0, 1.0, 0.0), 0.15, "africa_game.py", "Africa"),  # Africa (Central)
-            ContinentMarker(50.0, 10.0, (0.0, 0.0, 1.0), 0.15, "europe_game.py", "Europe"),  # Europe (Central)
-            ContinentMarker(45.0, -100.0, (1.0, 0.5, 0.0), 0.15, "northamerica_game.py", "North America"),  # North America (Central)
-            ContinentMarker(-20.0, -60.0, (0.5, 0.0, 1.0), 0.15, "southamerica_game.py", "South America"),  # South America (Central)
-            ContinentMarker(-25.0, 135.0, (1.0, 0.0, 1.0), 0.15, "australia_game.py", "Australia"),  # Australia (Central)
-            ContinentMarker(-82.0, 0.0, (0.0, 1.0, 1.0), 0.15, "antarctica_game.py", "Antarctica")  # Antarctica
-        ]
-
-        start_time = time.time()
-        lastPosX, lastPosY = 0, 0
-        rotating = False
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.earth_tex)
+        if 'earth' in self.meshes:
+            self.meshes['earth'].draw(2.5)
+        else:
+            gluSphere(self.qobj, 2.5, 100, 100)
+        glBindTexture(GL_TEXTURE_2D, 0)
 
-        print("Controls:")
-        print("Arrow keys / Left-drag: rotate Earth")
-        print("Mouse wheel: zoom")
-        print("L: toggle lighting, ESC: quit")
-        print("Click on continent markers to launch games")
+        glDisable(GL_TEXTURE_2D)
+        draw_clouds(2.5, self.current_time, self.cloud_vertices)
 
-        running = True
-        while running:
-            current_time = time.time() - start_time
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == VIDEORESIZE:
-                    set_projection(event.w, event.h)
-                elif event.type == KEYDOWN:
-                    if event.key == K_ESCAPE:
-                        running = False
-                    elif event.key == K_LEFT:
-                        glRotatef(2, 0, 1, 0)
-                    elif event.key == K_RIGHT:
-                        glRotatef(2, 0, -1, 0)
-                    elif event.key == K_UP:
-                        glRotatef(2, -1, 0, 0)
-                    elif event.key == K_DOWN:
-                        glRotatef(2, 1, 0, 0)
-                    elif event.key == K_l:
-                        if glIsEnabled(GL_LIGHTING):
-                            glDisable(GL_LIGHTING); print("Lighting disabled")
-                        else:
-                            glEnable(GL_LIGHTING); print("Lighting enabled")
-                elif event.type == MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        rotating = True
-                        
-                        # Check if a marker was clicked
-                        viewport = glGetIntegerv(GL_VIEWPORT)
-                        modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
-                        projection = glGetDoublev(GL_PROJECTION_MATRIX)
-                        
-                        for marker in continent_markers:
-                            if marker.check_click(2.5, event.pos, viewport, modelview, projection):
-                                marker.selected = True
-                                print(f"Launching {marker.game_file}...")
-                                
-                                # Launch the game in a new process
-                                try:
-                                    # Keep music playing by not terminating the mixer
-                                    subprocess.Popen([sys.executable, marker.game_file])
-                                except Exception as e:
-                                    print(f"Failed to launch {marker.game_file}: {e}")
-                            else:
-                                marker.selected = False
-                    elif event.button == 4:
-                        glScaled(1.05, 1.05, 1.05)
-                    elif event.button == 5:
-                        glScaled(0.95, 0.95, 0.95)
-                elif event.type == MOUSEBUTTONUP:
-                    if event.button == 1:
-                        rotating = False
-                elif event.type == MOUSEMOTION and rotating:
-                    x, y = event.pos
-                    dx = x - lastPosX
-                    dy = y - lastPosY
-                    # Simple, stable world-axis rotation (avoids GLfloat usage)
-                    glRotatef(dy * 0.3, 1, 0, 0)
-                    glRotatef(dx * 0.3, 0, 1, 0)
-                    lastPosX, lastPosY = x, y
-                    
-                    # Check for marker hover
-                    viewport = glGetIntegerv(GL_VIEWPORT)
-                    modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
-                    projection = glGetDoublev(GL_PROJECTION_MATRIX)
-                    
-                    for marker in continent_markers:
-                        marker.hover = marker.check_click(2.5, (x, y), viewport, modelview, projection)
-                if event.type == MOUSEMOTION and not rotating:
-                    lastPosX, lastPosY = event.pos
-
-            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-
-            glPushMatrix()
-            glDisable(GL_LIGHTING)
-            glEnable(GL_TEXTURE_2D)
-            draw_background(galaxy_tex)
-            draw_nebula()
-            draw_stars(1200)
-            glPopMatrix()
-            glEnable(GL_LIGHTING)
-            glColor4f(1, 1, 1, 1)
-
-            glMaterialfv(GL_FRONT, GL_AMBIENT,  earth_material_ambient)
-            glMaterialfv(GL_FRONT, GL_DIFFUSE,  earth_material_diffuse)
-            glMaterialfv(GL_FRONT, GL_SPECULAR, earth_material_specular)
-            glMaterialfv(GL_FRONT, GL_SHININESS, earth_material_shininess)
-
-            glDisable(GL_TEXTURE_2D)
-            draw_atmosphere(2.5)
-
-            glEnable(GL_TEXTURE_2D)
-            glBindTexture(GL_TEXTURE_2D, earth_tex)
-            gluSphere(qobj, 2.5, 100, 100)
-            glBindTexture(GL_TEXTURE_2D, 0)
-
-            glDisable(GL_TEXTURE_2D)
-            draw_clouds(2.5, current_time)
-            
-            # Draw continent markers
-            for marker in continent_markers:
-                marker.draw(2.5)
+        # Draw continent markers
+        for marker in self.continent_markers:
+            marker.draw(2.5)
 
-            pygame.display.flip()
-            pygame.time.wait(10)
+    def exit(self):
+        (self.host.gl or gl_resources.current()).release_owner(self)
+        pygame.key.set_repeat()
+        # The space ambience belongs to the globe; the launcher restores its own music
+        get_audio().stop('globe')
 
-        pygame.quit()
+# ------------------ Main ------------------
 
+def run_globe(host, scene, started_at=None, on_game=None):
+    """Run the globe until it's closed, switching into in-process games and back
+
+    on_game(continent, finished, returncode) is called as each game starts and ends.
+    """
+    while True:
+        host.run(scene, keep_resident=True, started_at=started_at)
+        game, scene.next_scene = scene.next_scene, None
+        if game is None or host.interrupted:
+            return
+        started_at = None
+        if on_game:
+            on_game(game.continent, False, None)
+        returncode = 0
+        try:
+            host.run(game)
+        except Exception as e:
+            # A broken game shouldn't take the globe down with it
+            print(f"❌ {game.continent} game error: {e}")
+            returncode = 1
+        if on_game:
+            on_game(game.continent, True, returncode)
+        if host.interrupted:
+            return
+
+@tracing.traced("globe.main")
+def main(host=None, assets=None):
+    """Run the globe, in its own window or inside a shared RenderHost
+
+    assets is an optional GlobeAssets already being prepared in the background.
+    """
+    own_host = host is None
+    if own_host:
+        host = RenderHost((800, 600))
+    try:
+        run_globe(host, GlobeScene(assets))
     except Exception as e:
         print(f"Error occurred: {e}")
         import traceback
         traceback.print_exc()
-        pygame.quit()
+    finally:
+        if own_host:
+            host.close()
+            pygame.quit()
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - HTTP Load Test
+Hammers the launcher's local HTTP server (browser fallback mode) from many
+keep-alive connections at once and reports requests per second and latency
+percentiles.
+
+Usage:
+    python http_loadtest.py [--url http://127.0.0.1:8765] [--path /api/progress]
+                            [--concurrency 50] [--duration 10]
+                            [--method POST --body '{"difficulty": "hard"}']
+"""
+
+import argparse
+import asyncio
+import time
+import urllib.parse
+
+
+async def read_response(reader):
+    """Read one HTTP/1.1 response and return (status, keep_alive)"""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {}
+    for line in lines[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length:
+        await reader.readexactly(length)
+    return status, headers.get("connection", "").lower() != "close"
+
+
+async def client(host, port, request, deadline, latencies, errors):
+    """One keep-alive connection sending requests back to back until the deadline"""
+    reader = writer = None
+    while time.perf_counter() < deadline:
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status, keep_alive = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors.append(status)
+            if not keep_alive:
+                writer.close()
+                writer = None
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            errors.append(type(e).__name__)
+            if writer is not None:
+                writer.close()
+            writer = None
+            await asyncio.sleep(0.01)
+    if writer is not None:
+        writer.close()
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+async def run(url, path, method, body, concurrency, duration):
+    parts = urllib.parse.urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    payload = body.encode("utf-8")
+    request = (f"{method} {path} HTTP/1.1\r\n"
+               f"Host: {host}:{port}\r\n"
+               f"Content-Type: application/json\r\n"
+               f"Content-Length: {len(payload)}\r\n"
+               f"Connection: keep-alive\r\n"
+               f"\r\n").encode("latin-1") + payload
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(client(host, port, request, deadline, latencies, errors)
+                           for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Continental Quest launcher HTTP server")
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="server base URL")
+    parser.add_argument("--path", default="/api/progress", help="request path")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument("--body", default="", help="request body (JSON)")
+    parser.add_argument("--concurrency", type=int, default=50, help="concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    args = parser.parse_args()
+
+    print(f"🚀 {args.method} {args.url.rstrip('/')}{args.path} with {args.concurrency} "
+          f"connections for {args.duration:g}s")
+    latencies, errors, elapsed = asyncio.run(run(args.url, args.path, args.method.upper(), args.body,
+                                                 args.concurrency, args.duration))
+    if not latencies:
+        print(f"❌ No successful requests ({len(errors)} errors)")
+        return 1
+
+    latencies.sort()
+    print(f"📊 {len(latencies)} requests in {elapsed:.2f}s: {len(latencies) / elapsed:,.0f} req/s")
+    print(f"⏱️ Latency p50 {percentile(latencies, 0.50) * 1000:.2f} ms, "
+          f"p90 {percentile(latencies, 0.90) * 1000:.2f} ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f} ms, "
+          f"max {latencies[-1] * 1000:.2f} ms")
+    if errors:
+        print(f"⚠️ {len(errors)} errors (first: {errors[0]})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
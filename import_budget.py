@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Import Budget
+Checks that importing the launcher stays cheap. It runs
+`python -X importtime -c "import continental_quest_app"` in a fresh
+interpreter, then fails (exit status 1) if the import takes longer than the
+budget or pulls in any of the graphics stack, which the launcher only loads
+once the page is up.
+
+Usage:
+    python import_budget.py [--budget-ms 150] [--runs 5] [--module continental_quest_app]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent
+
+# Best of several runs, so a busy machine doesn't fail the check on its own
+DEFAULT_BUDGET_MS = float(os.environ.get("CQ_IMPORT_BUDGET_MS", "150"))
+DEFAULT_RUNS = 5
+
+# Loaded lazily (render worker, transition, music); importing any of these up front is a regression
+FORBIDDEN = ("pygame", "OpenGL", "numpy", "globe", "quantum_transition",
+             "render_host", "transition_runtime", "transition_gl", "audio")
+
+
+def measure(module="continental_quest_app"):
+    """One cold-interpreter import of module: (total µs, {package: (self µs, cumulative µs, depth)})"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=APP_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{result.stderr[-2000:]}")
+
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue  # the column header
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports[name.strip()] = (int(self_us), int(cumulative_us), depth)
+    if module not in imports:
+        raise RuntimeError(f"no -X importtime entry for {module}")
+    return imports[module][1], imports
+
+
+def check(module="continental_quest_app", budget_ms=DEFAULT_BUDGET_MS, runs=DEFAULT_RUNS):
+    """Print the import profile and return whether it is within budget"""
+    samples = [measure(module) for _ in range(runs)]
+    total_us, imports = min(samples, key=lambda sample: sample[0])
+
+    # Where the time goes: the module's direct imports, slowest first
+    direct = sorted(((cumulative, name) for name, (_, cumulative, depth) in imports.items()
+                     if depth == 1), reverse=True)
+    print(f"📦 import {module}: {total_us / 1000:.1f} ms (best of {runs}), "
+          f"{len(imports)} modules, budget {budget_ms:.0f} ms")
+    for cumulative, name in direct[:10]:
+        print(f"   {cumulative / 1000:7.1f} ms  {name}")
+
+    ok = True
+    loaded = sorted({name for name in imports if name.split(".")[0] in FORBIDDEN})
+    if loaded:
+        print(f"❌ Launcher start-up imports {', '.join(loaded[:8])}"
+              f"{' ...' if len(loaded) > 8 else ''} - import these lazily")
+        ok = False
+    if total_us / 1000 > budget_ms:
+        print(f"❌ Over budget by {total_us / 1000 - budget_ms:.1f} ms")
+        ok = False
+    if ok:
+        print("✅ Within budget")
+    return ok
+
+
+def main():
+    """Import budget CLI entry point"""
+    parser = argparse.ArgumentParser(description="Fail if the launcher's import time regresses")
+    parser.add_argument("--module", default="continental_quest_app")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+    sys.exit(0 if check(args.module, args.budget_ms, args.runs) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Continental Quest - Background Jobs
+Long-running bridge calls (start game, launch continent) run here so the
+pywebview JS bridge can return a job id straight away
+"""
+
+import itertools
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+# Finished jobs are forgotten after this many seconds
+JOB_RETENTION = 300
+
+
+class Job:
+    """One unit of background work and its progress"""
+
+    def __init__(self, job_id, name, manager):
+        self.id = job_id
+        self.name = name
+        self.status = PENDING
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self._manager = manager
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    def update(self, progress=None, message=None):
+        """Report progress (0.0-1.0) and/or a status message"""
+        if progress is not None:
+            self.progress = min(1.0, max(0.0, progress))
+        if message is not None:
+            self.message = message
+        self._manager._notify(self)
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "progress": round(self.progress, 3),
+            "message": self.message,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobManager:
+    """Runs jobs on a small thread pool and reports every change to notify(job_dict)"""
+
+    def __init__(self, notify=None, max_workers=4):
+        self.notify = notify
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cq-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def submit(self, name, fn, *args, **kwargs):
+        """Start fn(job, *args, **kwargs) in the background and return the job id
+
+        fn's return value becomes the job result; an exception fails the job.
+        """
+        with self._lock:
+            self._prune()
+            job = Job(f"{name}-{next(self._ids)}", name, self)
+            self._jobs[job.id] = job
+        self._notify(job)
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = RUNNING
+        self._notify(job)
+        try:
+            job.result = fn(job, *args, **kwargs)
+            if isinstance(job.result, dict) and job.result.get("status") == "error":
+                job.status = FAILED
+                job.error = job.result.get("message")
+            else:
+                job.status = DONE
+                job.progress = 1.0
+        except Exception as e:
+            print(f"❌ Job {job.id} failed: {e}")
+            traceback.print_exc()
+            job.status = FAILED
+            job.error = str(e)
+        job.finished_at = time.time()
+        self._notify(job)
+
+    def _notify(self, job):
+        if self.notify is not None:
+            try:
+                self.notify(job.to_dict())
+            except Exception as e:
+                print(f"⚠️ Could not report job {job.id}: {e}")
+
+    def _prune(self):
+        cutoff = time.time() - JOB_RETENTION
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        """Current state of a job as a dict, or None if unknown"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job.to_dict() if job is not None else None
+
+    def list(self, active_only=False):
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.to_dict() for job in jobs if not (active_only and job.finished)]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
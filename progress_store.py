@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Progress Store
+Player progress per profile and continent, kept in SQLite (WAL mode) behind an
+in-memory cache. Reads come from the cache; writes update it immediately and
+are flushed to disk in batches by a background thread, so neither the bridge
+nor a game ever waits on the disk. close() makes everything durable.
+
+Usage:
+    python progress_store.py show [--profile NAME]
+    python progress_store.py bench [--updates 100000] [--profiles 50]
+"""
+
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+DB_PATH = Path(os.environ.get("CQ_PROGRESS_DB", Path(__file__).parent / "data" / "progress.db"))
+DEFAULT_PROFILE = os.environ.get("CQ_PROFILE", "default")
+
+CONTINENTS = (
+    "north-america",
+    "south-america",
+    "europe",
+    "africa",
+    "asia",
+    "australia",
+    "antarctica",
+)
+
+# Write-behind: flush this often, or sooner once this many updates are waiting
+FLUSH_INTERVAL = 0.5
+FLUSH_BATCH = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    profile    TEXT NOT NULL,
+    continent  TEXT NOT NULL,
+    progress   REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (profile, continent)
+) WITHOUT ROWID
+"""
+
+
+class ProgressStore:
+    """Cached, write-behind progress storage shared by the launcher and the games"""
+
+    def __init__(self, path=DB_PATH, flush_interval=FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.flushed_rows = 0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        # Batches commit without an fsync each; close() checkpoints with a full sync
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(SCHEMA)
+        self._db.commit()
+        self._db_lock = threading.Lock()
+
+        self._cache = {}    # profile -> {continent: progress}
+        self._pending = {}  # (profile, continent) -> (progress, updated_at), newest wins
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_behind, name="progress-writer", daemon=True)
+        self._writer.start()
+
+    # -- reads ---------------------------------------------------------------
+
+    def _profile(self, profile):
+        """The cached progress of a profile, loading it on first use"""
+        with self._lock:
+            cached = self._cache.get(profile)
+        if cached is not None:
+            return cached
+        with self._db_lock:
+            rows = self._db.execute("SELECT continent, progress FROM progress WHERE profile = ?",
+                                    (profile,)).fetchall()
+        loaded = dict.fromkeys(CONTINENTS, 0)
+        loaded.update(rows)
+        with self._lock:
+            # Updates made while we were reading win over what was on disk
+            cached = self._cache.setdefault(profile, loaded)
+        return cached
+
+    def get_progress(self, continent=None, profile=DEFAULT_PROFILE):
+        """One continent's progress (0-100), or all of a profile's as a dict"""
+        progress = self._profile(profile)
+        with self._lock:
+            if continent:
+                return progress.get(continent, 0)
+            return dict(progress)
+
+    def get_many(self, profiles):
+        """Bulk read: {profile: {continent: progress}}"""
+        return {profile: self.get_progress(profile=profile) for profile in profiles}
+
+    def profiles(self):
+        with self._db_lock:
+            stored = {row[0] for row in self._db.execute("SELECT DISTINCT profile FROM progress")}
+        with self._lock:
+            return sorted(stored | set(self._cache))
+
+    # -- writes --------------------------------------------------------------
+
+    def update_progress(self, continent, progress, profile=DEFAULT_PROFILE):
+        """Set a continent's progress; visible to reads at once, on disk within flush_interval"""
+        progress = min(100.0, max(0.0, float(progress)))
+        self.update_many({continent: progress}, profile)
+        return progress
+
+    def update_many(self, updates, profile=DEFAULT_PROFILE):
+        """Set several continents' progress for one profile"""
+        cached = self._profile(profile)
+        now = time.time()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("progress store is closed")
+            for continent, progress in updates.items():
+                progress = min(100.0, max(0.0, float(progress)))
+                cached[continent] = progress
+                self._pending[(profile, continent)] = (progress, now)
+            backlog = len(self._pending)
+        if backlog >= FLUSH_BATCH:
+            self._wake.set()
+
+    def _write_behind(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                print(f"⚠️ Could not save progress (will retry): {e}")
+
+    def flush(self):
+        """Write every pending update in one transaction; returns the number of rows"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        rows = [(profile, continent, progress, updated_at)
+                for (profile, continent), (progress, updated_at) in pending.items()]
+        start = time.perf_counter()
+        try:
+            with self._db_lock, self._db:
+                self._db.executemany("INSERT OR REPLACE INTO progress VALUES (?, ?, ?, ?)", rows)
+        except sqlite3.Error:
+            # Put them back (unless something newer has arrived) for the next attempt
+            with self._lock:
+                for key, value in pending.items():
+                    self._pending.setdefault(key, value)
+            raise
+        self.flush_seconds += time.perf_counter() - start
+        self.flushed_rows += len(rows)
+        self.flushes += 1
+        return len(rows)
+
+    def close(self):
+        """Flush everything durably and stop the writer"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+        with self._db_lock:
+            self._db.execute("PRAGMA synchronous=FULL")
+            self._db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._db.close()
+
+
+def record_progress(continent, progress, profile=DEFAULT_PROFILE, path=DB_PATH):
+    """One-shot update for a game process: write it and make it durable"""
+    store = ProgressStore(path)
+    try:
+        return store.update_progress(continent, progress, profile)
+    finally:
+        store.close()
+
+
+def bench(updates=100000, profiles=50):
+    """Update throughput as seen by the caller, and how fast the writer keeps up
+
+    Runs twice: with the given number of profiles (repeated updates coalesce
+    in memory) and with a profile per seven updates (every update is a row).
+    """
+    for profile_count in (profiles, -(-updates // len(CONTINENTS))):
+        with tempfile.TemporaryDirectory() as directory:
+            store = ProgressStore(Path(directory) / "bench.db")
+            names = [f"kiosk-{i}" for i in range(profile_count)]
+            latencies = []
+            start = time.perf_counter()
+            for i in range(updates):
+                call_start = time.perf_counter()
+                store.update_progress(CONTINENTS[i % len(CONTINENTS)], i % 101,
+                                      names[(i // len(CONTINENTS)) % profile_count])
+                latencies.append(time.perf_counter() - call_start)
+            call_time = time.perf_counter() - start
+            store.close()
+            total_time = time.perf_counter() - start
+
+            check = ProgressStore(Path(directory) / "bench.db")
+            stored = sum(len(progress) for progress in check.get_many(names).values())
+            check.close()
+
+        latencies.sort()
+        print(f"📊 {updates:,} updates across {profile_count:,} profiles")
+        print(f"   caller: {updates / call_time:,.0f} updates/s, "
+              f"median {statistics.median(latencies) * 1e6:.1f} µs, "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f} µs, "
+              f"max {latencies[-1] * 1000:.2f} ms")
+        print(f"   disk:   {store.flushed_rows:,} rows in {store.flushes} batches "
+              f"({store.flushed_rows / max(store.flush_seconds, 1e-9):,.0f} rows/s), "
+              f"all durable after {total_time:.2f} s; {stored:,} rows read back")
+
+
+def main():
+    """Progress CLI entry point"""
+    parser = argparse.ArgumentParser(description="Inspect or benchmark the progress store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    show_parser = commands.add_parser("show", help="print a profile's progress")
+    show_parser.add_argument("--profile", default=DEFAULT_PROFILE)
+
+    bench_parser = commands.add_parser("bench", help="measure update throughput")
+    bench_parser.add_argument("--updates", type=int, default=100000)
+    bench_parser.add_argument("--profiles", type=int, default=50)
+
+    args = parser.parse_args()
+
+    if args.command == "show":
+        store = ProgressStore()
+        for continent, progress in store.get_progress(profile=args.profile).items():
+            print(f"{continent:<15} {progress:5.1f}%")
+        store.close()
+    elif args.command == "bench":
+        bench(args.updates, args.profiles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,625 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Quantum Transition
+The quantum space jump played between the launcher and the globe: star field,
+particles, warp tunnel and flash, as a RenderHost scene. Kept out of
+continental_quest_app.py so the launcher can show its page without loading
+pygame; the render worker imports it when a launch needs it.
+"""
+
+import math
+import random
+
+import pygame
+
+import tracing
+from audio import get_audio
+from render_host import RenderHost, Scene
+from transition_timing import TRANSITION_PHASES, TRANSITION_DURATION
+from transition_runtime import (FixedTimestep, QualityGovernor, ScaledRenderTarget,
+                                configured_render_scale, requested_backend, TARGET_FPS)
+
+# Initialize pygame (we'll do this when needed)
+pygame_initialized = False
+
+# Enhanced Star class for light-speed travel
+class LightSpeedStar:
+    def __init__(self, screen_width, screen_height):
+        self.x = random.uniform(0, screen_width)
+        self.y = random.uniform(0, screen_height)
+        self.z = random.uniform(1, 1000)  # Far depth for 3D effect
+        self.original_z = self.z
+        self.prev_x, self.prev_y, self.prev_z = self.x, self.y, self.z
+        self.speed = 0
+        self.trail_length = 0
+        self.brightness = random.uniform(0.3, 1.0)
+        self.color_variant = random.choice([
+            (255, 255, 255),
+            (200, 220, 255),
+            (255, 240, 200),
+            (220, 255, 220),
+            (255, 200, 255)
+        ])
+        
+    def update(self, warp_speed=1.0, progress=0.0, screen_width=1200, screen_height=800):
+        """Advance the star by one fixed simulation step"""
+        self.prev_x, self.prev_y, self.prev_z = self.x, self.y, self.z
+        
+        # Calculate speed based on warp factor - exponential increase
+        base_speed = max(1, warp_speed ** 2.5)
+        self.speed = base_speed * (1 + progress * 15)
+        
+        # Move star toward camera (z-axis movement)
+        self.z -= self.speed
+        
+        # Trail length increases with speed
+        self.trail_length = min(200, self.speed * 2)
+        
+        # Reset star when it passes the camera
+        if self.z <= 1:
+            self.z = random.uniform(800, 1000)
+            self.x = random.uniform(0, screen_width)
+            self.y = random.uniform(0, screen_height)
+            # Don't interpolate across the wrap-around
+            self.prev_x, self.prev_y, self.prev_z = self.x, self.y, self.z
+    
+    def project(self, surface_size, warp_speed=1.0, screen_width=1200, screen_height=800,
+                interpolation=1.0, low_detail=False, trail_segments=20, pixel_scale=1.0):
+        """Return (screen_x, screen_y, size, color, brightness, trail_points), or None if not visible
+        
+        Shared by the software renderer below and the OpenGL backend in transition_gl.py.
+        """
+        current_width, current_height = surface_size
+        
+        # Interpolate between the last two simulation steps
+        x = self.prev_x + (self.x - self.prev_x) * interpolation
+        y = self.prev_y + (self.y - self.prev_y) * interpolation
+        z = self.prev_z + (self.z - self.prev_z) * interpolation
+        
+        # Calculate screen position with perspective projection
+        if z <= 0:
+            return None
+            
+        # Perspective calculation (pixel_scale maps onto a reduced-resolution canvas)
+        scale = 500.0 / z * pixel_scale
+        screen_x = int(current_width/2 + (x - screen_width/2) * scale)
+        screen_y = int(current_height/2 + (y - screen_height/2) * scale)
+        
+        # Skip if off screen (with margin for trails)
+        if (screen_x < -100 or screen_x > current_width + 100 or 
+            screen_y < -100 or screen_y > current_height + 100):
+            return None
+            
+        # Calculate star size based on distance
+        size = max(1, int(scale * 2))
+        
+        # Calculate brightness based on distance and base brightness
+        distance_brightness = min(1.0, (1000 - z) / 1000)
+        final_brightness = self.brightness * distance_brightness
+        
+        # Color with brightness
+        color = (
+            int(self.color_variant[0] * final_brightness),
+            int(self.color_variant[1] * final_brightness),
+            int(self.color_variant[2] * final_brightness)
+        )
+        
+        # Light-speed trail
+        trail_points = []
+        if self.trail_length > 5 and warp_speed > 2:
+            num_trail_points = min(trail_segments, max(5, int(self.trail_length / 10)))
+            if low_detail:
+                num_trail_points = 2
+            
+            for i in range(num_trail_points):
+                # Calculate trail position
+                trail_z = z + (i * self.speed / num_trail_points)
+                if trail_z > 0:
+                    trail_scale = 500.0 / trail_z * pixel_scale
+                    trail_x = int(current_width/2 + (x - screen_width/2) * trail_scale)
+                    trail_y = int(current_height/2 + (y - screen_height/2) * trail_scale)
+                    trail_points.append((trail_x, trail_y))
+        
+        return screen_x, screen_y, size, color, final_brightness, trail_points
+    
+    def draw(self, surface, warp_speed=1.0, screen_width=1200, screen_height=800,
+             interpolation=1.0, low_detail=False, trail_segments=20, glow_rings=4,
+             pixel_scale=1.0):
+        projected = self.project(surface.get_size(), warp_speed, screen_width, screen_height,
+                                 interpolation, low_detail, trail_segments, pixel_scale)
+        if projected is None:
+            return
+        screen_x, screen_y, size, color, final_brightness, trail_points = projected
+        
+        # Draw trail as connected lines with fading alpha
+        if len(trail_points) > 1:
+            for i in range(len(trail_points) - 1):
+                alpha = int(255 * final_brightness * (1 - i / len(trail_points)) * 0.7)
+                trail_color = (
+                    min(255, color[0] + 50),
+                    min(255, color[1] + 30),
+                    min(255, color[2])
+                )
+                
+                if alpha > 10:
+                    try:
+                        pygame.draw.line(surface, trail_color, 
+                                       trail_points[i], trail_points[i + 1], 
+                                       max(1, size))
+                    except:
+                        pass
+        
+        # Draw main star with glow effect (skipped while the loop is behind)
+        if size >= 2 and not low_detail:
+            # Outer glow
+            for glow_size in range(size + glow_rings, size, -1):
+                glow_alpha = max(10, int(final_brightness * 100 * (size + 4 - glow_size) / 4))
+                glow_color = (
+                    min(255, color[0] + glow_alpha // 3),
+                    min(255, color[1] + glow_alpha // 4),
+                    min(255, color[2] + glow_alpha // 5)
+                )
+                try:
+                    pygame.draw.circle(surface, glow_color, (screen_x, screen_y), glow_size)
+                except:
+                    pass
+        
+        # Main star
+        try:
+            pygame.draw.circle(surface, color, (screen_x, screen_y), size)
+            
+            # Bright center for larger stars
+            if size > 2:
+                center_color = (
+                    min(255, color[0] + 100),
+                    min(255, color[1] + 100),
+                    min(255, color[2] + 100)
+                )
+                pygame.draw.circle(surface, center_color, (screen_x, screen_y), max(1, size // 2))
+        except:
+            pass
+
+# Enhanced Particle class for quantum effects
+class QuantumParticle:
+    def __init__(self, x, y, screen_width, screen_height, particle_type="energy"):
+        self.x = x
+        self.y = y
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.particle_type = particle_type
+        
+        if particle_type == "energy":
+            self.speed = random.uniform(3, 12)
+            angle = random.uniform(0, 2 * math.pi)
+            self.dx = math.cos(angle) * self.speed
+            self.dy = math.sin(angle) * self.speed
+            self.life = random.uniform(60, 120)
+            self.max_life = self.life
+            self.color = random.choice([(0, 255, 255), (0, 100, 255), (128, 0, 128), (255, 255, 255)])
+        elif particle_type == "quantum":
+            self.speed = random.uniform(8, 25)
+            angle = random.uniform(0, 2 * math.pi)
+            self.dx = math.cos(angle) * self.speed
+            self.dy = math.sin(angle) * self.speed
+            self.life = random.uniform(40, 90)
+            self.max_life = self.life
+            self.color = random.choice([(255, 215, 0), (255, 165, 0), (255, 255, 255), (0, 255, 255)])
+        else:
+            self.speed = random.uniform(1, 8)
+            angle = random.uniform(0, 2 * math.pi)
+            self.dx = math.cos(angle) * self.speed
+            self.dy = math.sin(angle) * self.speed
+            self.life = random.uniform(30, 80)
+            self.max_life = self.life
+            self.color = (255, 255, 255)
+        
+        self.decay = random.uniform(0.5, 1.5)
+        self.size = random.uniform(1, 3)
+        self.pulse_phase = random.uniform(0, math.pi * 2)
+        self.prev_x, self.prev_y = self.x, self.y
+        
+    def update(self):
+        """Advance the particle by one fixed simulation step"""
+        self.prev_x, self.prev_y = self.x, self.y
+        self.x += self.dx
+        self.y += self.dy
+        self.life -= self.decay
+        
+        # Gentle acceleration toward center
+        center_x = self.screen_width / 2
+        center_y = self.screen_height / 2
+        
+        to_center_x = center_x - self.x
+        to_center_y = center_y - self.y
+        distance = math.sqrt(to_center_x**2 + to_center_y**2)
+        
+        if distance > 0:
+            force = 0.1
+            self.dx += (to_center_x / distance) * force
+            self.dy += (to_center_y / distance) * force
+        
+        # Slight friction
+        self.dx *= 0.998
+        self.dy *= 0.998
+        
+        # Update pulse
+        self.pulse_phase += 0.1
+        
+    def project(self, interpolation=1.0, pixel_scale=1.0):
+        """Return (x, y, size, color) to draw, or None if the particle is invisible"""
+        if self.life > 0:
+            life_ratio = self.life / self.max_life
+            pulse = math.sin(self.pulse_phase) * 0.3 + 0.7
+            alpha = int(255 * life_ratio * pulse)
+            size = int(self.size * life_ratio * pulse * pixel_scale)
+            
+            # Interpolate between the last two simulation steps
+            x = int((self.prev_x + (self.x - self.prev_x) * interpolation) * pixel_scale)
+            y = int((self.prev_y + (self.y - self.prev_y) * interpolation) * pixel_scale)
+            
+            # Color with life fade
+            color = (
+                min(255, int(self.color[0] * life_ratio)),
+                min(255, int(self.color[1] * life_ratio)),
+                min(255, int(self.color[2] * life_ratio))
+            )
+            
+            if size > 0 and alpha > 10:
+                return x, y, size, color
+        return None
+    
+    def draw(self, surface, interpolation=1.0, pixel_scale=1.0):
+        projected = self.project(interpolation, pixel_scale)
+        if projected is None:
+            return
+        x, y, size, color = projected
+        
+        try:
+            # Glow effect
+            if size > 1:
+                glow_color = (color[0] // 3, color[1] // 3, color[2] // 3)
+                pygame.draw.circle(surface, glow_color, (x, y), size + 2)
+            
+            pygame.draw.circle(surface, color, (x, y), size)
+        except:
+            pass
+
+def create_warp_tunnel_effect(surface, progress, screen_width, screen_height, pixel_scale=1.0):
+    """Create tunnel effect for light speed travel"""
+    current_width, current_height = surface.get_size()
+    center_x, center_y = current_width // 2, current_height // 2
+    
+    # Create multiple concentric circles moving outward
+    for ring in range(8):
+        ring_progress = (progress + ring * 0.1) % 1.0
+        radius = int(ring_progress * max(current_width, current_height) * 1.5)
+        
+        if radius > 10:
+            alpha = int(100 * (1 - ring_progress) * progress)
+            color = (alpha // 2, alpha // 3, alpha)
+            
+            if alpha > 5:
+                try:
+                    pygame.draw.circle(surface, color, (center_x, center_y), radius,
+                                       max(1, int(round(3 * pixel_scale))))
+                except:
+                    pass
+
+def create_hyperspace_grid(surface, progress, time_factor, screen_width, screen_height, pixel_scale=1.0):
+    """Create moving grid lines for hyperspace effect"""
+    current_width, current_height = surface.get_size()
+    
+    # Vertical lines moving horizontally
+    for i in range(-5, 15):
+        x_offset = ((time_factor * 200 + i * 100) % (current_width / pixel_scale + 200) - 100) * pixel_scale
+        alpha = int(50 * progress * math.sin(time_factor + i) * 0.5 + 25)
+        
+        if alpha > 5:
+            color = (alpha, alpha // 2, alpha + 20)
+            try:
+                pygame.draw.line(surface, color, 
+                               (x_offset, 0), (x_offset, current_height), 1)
+            except:
+                pass
+    
+    # Horizontal lines moving vertically
+    for i in range(-3, 10):
+        y_offset = ((time_factor * 150 + i * 120) % (current_height / pixel_scale + 240) - 120) * pixel_scale
+        alpha = int(40 * progress * math.cos(time_factor + i) * 0.5 + 20)
+        
+        if alpha > 5:
+            color = (alpha, alpha // 3, alpha + 15)
+            try:
+                pygame.draw.line(surface, color, 
+                               (0, y_offset), (current_width, y_offset), 1)
+            except:
+                pass
+
+def create_screen_flash(surface, intensity, screen_width, screen_height):
+    """Create screen flash effect"""
+    if intensity > 0:
+        current_width, current_height = surface.get_size()
+        flash_surface = pygame.Surface((current_width, current_height))
+        
+        # White flash with blue tint
+        flash_color = (
+            min(255, int(intensity * 255)),
+            min(255, int(intensity * 255)),
+            min(255, int(intensity * 255 * 1.2))
+        )
+        
+        flash_surface.fill(flash_color)
+        flash_surface.set_alpha(int(intensity * 200))
+        surface.blit(flash_surface, (0, 0))
+
+def transition_phase(elapsed, phase_timings=TRANSITION_PHASES):
+    """Return (phase, progress, warp_speed, flash_intensity) at elapsed milliseconds"""
+    flash_intensity = 0.0
+    
+    if elapsed < phase_timings["acceleration"]:
+        # Phase 1: Gradual acceleration
+        phase = "acceleration"
+        progress = elapsed / phase_timings["acceleration"]
+        warp_speed = 1 + progress * 4  # Speed up to 5x
+        
+    elif elapsed < phase_timings["acceleration"] + phase_timings["lightspeed"]:
+        # Phase 2: Light speed travel
+        phase = "lightspeed"
+        phase_elapsed = elapsed - phase_timings["acceleration"]
+        progress = phase_elapsed / phase_timings["lightspeed"]
+        warp_speed = 5 + progress * 15  # Speed up to 20x
+        
+    elif elapsed < phase_timings["acceleration"] + phase_timings["lightspeed"] + phase_timings["flash"]:
+        # Phase 3: Flash
+        phase = "flash"
+        phase_elapsed = elapsed - phase_timings["acceleration"] - phase_timings["lightspeed"]
+        progress = phase_elapsed / phase_timings["flash"]
+        warp_speed = 20 + progress * 30  # Max speed
+        flash_intensity = math.sin(progress * math.pi) * 0.8
+        
+    else:
+        # Phase 4: Arrival
+        phase = "arrival"
+        phase_elapsed = elapsed - phase_timings["acceleration"] - phase_timings["lightspeed"] - phase_timings["flash"]
+        progress = phase_elapsed / phase_timings["arrival"]
+        warp_speed = max(1, 50 - progress * 49)  # Slow down
+        flash_intensity = max(0, 0.8 - progress * 0.8)
+    
+    return phase, progress, warp_speed, flash_intensity
+
+class TransitionField:
+    """Star field and quantum particles of the transition (everything except the flash overlay)"""
+    
+    def __init__(self, screen_width, screen_height, star_count=400):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.stars = [LightSpeedStar(screen_width, screen_height) for _ in range(star_count)]
+        self.particles = []
+    
+    def step(self, phase, progress, warp_speed, area_size, quality):
+        """Advance stars and particles by one fixed simulation step"""
+        area_width, area_height = area_size
+        
+        # Add subtle quantum particles during acceleration and lightspeed
+        if phase in ["acceleration", "lightspeed"] and random.random() < quality["particle_spawn_rate"]:
+            self.particles.append(QuantumParticle(
+                random.randint(0, area_width),
+                random.randint(0, area_height),
+                self.screen_width, self.screen_height,
+                "quantum" if random.random() < 0.7 else "energy"
+            ))
+        
+        self.particles = [p for p in self.particles if p.life > 0]
+        for particle in self.particles:
+            particle.update()
+        
+        star_progress = progress if phase == "lightspeed" else 0
+        for star in self.stars[:quality["star_count"]]:
+            star.update(warp_speed, star_progress, self.screen_width, self.screen_height)
+    
+    def draw(self, canvas, phase, progress, warp_speed, time_factor, quality,
+             interpolation=1.0, low_detail=False, pixel_scale=1.0):
+        """Draw one frame of the field onto canvas"""
+        # Fill screen with deep space
+        canvas.fill((0, 0, 0))
+        
+        # Draw particles
+        for particle in self.particles:
+            particle.draw(canvas, interpolation, pixel_scale)
+        
+        # Create hyperspace grid effect during lightspeed
+        if phase == "lightspeed":
+            create_hyperspace_grid(canvas, min(1.0, warp_speed / 10), time_factor,
+                                   self.screen_width, self.screen_height, pixel_scale)
+        
+        # Create warp tunnel during flash phase
+        if phase == "flash":
+            create_warp_tunnel_effect(canvas, progress, self.screen_width, self.screen_height, pixel_scale)
+        
+        # Draw stars
+        for star in self.stars[:quality["star_count"]]:
+            star.draw(canvas, warp_speed, self.screen_width, self.screen_height, interpolation, low_detail,
+                      quality["trail_segments"], quality["glow_rings"], pixel_scale)
+
+def ensure_transition_audio():
+    """Initialise pygame and make sure the background music is playing"""
+    global pygame_initialized
+    
+    # Initialize pygame if not already done
+    if not pygame_initialized:
+        pygame.init()
+        pygame_initialized = True
+    
+    # Music should already be playing from the launcher; this only starts it if not
+    audio = get_audio()
+    if audio.is_playing('launcher'):
+        print("🎵 Music already playing, continuing...")
+    elif audio.play('launcher'):
+        print("🎵 Background music started in transition (final.mp3)")
+
+class TransitionScene(Scene):
+    """The quantum space jump as a RenderHost scene
+    
+    Draws with OpenGL (transition_gl.py) when the host window has a GL context
+    and with pygame.draw otherwise; CQ_TRANSITION_BACKEND=software forces the
+    latter. render_scale draws the software effect at a fraction of the window
+    resolution and upscales it; None picks it from the resolution, quality
+    governor and the CQ_RENDER_SCALE environment variable. If a baked copy of
+    the sequence is cached (see transition_bake.py) it is played back instead.
+    """
+    
+    frame_rate = TARGET_FPS
+    
+    def __init__(self, continent_name, render_scale=None):
+        self.continent_name = continent_name
+        self.caption = f"Quantum Jump to {continent_name}"
+        self.render_scale = render_scale
+    
+    def enter(self, host):
+        self.host = host
+        
+        # Prefer the GPU; reopen the window in software mode if GL drawing isn't possible
+        self.gl_renderer = None
+        if host.opengl and requested_backend() != "software":
+            try:
+                from transition_gl import GLTransitionRenderer
+                self.gl_renderer = GLTransitionRenderer(*host.size, resources=host.gl)
+            except Exception as e:
+                print(f"⚠️ OpenGL transition unavailable, using software rendering: {e}")
+        if self.gl_renderer is None:
+            host.open(opengl=False)
+        
+        # The star field is spread over the whole display, like the original full-screen effect
+        self.screen_width, self.screen_height = host.desktop_size
+        
+        # Use a pre-baked copy of the sequence when one is cached for this window and desktop size
+        self.baked = None
+        try:
+            import transition_bake
+            self.baked = transition_bake.open_for_playback(*host.size, field_size=host.desktop_size)
+        except Exception as e:
+            print(f"⚠️ Baked transition unavailable, rendering live: {e}")
+        
+        # Scales star count, trails, glows and particles to hold the frame rate
+        self.governor = QualityGovernor()
+        self.quality = self.governor.params
+        
+        # Create light-speed star field (the governor decides how many stars are active)
+        self.field = None
+        if self.baked is None:
+            self.field = TransitionField(self.screen_width, self.screen_height, self.governor.max_star_count)
+        
+        # Large windows draw into a smaller canvas that gets upscaled once per frame (software only)
+        self.render_target = ScaledRenderTarget(
+            self.render_scale if self.render_scale is not None else configured_render_scale())
+        
+        # Animation variables
+        self.start_time = pygame.time.get_ticks()
+        self.elapsed = 0
+        self.time_factor = 0
+        self.timestep = FixedTimestep()
+        self.state = transition_phase(0)
+    
+    def handle_event(self, event):
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.VIDEORESIZE and self.gl_renderer is not None:
+            self.gl_renderer.resize(event.w, event.h)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return False
+            elif event.key == pygame.K_SPACE:
+                # Skip to flash phase
+                self.start_time = pygame.time.get_ticks() - (TRANSITION_PHASES["acceleration"] + TRANSITION_PHASES["lightspeed"])
+        return True
+    
+    def _area_size(self):
+        if self.gl_renderer is not None:
+            return self.gl_renderer.width, self.gl_renderer.height
+        return self.host.screen.get_size()
+    
+    def update(self, dt):
+        self.elapsed = pygame.time.get_ticks() - self.start_time
+        self.time_factor += dt
+        
+        # Measure busy time (without the frame cap delay) and adapt detail to it
+        self.governor.record_frame(self.host.clock.get_rawtime() / 1000.0, dt)
+        self.quality = self.governor.params
+        
+        # Calculate current phase and progress
+        self.state = transition_phase(self.elapsed)
+        phase, progress, warp_speed, _ = self.state
+        
+        # Advance the simulation in fixed steps so motion doesn't depend on frame rate
+        if self.field is not None:
+            for _ in range(self.timestep.advance(dt)):
+                self.field.step(phase, progress, warp_speed, self._area_size(), self.quality)
+        
+        # Exit after arrival phase
+        return self.elapsed <= TRANSITION_DURATION
+    
+    def draw(self):
+        phase, progress, warp_speed, flash_intensity = self.state
+        
+        if self.gl_renderer is not None:
+            # GPU path: same simulation, drawn as point sprites and line strips
+            if self.baked is not None:
+                self.gl_renderer.draw_surface(self.baked.frame_at(self.elapsed))
+            else:
+                self.gl_renderer.draw_field(self.field, phase, progress, warp_speed, self.time_factor,
+                                            self.quality, self.timestep.alpha, self.timestep.low_detail)
+            self.gl_renderer.draw_flash(flash_intensity)
+            return
+        
+        screen = self.host.screen
+        if self.baked is not None:
+            # Playback: show the stored frame for this point on the clock
+            canvas = screen
+            self.baked.draw(screen, self.elapsed)
+        else:
+            # Pick this frame's canvas (the window itself, or a reduced-resolution copy)
+            canvas = self.render_target.begin(screen, self.quality["render_scale"])
+            self.field.draw(canvas, phase, progress, warp_speed, self.time_factor, self.quality,
+                            self.timestep.alpha, self.timestep.low_detail, self.render_target.scale)
+        
+        # Screen flash effect (always composited live, baked frames don't include it)
+        if flash_intensity > 0:
+            create_screen_flash(canvas, flash_intensity, self.screen_width, self.screen_height)
+        
+        if self.baked is None:
+            self.render_target.present(screen)
+    
+    def exit(self):
+        if self.gl_renderer is not None:
+            self.gl_renderer.release()
+        if self.baked is not None:
+            self.baked.close()
+        else:
+            self.governor.log_summary(f"Transition to {self.continent_name}")
+            if self.timestep.dropped_steps:
+                print(f"⚠️ Transition fell behind: skipped {self.timestep.dropped_steps} simulation steps")
+
+@tracing.traced("quantum transition")
+def run_quantum_transition(continent_name, render_scale=None, host=None, music=True):
+    """Run the quantum space jump transition animation
+    
+    Pass a RenderHost to play it inside an existing window (the globe then
+    takes over the same window); otherwise a window is opened and closed here.
+    music=False leaves audio alone (e.g. in the render worker, where the
+    launcher process is the one playing it).
+    """
+    if music:
+        ensure_transition_audio()
+    
+    own_host = host is None
+    if own_host:
+        # Set up display (start windowed for controls), on the GPU if possible
+        host = RenderHost((1200, 800), opengl=requested_backend() != "software")
+    
+    host.run(TransitionScene(continent_name, render_scale))
+    
+    if own_host:
+        host.close()
+        # Don't stop the music when quantum transition ends - it should continue
+        # (pygame and its mixer stay initialised, so the decoded tracks stay loaded)
+    return True
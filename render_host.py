@@ -0,0 +1,276 @@
+"""
+Continental Quest - Render Host
+One pygame window and OpenGL context shared by every scene of a session
+(quantum transition, 3D globe), so switching scenes never tears the window down
+"""
+
+import time
+
+import pygame
+
+import sampling_profiler
+import telemetry
+import tracing
+
+DEFAULT_SIZE = (1200, 800)
+GL_FLAGS = pygame.OPENGL | pygame.DOUBLEBUF | pygame.RESIZABLE
+SOFTWARE_FLAGS = pygame.RESIZABLE
+
+# Handoffs are reported in frames of this rate
+HANDOFF_REFERENCE_FPS = 60
+
+# How often a paused scene checks for events and commands
+PAUSED_POLL_INTERVAL = 0.05
+
+# Starts (or stops) a sampling profile of whatever scene is running
+PROFILE_KEY = pygame.K_F9
+
+
+class Scene:
+    """Base class for anything a RenderHost can show"""
+
+    caption = "Continental Quest"
+    frame_rate = 60  # 0 = uncapped
+
+    def enter(self, host):
+        """Create resources and set up GL state (the window is already open)"""
+        self.host = host
+
+    def handle_event(self, event):
+        """Handle one pygame event; return False to end the scene"""
+        return event.type != pygame.QUIT
+
+    def update(self, dt):
+        """Advance by dt seconds; return False to end the scene after this frame"""
+        return True
+
+    def draw(self):
+        """Render one frame (the host flips the display)"""
+
+    def suspend(self):
+        """Called instead of exit() when the scene stays resident after it ends"""
+
+    def resume(self):
+        """Called instead of enter() when a resident scene is shown again"""
+
+    def exit(self):
+        """Release what enter() created"""
+
+
+class RenderHost:
+    """Owns the window for a whole session and runs scenes in it one after another"""
+
+    def __init__(self, size=DEFAULT_SIZE, opengl=True):
+        self.size = size
+        self.opengl = opengl
+        self.screen = None
+        self.clock = None
+        self.desktop_size = None
+        self.display_inits = 0
+        self.last_flip = None
+        self.last_scene = None
+        self.handoffs = []
+        self.resident = []  # scenes entered but kept alive (GPU resources still loaded)
+        self.hidden = False
+        self.paused = False
+        self.current = None
+        # Called once per frame while a scene runs; returning False ends the scene
+        self.command_handler = None
+        self.gl = None  # GLResources of the current GL context (see gl_resources.py)
+        self.interrupted = False  # whether the last run() was ended by command_handler
+
+    @property
+    def is_open(self):
+        return self.screen is not None
+
+    def open(self, opengl=None):
+        """Open the window, or switch it between OpenGL and software mode if needed"""
+        if opengl is None:
+            opengl = self.opengl
+        if self.screen is not None and opengl == self.opengl:
+            return self.screen
+
+        if not pygame.get_init():
+            pygame.init()
+        if not pygame.display.get_init():
+            pygame.display.init()
+        if self.desktop_size is None:
+            info = pygame.display.Info()
+            self.desktop_size = (info.current_w, info.current_h)
+
+        if self.screen is not None:
+            print(f"⚠️ Re-creating the window in {'OpenGL' if opengl else 'software'} mode")
+            # Resident scenes hold resources of the old context (which is still current
+            # here): exit them now, so the next run() enters them again instead of resuming
+            for scene in list(self.resident):
+                self.release(scene)
+        if self.gl is not None:
+            # Whatever was uploaded went away with the old context
+            self.gl.context_lost()
+            self.gl = None
+        try:
+            self.screen = pygame.display.set_mode(self.size, GL_FLAGS if opengl else SOFTWARE_FLAGS)
+        except pygame.error as e:
+            if not opengl:
+                raise
+            print(f"⚠️ OpenGL window unavailable, using software rendering: {e}")
+            opengl = False
+            self.screen = pygame.display.set_mode(self.size, SOFTWARE_FLAGS)
+        self.opengl = opengl
+        if opengl:
+            import gl_resources
+            self.gl = gl_resources.GLResources(f"window {self.display_inits + 1}")
+            gl_resources.set_current(self.gl)
+        self.display_inits += 1
+        self.clock = pygame.time.Clock()
+        return self.screen
+
+    def run(self, scene, keep_resident=False, started_at=None):
+        """Show scene until it ends
+
+        keep_resident leaves the scene loaded afterwards so the next run() only
+        resumes it. started_at (a time.perf_counter() value) measures the first
+        frame from that moment instead of from the previous scene's last frame.
+        """
+        self.open()
+        if started_at is not None:
+            handoff_start, handoff_from = started_at, "request"
+        elif self.last_flip is not None:
+            handoff_start, handoff_from = self.last_flip, type(self.last_scene).__name__
+        else:
+            handoff_start, handoff_from = time.perf_counter(), None
+        pygame.display.set_caption(scene.caption)
+        scene_name = type(scene).__name__
+        tracing.begin(scene_name)
+        if scene in self.resident:
+            scene.resume()
+        else:
+            with tracing.span(f"{scene_name}.enter"):
+                scene.enter(self)
+            self.resident.append(scene)
+
+        first_frame = True
+        frame_stats = telemetry.FrameStats()
+        self.current = scene
+        self.interrupted = False
+        sampling_profiler.start_from_env(scene_name)
+        try:
+            running = True
+            while running:
+                dt = self.clock.tick(scene.frame_rate) / 1000.0
+
+                if self.command_handler is not None and self.command_handler() is False:
+                    running = False
+                    self.interrupted = True
+
+                for event in pygame.event.get():
+                    if event.type == pygame.VIDEORESIZE:
+                        self.size = (event.w, event.h)
+                    elif event.type == pygame.KEYDOWN and event.key == PROFILE_KEY:
+                        sampling_profiler.toggle(scene_name)
+                        continue
+                    if scene.handle_event(event) is False:
+                        running = False
+
+                # Paused: stay responsive but stop simulating and drawing
+                if self.paused and running:
+                    time.sleep(PAUSED_POLL_INTERVAL)
+                    continue
+
+                if scene.update(dt) is False:
+                    running = False
+
+                scene.draw()
+                pygame.display.flip()
+
+                now = time.perf_counter()
+                if first_frame:
+                    self._record_handoff(handoff_from, scene, handoff_start, now)
+                    first_frame = False
+                else:
+                    frame_stats.add(dt)
+                self.last_flip = now
+        finally:
+            self.current = None
+            if keep_resident:
+                scene.suspend()
+            else:
+                self.release(scene)
+            self.last_scene = scene
+            tracing.end(scene_name)
+            if frame_stats.frames:
+                gl_mb = self.gl.stats()["mb"] if self.gl is not None else None
+                telemetry.record("scene", scene=scene_name, gl_mb=gl_mb, **frame_stats.summary())
+
+    def release(self, scene):
+        """Exit a resident scene and free its resources"""
+        if scene in self.resident:
+            self.resident.remove(scene)
+            scene.exit()
+            if self.gl is not None:
+                self.gl.check_owner(scene)
+
+    def _record_handoff(self, source, scene, start, first_flip):
+        """Time from the previous scene's last frame (or a launch request) to this scene's first frame"""
+        handoff_ms = (first_flip - start) * 1000.0
+        handoff = {
+            "from": source,
+            "to": type(scene).__name__,
+            "ms": round(handoff_ms, 1),
+            "frames": round(handoff_ms * HANDOFF_REFERENCE_FPS / 1000.0, 1),
+        }
+        self.handoffs.append(handoff)
+        tracing.instant("first frame", scene=handoff["to"], handoff_from=source, handoff_ms=handoff["ms"])
+        if source:
+            print(f"⏱️ Scene handoff {handoff['from']} → {handoff['to']}: "
+                  f"{handoff['ms']:.1f} ms ({handoff['frames']:.1f} frames)")
+        return handoff
+
+    def _window(self):
+        """SDL window handle for show/hide, or None on pygame builds without _sdl2"""
+        try:
+            from pygame._sdl2.video import Window
+            return Window.from_display_module()
+        except Exception:
+            return None
+
+    def hide(self):
+        """Hide the window but keep it (and its GL context) alive"""
+        if self.screen is None or self.hidden:
+            return
+        window = self._window()
+        if window is not None:
+            window.hide()
+        else:
+            pygame.display.iconify()
+        self.hidden = True
+        self.last_flip = None
+
+    def show(self):
+        """Bring a hidden window back"""
+        if self.screen is None or not self.hidden:
+            return
+        window = self._window()
+        if window is not None:
+            window.show()
+            window.focus()
+        # Drop input that queued up while the window was hidden
+        pygame.event.clear()
+        self.hidden = False
+
+    def idle(self):
+        """Keep a hidden window responsive to the OS without drawing"""
+        if self.screen is not None:
+            pygame.event.pump()
+
+    def close(self):
+        """Release resident scenes and close the window (pygame and the mixer stay initialised)"""
+        for scene in list(self.resident):
+            self.release(scene)
+        if self.gl is not None:
+            self.gl.shutdown()
+            self.gl = None
+        if self.screen is not None:
+            pygame.display.quit()
+            self.screen = None
+        self.hidden = False
@@ -0,0 +1,399 @@
+"""
+Continental Quest - Render Worker
+Runs the transition and 3D globe in a dedicated process, so the GL render loop
+never competes with the webview's JS bridge for the launcher's GIL.
+
+The launcher talks to it over a multiprocessing pipe:
+    commands  (launcher -> worker): launch, focus, set_difficulty, pause, resume, ping, quit
+    events    (worker -> launcher): ready, pong, transition_done, globe_shown,
+                                    globe_hidden, game_started, game_finished,
+                                    error, stopped
+Every message is a (name, dict) tuple.
+
+Set CQ_RENDER_WORKER=thread to run the same session on a thread in-process.
+"""
+
+import multiprocessing
+import os
+import queue
+import statistics
+import threading
+import time
+
+import tracing
+
+# Commands
+LAUNCH = "launch"
+FOCUS = "focus"
+SET_DIFFICULTY = "set_difficulty"
+PAUSE = "pause"
+RESUME = "resume"
+PING = "ping"
+QUIT = "quit"
+
+# Events
+READY = "ready"
+PONG = "pong"
+TRANSITION_DONE = "transition_done"
+GLOBE_SHOWN = "globe_shown"
+GLOBE_HIDDEN = "globe_hidden"
+GAME_STARTED = "game_started"
+GAME_FINISHED = "game_finished"
+ERROR = "error"
+STOPPED = "stopped"
+
+LATENCY_SAMPLES = 200
+LATENCY_BUDGET = 0.001  # 1 ms round trip
+
+# Commands that only set state: applied as they arrive instead of waiting for
+# the GL thread's once-per-frame drain (see GlobeSession.submit)
+IMMEDIATE_COMMANDS = (PING, SET_DIFFICULTY, PAUSE, RESUME)
+
+
+class GlobeSession:
+    """Serves launcher commands with one warm RenderHost: transition, globe, hide, repeat
+
+    Between launches the window is hidden and the globe scene stays resident
+    (textures and quadric on the GPU), so a relaunch only has to show the
+    window and turn the camera.
+    """
+
+    def __init__(self, emit):
+        self.emit = emit
+        self.commands = queue.Queue()
+        self.host = None
+        self.scene = None
+        self.difficulty = "medium"
+        self.running = True
+        self._games = set()  # pids of launched games already reported
+
+    def submit(self, command, args):
+        """Take a command from any thread: apply it now if it doesn't touch GL, else queue it"""
+        if command in IMMEDIATE_COMMANDS and self._apply_now(command, args):
+            return
+        self.commands.put((command, args))
+
+    def _apply_now(self, command, args):
+        """State-only commands, safe off the GL thread; False if they have to wait for it"""
+        if command == PING:
+            self.emit(PONG, **args)
+        elif command == SET_DIFFICULTY:
+            self.difficulty = args["difficulty"]
+            scene = self.scene
+            if scene is not None:
+                scene.difficulty = self.difficulty
+        elif command in (PAUSE, RESUME):
+            host = self.host
+            if host is None:
+                return False  # not started yet; the queue applies it once it is
+            # The render loop reads this flag every frame
+            host.paused = command == PAUSE
+        return True
+
+    def run(self):
+        """Command loop; must run on the thread that owns the GL context"""
+        from render_host import RenderHost
+
+        self.host = RenderHost((1200, 800))
+        self.host.command_handler = self._poll_commands
+        try:
+            while self.running:
+                try:
+                    command, args = self.commands.get(timeout=0.1)
+                except queue.Empty:
+                    self.host.idle()
+                    self._watch_games()
+                    continue
+                if command == LAUNCH:
+                    self._launch(**args)
+                elif command == QUIT:
+                    self.running = False
+                else:
+                    self._apply(command, args)
+        finally:
+            if self.host is not None:
+                self.host.close()
+            self.scene = None
+            self.running = False
+            self.emit(STOPPED)
+
+    @tracing.traced("render worker launch")
+    def _launch(self, continent, transition=False, requested_at=None):
+        import globe
+        from quantum_transition import run_quantum_transition
+
+        host = self.host
+        host.show()
+        try:
+            assets = None
+            if transition:
+                # Decode and generate the globe's assets while the warp plays (unless it's still warm)
+                if self.scene is None:
+                    assets = globe.GlobeAssets().start()
+                try:
+                    # The launcher keeps playing its own music through the warp
+                    run_quantum_transition(continent, host=host, music=False)
+                finally:
+                    self.emit(TRANSITION_DONE, continent=continent)
+
+            # Reuse the resident globe when there is one, pointed at the requested continent
+            if self.scene is None:
+                self.scene = globe.GlobeScene(assets, continent)
+            else:
+                self.scene.continent = continent
+            self.scene.difficulty = self.difficulty
+
+            # requested_at is wall-clock time from the launcher process
+            started_at = None
+            if requested_at is not None and not transition:
+                started_at = time.perf_counter() - max(0.0, time.time() - requested_at)
+
+            self.emit(GLOBE_SHOWN, continent=continent)
+            globe.run_globe(host, self.scene, started_at=started_at, on_game=self._on_plugin_game)
+        except Exception as e:
+            print(f"❌ Globe error: {e}")
+            self.emit(ERROR, message=str(e))
+            # Start cold next time rather than reuse a half-initialised context
+            host.close()
+            self.scene = None
+        finally:
+            host.hide()
+            self.emit(GLOBE_HIDDEN, continent=continent)
+
+    def _apply(self, command, args):
+        """Commands that work whether or not the globe is showing"""
+        if command == FOCUS:
+            if self.scene is not None:
+                if self.host.current is self.scene:
+                    self.scene.focus_continent(args["continent"])
+                else:
+                    self.scene.continent = args["continent"]
+        elif command == SET_DIFFICULTY:
+            self.difficulty = args["difficulty"]
+            if self.scene is not None:
+                self.scene.difficulty = self.difficulty
+        elif command == PAUSE:
+            self.host.paused = True
+        elif command == RESUME:
+            self.host.paused = False
+
+    def _watch_games(self):
+        """Report games launched from the globe's markers as they start and finish"""
+        if self.scene is None:
+            return
+        for game in list(self.scene.games):
+            continent, process = game
+            if process.pid not in self._games:
+                self._games.add(process.pid)
+                self.emit(GAME_STARTED, continent=continent)
+            if process.poll() is not None:
+                self.scene.games.remove(game)
+                self._games.discard(process.pid)
+                self.emit(GAME_FINISHED, continent=continent, returncode=process.returncode)
+
+    def _on_plugin_game(self, continent, finished, returncode):
+        """Report games the globe runs in-process, like the ones it launches"""
+        if finished:
+            self.emit(GAME_FINISHED, continent=continent, returncode=returncode)
+        else:
+            self.emit(GAME_STARTED, continent=continent)
+
+    def _poll_commands(self):
+        """Drain commands once per frame while a scene is showing"""
+        self._watch_games()
+        while True:
+            try:
+                command, args = self.commands.get_nowait()
+            except queue.Empty:
+                return True
+            if command == QUIT:
+                self.running = False
+                return False
+            if command == LAUNCH:
+                # Already showing: just turn to the new continent
+                if args.get("transition"):
+                    self.emit(TRANSITION_DONE, continent=args["continent"])
+                self._apply(FOCUS, {"continent": args["continent"]})
+            else:
+                self._apply(command, args)
+
+
+def _listen(conn, session):
+    """Worker side: hand every command to the session (state-only ones apply at once)"""
+    while True:
+        try:
+            command, args = conn.recv()
+        except (EOFError, OSError):
+            session.submit(QUIT, {})
+            return
+        session.submit(command, args)
+        if command == QUIT:
+            return
+
+
+def worker_main(conn):
+    """Entry point of the render worker process"""
+    send_lock = threading.Lock()
+
+    def send(event, **data):
+        with send_lock:
+            try:
+                conn.send((event, data))
+            except (BrokenPipeError, OSError):
+                pass
+
+    tracing.set_process_name("render worker")
+    session = GlobeSession(send)
+    threading.Thread(target=_listen, args=(conn, session), name="worker-commands", daemon=True).start()
+    send(READY, pid=os.getpid())
+    # The GL loop runs on the worker's main thread
+    session.run()
+    tracing.finish()
+
+
+class RenderWorker:
+    """Launcher-side handle on the render worker
+
+    on_event(name, data) is called from a background thread for every event
+    except pongs.
+    """
+
+    def __init__(self, on_event=None, mode=None):
+        self.on_event = on_event
+        self.mode = mode or os.environ.get("CQ_RENDER_WORKER", "process").strip().lower()
+        self.process = None
+        self.session = None
+        self.conn = None
+        self.ready = threading.Event()
+        self.latency = {}  # label -> round-trip stats (see measure_latency)
+        self._send_lock = threading.Lock()
+        self._pings = {}
+        self._ping_id = 0
+        self._stopped = False
+
+    @property
+    def out_of_process(self):
+        return self.process is not None
+
+    def start(self):
+        """Start the worker (returns immediately; 'ready' arrives once it is up)"""
+        if self.mode != "thread":
+            try:
+                context = multiprocessing.get_context("spawn")
+                self.conn, child_conn = context.Pipe()
+                self.process = context.Process(target=worker_main, args=(child_conn,),
+                                               name="cq-render-worker", daemon=True)
+                self.process.start()
+                child_conn.close()
+                threading.Thread(target=self._read_events, name="render-events", daemon=True).start()
+                print(f"🖥️ Render worker process started (pid {self.process.pid})")
+                return self
+            except Exception as e:
+                print(f"⚠️ Could not start render worker process, rendering in-process: {e}")
+                self.process = None
+                self.conn = None
+
+        self.session = GlobeSession(self._dispatch)
+        threading.Thread(target=self.session.run, name="globe-host", daemon=True).start()
+        self._dispatch(READY, pid=os.getpid())
+        return self
+
+    def is_alive(self):
+        if self.process is not None:
+            return self.process.is_alive()
+        return self.session is not None and self.session.running
+
+    def send(self, command, **args):
+        """Send a command without waiting for anything back"""
+        if self.session is not None:
+            self.session.submit(command, args)
+            return
+        with self._send_lock:
+            self.conn.send((command, args))
+
+    def _read_events(self):
+        while True:
+            try:
+                event, data = self.conn.recv()
+            except (EOFError, OSError):
+                self._dispatch(STOPPED)
+                return
+            self._dispatch(event, **data)
+
+    def _dispatch(self, event, **data):
+        if event == PONG:
+            waiter = self._pings.pop(data.get("id"), None)
+            if waiter is not None:
+                waiter.set()
+            return
+        if event == STOPPED:
+            # Reported by the worker and again when its pipe closes
+            if self._stopped:
+                return
+            self._stopped = True
+        if event == READY:
+            self.ready.set()
+            threading.Thread(target=self.measure_latency, args=("idle",), name="render-latency",
+                             daemon=True).start()
+        elif event == GLOBE_SHOWN and "globe" not in self.latency:
+            # Once per worker: the figure that matters, with the render loop busy on the GL thread
+            self.latency["globe"] = None
+            threading.Thread(target=self.measure_latency, args=("globe",), name="render-latency",
+                             daemon=True).start()
+        if self.on_event is not None:
+            try:
+                self.on_event(event, data)
+            except Exception as e:
+                print(f"⚠️ Render event handler failed for {event}: {e}")
+
+    def ping(self, timeout=1.0):
+        """Round-trip time of one command, in seconds (None on timeout)"""
+        with self._send_lock:
+            self._ping_id += 1
+            ping_id = self._ping_id
+        waiter = threading.Event()
+        self._pings[ping_id] = waiter
+        start = time.perf_counter()
+        try:
+            self.send(PING, id=ping_id)
+        except (BrokenPipeError, OSError):
+            self._pings.pop(ping_id, None)
+            return None
+        if not waiter.wait(timeout):
+            self._pings.pop(ping_id, None)
+            return None
+        return time.perf_counter() - start
+
+    def measure_latency(self, label="idle", samples=LATENCY_SAMPLES):
+        """Ping the worker repeatedly and report the command round-trip latency
+
+        Pings take the same path as set_difficulty, pause and resume: the pipe
+        and GlobeSession.submit on the worker's command thread, never waiting
+        for a frame. Commands that need the GL thread (launch, focus) still do.
+        """
+        times = [t for t in (self.ping() for _ in range(samples)) if t is not None]
+        if not times:
+            print("⚠️ Render worker did not answer pings")
+            return None
+        times.sort()
+        self.latency[label] = latency = {
+            "samples": len(times),
+            "median_ms": round(statistics.median(times) * 1000, 3),
+            "p99_ms": round(times[min(len(times) - 1, int(len(times) * 0.99))] * 1000, 3),
+            "max_ms": round(times[-1] * 1000, 3),
+        }
+        status = "✅" if times[min(len(times) - 1, int(len(times) * 0.99))] < LATENCY_BUDGET else "⚠️"
+        print(f"{status} Render worker command round trip ({label}): median {latency['median_ms']} ms, "
+              f"p99 {latency['p99_ms']} ms over {len(times)} pings")
+        return latency
+
+    def stop(self, timeout=2.0):
+        """Ask the worker to quit, killing it if it doesn't"""
+        try:
+            self.send(QUIT)
+        except (BrokenPipeError, OSError):
+            pass
+        if self.process is not None:
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
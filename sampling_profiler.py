@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Sampling Profiler
+Captures what the Python code is doing in a live globe or transition session
+without stopping it. A background thread samples every thread's stack
+(sys._current_frames) a couple of hundred times a second for a few seconds,
+then writes collapsed stacks ("thread;outer;...;inner count") ready for
+flamegraph.pl, speedscope or similar.
+
+Press F9 in any RenderHost window to start (or stop early), or set
+CQ_SAMPLE_PROFILE=SECONDS to profile from the first frame. Files go to
+data/profiles (CQ_PROFILE_DIR).
+
+Usage:
+    python sampling_profiler.py top FILE [--limit 20]
+"""
+
+import argparse
+import collections
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROFILE_DIR = Path(os.environ.get("CQ_PROFILE_DIR", Path(__file__).parent / "data" / "profiles"))
+DEFAULT_SECONDS = float(os.environ.get("CQ_SAMPLE_SECONDS", "10"))
+SAMPLE_INTERVAL = 0.005  # 200 Hz
+START_ENV = "CQ_SAMPLE_PROFILE"
+
+# Re-read thread names this often rather than on every sample
+THREAD_NAME_REFRESH = 1.0
+
+
+class SamplingProfiler:
+    """Samples all threads' stacks on a background thread for a fixed time"""
+
+    def __init__(self, duration=DEFAULT_SECONDS, interval=SAMPLE_INTERVAL, out_dir=PROFILE_DIR, label="session"):
+        self.duration = duration
+        self.interval = interval
+        self.out_dir = Path(out_dir)
+        self.label = label
+        self.samples = 0
+        self.overhead = 0.0  # fraction of wall time spent sampling (holding the GIL)
+        self.path = None
+        self._stacks = collections.Counter()
+        self._labels = {}  # code object -> frame label
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        print(f"🔬 Profiling {self.label} for {self.duration:.0f} s...")
+        return self
+
+    def stop(self):
+        """Stop early (the profile is still written)"""
+        self._stop.set()
+
+    def join(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.path
+
+    def _frame_label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            label = self._labels[code] = label.replace(";", ":")
+        return label
+
+    def _fold(self, thread_name, frame):
+        labels = []
+        while frame is not None:
+            labels.append(self._frame_label(frame.f_code))
+            frame = frame.f_back
+        labels.append(thread_name)
+        return ";".join(reversed(labels))
+
+    def _run(self):
+        own = threading.get_ident()
+        names = {}
+        names_at = 0.0
+        busy = 0.0
+        start = time.perf_counter()
+        deadline = start + self.duration
+        next_sample = start
+        while not self._stop.is_set():
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            if now - names_at > THREAD_NAME_REFRESH:
+                names = {thread.ident: thread.name.replace(";", ":") for thread in threading.enumerate()}
+                names_at = now
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._stacks[self._fold(names.get(ident, str(ident)), frame)] += 1
+            self.samples += 1
+            busy += time.perf_counter() - now
+            # Fixed rate; after a stall, carry on from now rather than catching up
+            next_sample = max(next_sample + self.interval, time.perf_counter())
+            self._stop.wait(next_sample - time.perf_counter())
+        elapsed = time.perf_counter() - start
+        self.overhead = busy / elapsed if elapsed else 0.0
+        self.path = self._write()
+        if self.path is not None:
+            print(f"🔬 Profile of {self.label}: {self.samples} samples over {elapsed:.1f} s, "
+                  f"sampler cost {self.overhead * 100:.2f}% of wall time -> {self.path}")
+
+    def _write(self):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = self.out_dir / f"profile-{stamp}-{self.label}-{os.getpid()}.folded"
+        try:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in self._stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+        except OSError as e:
+            print(f"⚠️ Could not write profile: {e}")
+            return None
+        return path
+
+
+_active = None
+_env_started = False
+
+
+def toggle(label="session", duration=DEFAULT_SECONDS):
+    """Hotkey action: start a profile, or stop the one running"""
+    global _active
+    if _active is not None and _active.running:
+        _active.stop()
+        return None
+    _active = SamplingProfiler(duration, label=label).start()
+    return _active
+
+
+def start_from_env(label="session"):
+    """Start a profile if CQ_SAMPLE_PROFILE=SECONDS is set (once per process)"""
+    global _active, _env_started
+    if _env_started or not os.environ.get(START_ENV):
+        return None
+    _env_started = True
+    try:
+        duration = float(os.environ[START_ENV])
+    except ValueError:
+        duration = DEFAULT_SECONDS
+    _active = SamplingProfiler(duration, label=label).start()
+    return _active
+
+
+def top(path, limit=20):
+    """Print the functions with the most samples, on-CPU (self) and including callees (total)"""
+    own = collections.Counter()
+    total = collections.Counter()
+    samples = 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            stack, _, count = line.rstrip("\n").rpartition(" ")
+            count = int(count)
+            frames = stack.split(";")[1:]  # drop the thread name
+            samples += count
+            if frames:
+                own[frames[-1]] += count
+            for frame in set(frames):
+                total[frame] += count
+    print(f"📊 {samples} samples in {path}")
+    print(f"{'self':>7} {'total':>7}  function")
+    for frame, count in own.most_common(limit):
+        print(f"{count / samples:7.1%} {total[frame] / samples:7.1%}  {frame}")
+
+
+def main():
+    """Profiler CLI entry point"""
+    parser = argparse.ArgumentParser(description="Inspect collapsed-stack profiles")
+    commands = parser.add_subparsers(dest="command", required=True)
+    top_parser = commands.add_parser("top", help="functions with the most samples")
+    top_parser.add_argument("file")
+    top_parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "top":
+        top(args.file, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,12 @@ document.addEventListener('DOMContentLoaded', function() {
     initModal();
     initScrollEffects();
     initProgressAnimations();
+    initLauncherEvents();
 });
 
+// Report page-load timing once everything (including load handlers) has run
+window.addEventListener('load', () => setTimeout(reportPageLoad, 0));
+
 // Navigation functionality
 function initNavigation() {
     const mobileMenu = document.getElementById('mobile-menu');
@@ -140,8 +144,9 @@ function initContinentCards() {
         const progressFill = card.querySelector('.progress-fill');
         
         card.addEventListener('mouseenter', () => {
-            // Animate progress bar on hover
-            const currentWidth = Math.random() * 60 + 20; // Simulate progress
+            // Animate progress bar on hover (a real 0% stays 0; missing progress shows as 0)
+            const progress = parseFloat(progressFill.dataset.progress);
+            const currentWidth = Number.isNaN(progress) ? 0 : progress;
             progressFill.style.width = `${currentWidth}%`;
             
             // Add floating effect
@@ -262,6 +267,57 @@ function initProgressAnimations() {
         
         // Store the value for later use
         bar.dataset.progress = progressValue;
+        
+        // Replace it with the player's real progress (all cards share one bridge round-trip)
+        const continent = card.querySelector('h3').textContent.toLowerCase().replace(' ', '-');
+        pythonInterface.getProgress(continent).then(progress => {
+            if (typeof progress === 'number') {
+                bar.dataset.progress = progress;
+            }
+        });
+    });
+}
+
+// State changes pushed from Python arrive as 'cq:<name>' events
+function initLauncherEvents() {
+    window.addEventListener('cq:progress', (event) => {
+        document.querySelectorAll('.continent-card').forEach(card => {
+            const continent = card.querySelector('h3').textContent.toLowerCase().replace(' ', '-');
+            const bar = card.querySelector('.progress-fill');
+            if (bar && typeof event.detail[continent] === 'number') {
+                bar.dataset.progress = event.detail[continent];
+            }
+        });
+    });
+    
+    window.addEventListener('cq:globe', (event) => {
+        console.log(`🌍 Globe ${event.detail.state}`, event.detail.continent || '');
+        document.body.classList.toggle('globe-active', event.detail.state === 'shown');
+    });
+    
+    window.addEventListener('cq:game', (event) => {
+        console.log(`🎮 ${event.detail.continent} game ${event.detail.state}`);
+    });
+    
+    window.addEventListener('cq:error', (event) => {
+        console.error('❌ Launcher error:', event.detail.message);
+    });
+}
+
+function reportPageLoad() {
+    const navigation = performance.getEntriesByType('navigation')[0];
+    if (!navigation) return;
+    const resources = performance.getEntriesByType('resource');
+    const local = resources.filter(entry => entry.name.startsWith(window.location.origin) ||
+                                            entry.name.startsWith('file:'));
+    pythonInterface.reportPageLoad({
+        dom_ready_ms: navigation.domContentLoadedEventEnd,
+        load_ms: navigation.loadEventStart,
+        transfer_bytes: navigation.transferSize + local.reduce((sum, entry) => sum + entry.transferSize, 0),
+        resources: local.length,
+        // Served from the browser cache without touching the network
+        cached: local.filter(entry => entry.transferSize === 0 && entry.decodedBodySize > 0).length,
+        navigation: navigation.type
     });
 }
 
@@ -573,6 +629,11 @@ function startGameSequence() {
         if (typeof pythonInterface !== 'undefined') {
             pythonInterface.startGame().then(result => {
                 console.log('🎮 Game start result:', result);
+                if (result && result.job_id) {
+                    return pythonInterface.waitForJob(result.job_id).then(job => {
+                        console.log(`🎮 Game start ${job.status}:`, job.result || job.error);
+                    });
+                }
             }).catch(error => {
                 console.error('❌ Failed to start game:', error);
             });
@@ -696,6 +757,136 @@ class PythonInterface {
         this.backend_type = this.detectBackend();
         this.base_url = this.getBaseUrl();
         console.log(`🔗 Detected backend: ${this.backend_type}`);
+        
+        // Background jobs (start game, launch continent) report back through 'cq:job' events
+        this.jobWaiters = new Map();
+        window.addEventListener('cq:job', (event) => this.handleJobUpdate(event.detail));
+        
+        // Bridge calls made in the same tick, waiting to be sent as one batch
+        this.pendingCalls = [];
+        
+        // State changes pushed from Python (SSE in the browser, evaluate_js in webview)
+        this.pushConnected = false;
+        window.addEventListener('cq:connected', () => { this.pushConnected = true; });
+        if (this.backend_type === 'web_api') {
+            this.openEventStream();
+        }
+    }
+    
+    openEventStream() {
+        if (typeof EventSource === 'undefined') return;
+        const source = new EventSource(`${this.base_url}/api/events`);
+        ['connected', 'job', 'globe', 'game', 'progress', 'difficulty', 'error'].forEach(name => {
+            source.addEventListener(name, (event) => {
+                window.dispatchEvent(new CustomEvent(`cq:${name}`, { detail: JSON.parse(event.data) }));
+            });
+        });
+        // EventSource reconnects by itself; poll jobs until it does
+        source.onerror = () => { this.pushConnected = false; };
+        this.eventSource = source;
+    }
+    
+    apiReady(timeout = 5000) {
+        // pywebview injects its API after the page starts loading
+        if (typeof pywebview !== 'undefined' && pywebview.api) return Promise.resolve();
+        return new Promise((resolve, reject) => {
+            const timer = setTimeout(() => reject(new Error('pywebview API not available')), timeout);
+            window.addEventListener('pywebviewready', () => {
+                clearTimeout(timer);
+                resolve();
+            }, { once: true });
+        });
+    }
+    
+    call(method, ...args) {
+        // Queue a webview bridge call; everything queued in this tick crosses the bridge together
+        return new Promise((resolve, reject) => {
+            this.pendingCalls.push({ method, args, resolve, reject });
+            if (this.pendingCalls.length === 1) {
+                queueMicrotask(() => this.flushCalls());
+            }
+        });
+    }
+    
+    async flushCalls() {
+        const calls = this.pendingCalls;
+        this.pendingCalls = [];
+        
+        try {
+            await this.apiReady();
+            
+            // A lone call (or an older backend without batch) goes straight through
+            if (calls.length === 1 || typeof pywebview.api.batch !== 'function') {
+                await Promise.all(calls.map(async (call) => {
+                    try {
+                        call.resolve(await pywebview.api[call.method](...call.args));
+                    } catch (error) {
+                        call.reject(error);
+                    }
+                }));
+                return;
+            }
+            
+            const results = await pywebview.api.batch(calls.map(({ method, args }) => ({ method, args })));
+            console.log(`📦 Batched ${calls.length} bridge calls into one round-trip`);
+            calls.forEach((call, i) => {
+                const result = results[i];
+                if (result && result.ok) {
+                    call.resolve(result.result);
+                } else {
+                    call.reject(new Error(result ? result.error : 'No result from batch'));
+                }
+            });
+        } catch (error) {
+            calls.forEach(call => call.reject(error));
+        }
+    }
+    
+    handleJobUpdate(job) {
+        const waiter = this.jobWaiters.get(job.job_id);
+        if (!waiter) return;
+        
+        if (waiter.onProgress) waiter.onProgress(job);
+        if (job.status === 'done' || job.status === 'failed') {
+            this.jobWaiters.delete(job.job_id);
+            clearInterval(waiter.poll);
+            waiter.resolve(job);
+        }
+    }
+    
+    async getJob(jobId) {
+        switch (this.backend_type) {
+            case 'webview':
+                return await pywebview.api.get_job(jobId);
+                
+            case 'web_api':
+                const response = await fetch(`${this.base_url}/api/jobs/${jobId}`);
+                return await response.json();
+                
+            default:
+                return { job_id: jobId, status: 'done', progress: 1 };
+        }
+    }
+    
+    waitForJob(jobId, onProgress = null, pollInterval = 1000) {
+        // Resolves with the finished job; pushed events are used when available, polling otherwise
+        return new Promise((resolve) => {
+            const waiter = { resolve, onProgress, poll: null };
+            this.jobWaiters.set(jobId, waiter);
+            waiter.poll = setInterval(async () => {
+                if (this.pushConnected) return;
+                try {
+                    const job = await this.getJob(jobId);
+                    if (job && job.job_id) this.handleJobUpdate(job);
+                } catch (error) {
+                    console.error('Error polling job:', error);
+                }
+            }, pollInterval);
+            // The job may have finished before we started listening
+            this.getJob(jobId).then(job => {
+                if (job && job.job_id) this.handleJobUpdate(job);
+            }).catch(() => {});
+        });
     }
     
     detectBackend() {
@@ -729,8 +920,8 @@ class PythonInterface {
         try {
             switch (this.backend_type) {
                 case 'webview':
-                    // Direct call to Python through webview API
-                    return await pywebview.api.launch_continent(continentName);
+                    // Call to Python through the webview API bridge
+                    return await this.call('launch_continent', continentName);
                     
                 case 'web_api':
                     // HTTP request to Flask/Django backend
@@ -819,7 +1010,7 @@ class PythonInterface {
         try {
             switch (this.backend_type) {
                 case 'webview':
-                    return await pywebview.api.set_difficulty(difficulty);
+                    return await this.call('set_difficulty', difficulty);
                     
                 case 'web_api':
                     const response = await fetch(`${this.base_url}/api/difficulty`, {
@@ -848,7 +1039,7 @@ class PythonInterface {
         try {
             switch (this.backend_type) {
                 case 'webview':
-                    return await pywebview.api.get_progress(continent);
+                    return await this.call('get_progress', continent);
                     
                 case 'web_api':
                     const url = continent ? 
@@ -880,7 +1071,7 @@ class PythonInterface {
         try {
             switch (this.backend_type) {
                 case 'webview':
-                    return await pywebview.api.update_progress(continent, progress);
+                    return await this.call('update_progress', continent, progress);
                     
                 case 'web_api':
                     const response = await fetch(`${this.base_url}/api/progress/${continent}`, {
@@ -905,12 +1096,76 @@ class PythonInterface {
         }
     }
     
+    async signalReady() {
+        // Readiness handshake: Python finishes its setup as soon as this arrives
+        const interfaceMs = performance.now();
+        if (document.readyState === 'loading') {
+            await new Promise(resolve => document.addEventListener('DOMContentLoaded', resolve, { once: true }));
+        }
+        const navigation = performance.getEntriesByType('navigation')[0];
+        const info = {
+            backend: this.backend_type,
+            time_origin: performance.timeOrigin,
+            interface_ms: interfaceMs,
+            dom_ready_ms: navigation ? navigation.domContentLoadedEventStart : performance.now()
+        };
+        
+        try {
+            switch (this.backend_type) {
+                case 'webview':
+                    return await this.call('page_ready', info);
+                    
+                case 'web_api':
+                    const response = await fetch(`${this.base_url}/api/ready`, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json'
+                        },
+                        body: JSON.stringify(info)
+                    });
+                    return await response.json();
+                    
+                default:
+                    return null;
+            }
+        } catch (error) {
+            console.error('Error signalling readiness:', error);
+            return null;
+        }
+    }
+    
+    async reportPageLoad(metrics) {
+        try {
+            switch (this.backend_type) {
+                case 'webview':
+                    return await this.call('report_page_load', metrics);
+                    
+                case 'web_api':
+                    const response = await fetch(`${this.base_url}/api/page-load`, {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json'
+                        },
+                        body: JSON.stringify(metrics)
+                    });
+                    return await response.json();
+                    
+                default:
+                    console.log('⏱️ Page load:', metrics);
+                    return { status: 'success' };
+            }
+        } catch (error) {
+            console.error('Error reporting page load:', error);
+            return { status: 'error', message: error.message };
+        }
+    }
+    
     async testConnection() {
         console.log('🔥 [TEST] Testing Python connection...');
         try {
             switch (this.backend_type) {
                 case 'webview':
-                    const result = await pywebview.api.test_connection();
+                    const result = await this.call('test_connection');
                     console.log('🔥 [TEST] Webview result:', result);
                     return result;
                     
@@ -936,6 +1191,7 @@ class PythonInterface {
 
 // Initialize Python interface
 window.pythonInterface = new PythonInterface();
+pythonInterface.signalReady();
 
 // Add some fun Easter eggs
 let konamiCode = [];
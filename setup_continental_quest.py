@@ -2,8 +2,13 @@
 """
 Continental Quest - Setup Script
 Sets up the integration between your existing globe.py and the web launcher
+
+Usage:
+    python setup_continental_quest.py                  (interactive setup)
+    python setup_continental_quest.py build-assets [--force] [--jobs N]
 """
 
+import argparse
 import os
 import sys
 import subprocess
@@ -166,6 +171,22 @@ pause
         print(f"❌ Failed to create run script: {e}")
         return False
 
+def build_assets(force=False, jobs=None):
+    """Preprocess textures, meshes, music and the landing page into the asset cache"""
+    print("\n🔧 Building the asset cache (textures, sphere meshes, music, landing page)...")
+    try:
+        import asset_build
+    except ImportError as e:
+        print(f"❌ Cannot build assets: {e}")
+        return False
+    try:
+        manifest = asset_build.build(force=force, jobs=jobs)
+    except ImportError as e:
+        print(f"❌ Cannot build assets: {e}")
+        print("   Install the game dependencies first: pip install pygame PyOpenGL Pillow numpy")
+        return False
+    return not manifest["failed"]
+
 def show_usage_guide():
     """Display usage instructions"""
     print("\n" + "=" * 60)
@@ -180,6 +201,9 @@ def show_usage_guide():
    
    OR double-click: run_continental_quest.bat
 
+   Optional, for faster start-up (re-run after changing textures or music):
+   python setup_continental_quest.py build-assets
+
 2. 🌐 WEB BROWSER FALLBACK:
    Open continental_quest_landing.html in your browser
    (Note: 3D globe integration won't work in browser mode)
@@ -226,7 +250,7 @@ requirements.txt            # All project dependencies
 Ready to explore the galaxy through Earth's continents! 🌍🚀
 """)
 
-def main():
+def interactive_setup():
     """Main setup function"""
     print_banner()
     
@@ -276,9 +300,10 @@ def main():
     print("1. Run the integrated Continental Quest app")
     print("2. Test your existing globe.py")
     print("3. Open the web launcher in browser")
-    print("4. Exit")
+    print("4. Build the asset cache")
+    print("5. Exit")
     
-    choice = input("\nEnter your choice (1-4): ").strip()
+    choice = input("\nEnter your choice (1-5): ").strip()
     
     if choice == '1':
         print("\n🌍 Starting Continental Quest integrated app...")
@@ -307,8 +332,24 @@ def main():
         else:
             print("❌ continental_quest_landing.html not found")
     
+    elif choice == '4':
+        build_assets()
+    
     else:
         print("\n👋 Setup complete! Use 'python continental_quest_app.py' to run your app.")
 
+def main():
+    """Setup CLI entry point"""
+    parser = argparse.ArgumentParser(description="Set up Continental Quest")
+    commands = parser.add_subparsers(dest="command")
+    build_parser = commands.add_parser("build-assets", help="preprocess assets into cache/assets (incremental)")
+    build_parser.add_argument("--force", action="store_true", help="rebuild everything")
+    build_parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    if args.command == "build-assets":
+        sys.exit(0 if build_assets(args.force, args.jobs) else 1)
+    interactive_setup()
+
 if __name__ == '__main__':
     main()
@@ -7,6 +7,9 @@ import os
 import threading
 import time
 
+from transition_runtime import (FixedTimestep, QualityGovernor, ScaledRenderTarget,
+                                configured_render_scale, TARGET_FPS)
+
 # Initialize pygame
 pygame.init()
 
@@ -41,6 +44,7 @@ class LightSpeedStar:
         self.y = random.uniform(0, SCREEN_HEIGHT)
         self.z = random.uniform(1, 1000)  # Far depth for 3D effect
         self.original_z = self.z
+        self.prev_x, self.prev_y, self.prev_z = self.x, self.y, self.z
         self.speed = 0
         self.trail_length = 0
         self.brightness = random.uniform(0.3, 1.0)
@@ -53,6 +57,9 @@ class LightSpeedStar:
         ])
         
     def update(self, warp_speed=1.0, progress=0.0):
+        """Advance the star by one fixed simulation step"""
+        self.prev_x, self.prev_y, self.prev_z = self.x, self.y, self.z
+        
         # Calculate speed based on warp factor - exponential increase
         base_speed = max(1, warp_speed ** 2.5)
         self.speed = base_speed * (1 + progress * 15)
@@ -68,18 +75,26 @@ class LightSpeedStar:
             self.z = random.uniform(800, 1000)
             self.x = random.uniform(0, SCREEN_WIDTH)
             self.y = random.uniform(0, SCREEN_HEIGHT)
+            # Don't interpolate across the wrap-around
+            self.prev_x, self.prev_y, self.prev_z = self.x, self.y, self.z
     
-    def draw(self, surface, warp_speed=1.0):
+    def draw(self, surface, warp_speed=1.0, interpolation=1.0, low_detail=False,
+             trail_segments=20, glow_rings=4, pixel_scale=1.0):
         current_width, current_height = surface.get_size()
         
+        # Interpolate between the last two simulation steps
+        x = self.prev_x + (self.x - self.prev_x) * interpolation
+        y = self.prev_y + (self.y - self.prev_y) * interpolation
+        z = self.prev_z + (self.z - self.prev_z) * interpolation
+        
         # Calculate screen position with perspective projection
-        if self.z <= 0:
+        if z <= 0:
             return
             
-        # Perspective calculation
-        scale = 500.0 / self.z
-        screen_x = int(current_width/2 + (self.x - SCREEN_WIDTH/2) * scale)
-        screen_y = int(current_height/2 + (self.y - SCREEN_HEIGHT/2) * scale)
+        # Perspective calculation (pixel_scale maps onto a reduced-resolution canvas)
+        scale = 500.0 / z * pixel_scale
+        screen_x = int(current_width/2 + (x - SCREEN_WIDTH/2) * scale)
+        screen_y = int(current_height/2 + (y - SCREEN_HEIGHT/2) * scale)
         
         # Skip if off screen (with margin for trails)
         if (screen_x < -100 or screen_x > current_width + 100 or 
@@ -90,7 +105,7 @@ class LightSpeedStar:
         size = max(1, int(scale * 2))
         
         # Calculate brightness based on distance and base brightness
-        distance_brightness = min(1.0, (1000 - self.z) / 1000)
+        distance_brightness = min(1.0, (1000 - z) / 1000)
         final_brightness = self.brightness * distance_brightness
         
         # Color with brightness
@@ -103,15 +118,17 @@ class LightSpeedStar:
         # Draw light-speed trail
         if self.trail_length > 5 and warp_speed > 2:
             trail_points = []
-            num_trail_points = max(5, int(self.trail_length / 10))
+            num_trail_points = min(trail_segments, max(5, int(self.trail_length / 10)))
+            if low_detail:
+                num_trail_points = 2
             
             for i in range(num_trail_points):
                 # Calculate trail position
-                trail_z = self.z + (i * self.speed / num_trail_points)
+                trail_z = z + (i * self.speed / num_trail_points)
                 if trail_z > 0:
-                    trail_scale = 500.0 / trail_z
-                    trail_x = int(current_width/2 + (self.x - SCREEN_WIDTH/2) * trail_scale)
-                    trail_y = int(current_height/2 + (self.y - SCREEN_HEIGHT/2) * trail_scale)
+                    trail_scale = 500.0 / trail_z * pixel_scale
+                    trail_x = int(current_width/2 + (x - SCREEN_WIDTH/2) * trail_scale)
+                    trail_y = int(current_height/2 + (y - SCREEN_HEIGHT/2) * trail_scale)
                     trail_points.append((trail_x, trail_y))
             
             # Draw trail as connected lines with fading alpha
@@ -132,10 +149,10 @@ class LightSpeedStar:
                         except:
                             pass
         
-        # Draw main star with glow effect
-        if size >= 2:
+        # Draw main star with glow effect (skipped while the loop is behind)
+        if size >= 2 and not low_detail:
             # Outer glow
-            for glow_size in range(size + 4, size, -1):
+            for glow_size in range(size + glow_rings, size, -1):
                 glow_alpha = max(10, int(final_brightness * 100 * (size + 4 - glow_size) / 4))
                 glow_color = (
                     min(255, color[0] + glow_alpha // 3),
@@ -197,8 +214,11 @@ class QuantumParticle:
         self.decay = random.uniform(0.5, 1.5)
         self.size = random.uniform(1, 3)
         self.pulse_phase = random.uniform(0, math.pi * 2)
+        self.prev_x, self.prev_y = self.x, self.y
         
     def update(self):
+        """Advance the particle by one fixed simulation step"""
+        self.prev_x, self.prev_y = self.x, self.y
         self.x += self.dx
         self.y += self.dy
         self.life -= self.decay
@@ -223,12 +243,16 @@ class QuantumParticle:
         # Update pulse
         self.pulse_phase += 0.1
         
-    def draw(self, surface):
+    def draw(self, surface, interpolation=1.0, pixel_scale=1.0):
         if self.life > 0:
             life_ratio = self.life / self.max_life
             pulse = math.sin(self.pulse_phase) * 0.3 + 0.7
             alpha = int(255 * life_ratio * pulse)
-            size = int(self.size * life_ratio * pulse)
+            size = int(self.size * life_ratio * pulse * pixel_scale)
+            
+            # Interpolate between the last two simulation steps
+            x = int((self.prev_x + (self.x - self.prev_x) * interpolation) * pixel_scale)
+            y = int((self.prev_y + (self.y - self.prev_y) * interpolation) * pixel_scale)
             
             # Color with life fade
             color = (
@@ -242,14 +266,13 @@ class QuantumParticle:
                     # Glow effect
                     if size > 1:
                         glow_color = (color[0] // 3, color[1] // 3, color[2] // 3)
-                        pygame.draw.circle(surface, glow_color, 
-                                         (int(self.x), int(self.y)), size + 2)
+                        pygame.draw.circle(surface, glow_color, (x, y), size + 2)
                     
-                    pygame.draw.circle(surface, color, (int(self.x), int(self.y)), size)
+                    pygame.draw.circle(surface, color, (x, y), size)
                 except:
                     pass
 
-def create_warp_tunnel_effect(surface, progress):
+def create_warp_tunnel_effect(surface, progress, pixel_scale=1.0):
     """Create tunnel effect for light speed travel"""
     current_width, current_height = surface.get_size()
     center_x, center_y = current_width // 2, current_height // 2
@@ -265,17 +288,18 @@ def create_warp_tunnel_effect(surface, progress):
             
             if alpha > 5:
                 try:
-                    pygame.draw.circle(surface, color, (center_x, center_y), radius, 3)
+                    pygame.draw.circle(surface, color, (center_x, center_y), radius,
+                                       max(1, int(round(3 * pixel_scale))))
                 except:
                     pass
 
-def create_hyperspace_grid(surface, progress, time_factor):
+def create_hyperspace_grid(surface, progress, time_factor, pixel_scale=1.0):
     """Create moving grid lines for hyperspace effect"""
     current_width, current_height = surface.get_size()
     
     # Vertical lines moving horizontally
     for i in range(-5, 15):
-        x_offset = (time_factor * 200 + i * 100) % (current_width + 200) - 100
+        x_offset = ((time_factor * 200 + i * 100) % (current_width / pixel_scale + 200) - 100) * pixel_scale
         alpha = int(50 * progress * math.sin(time_factor + i) * 0.5 + 25)
         
         if alpha > 5:
@@ -288,7 +312,7 @@ def create_hyperspace_grid(surface, progress, time_factor):
     
     # Horizontal lines moving vertically
     for i in range(-3, 10):
-        y_offset = (time_factor * 150 + i * 120) % (current_height + 240) - 120
+        y_offset = ((time_factor * 150 + i * 120) % (current_height / pixel_scale + 240) - 120) * pixel_scale
         alpha = int(40 * progress * math.cos(time_factor + i) * 0.5 + 20)
         
         if alpha > 5:
@@ -356,8 +380,15 @@ def main():
     
     clock = pygame.time.Clock()
     
-    # Create light-speed star field
-    stars = [LightSpeedStar() for _ in range(400)]
+    # Scales star count, trails, glows and particles to hold the frame rate
+    governor = QualityGovernor()
+    
+    # Create light-speed star field (the governor decides how many are active)
+    stars = [LightSpeedStar() for _ in range(governor.max_star_count)]
+    
+    # Fullscreen on large displays draws into a smaller canvas that gets upscaled once per frame
+    render_target = ScaledRenderTarget(configured_render_scale())
+    last_render_scale = None
     particles = []
     
     # Animation variables
@@ -379,15 +410,21 @@ def main():
     
     # Time tracking
     time_factor = 0
+    timestep = FixedTimestep()
     
     running = True
     while running:
         current_time = pygame.time.get_ticks()
         elapsed = current_time - start_time
-        dt = clock.tick(60) / 1000.0  # Delta time in seconds
+        dt = clock.tick(TARGET_FPS) / 1000.0  # Delta time in seconds
         
         time_factor += dt
         
+        # Measure busy time (without the frame cap delay) and adapt detail to it
+        governor.record_frame(clock.get_rawtime() / 1000.0, dt)
+        quality = governor.params
+        active_stars = stars[:quality["star_count"]]
+        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -445,39 +482,59 @@ def main():
         # Get current screen dimensions
         current_width, current_height = screen.get_size()
         
+        # Advance the simulation in fixed steps so motion doesn't depend on frame rate
+        star_progress = progress if phase == "lightspeed" else 0
+        for _ in range(timestep.advance(dt)):
+            # Add subtle quantum particles during acceleration and lightspeed
+            if phase in ["acceleration", "lightspeed"] and random.random() < quality["particle_spawn_rate"]:
+                particles.append(QuantumParticle(
+                    random.randint(0, current_width),
+                    random.randint(0, current_height),
+                    "quantum" if random.random() < 0.7 else "energy"
+                ))
+            
+            particles = [p for p in particles if p.life > 0]
+            for particle in particles:
+                particle.update()
+            
+            for star in active_stars:
+                star.update(warp_speed, star_progress)
+        
+        interpolation = timestep.alpha
+        low_detail = timestep.low_detail
+        
+        # Pick this frame's canvas (the window itself, or a reduced-resolution copy)
+        canvas = render_target.begin(screen, quality["render_scale"])
+        pixel_scale = render_target.scale
+        if pixel_scale != last_render_scale:
+            print(f"Rendering transition at {pixel_scale:.2f}x of {current_width}x{current_height}")
+            last_render_scale = pixel_scale
+        
         # Fill screen with deep space
-        screen.fill(BLACK)
-        
-        # Add subtle quantum particles during acceleration and lightspeed
-        if phase in ["acceleration", "lightspeed"] and random.random() < 0.1:
-            particles.append(QuantumParticle(
-                random.randint(0, current_width),
-                random.randint(0, current_height),
-                "quantum" if random.random() < 0.7 else "energy"
-            ))
-        
-        # Update and draw particles
-        particles = [p for p in particles if p.life > 0]
+        canvas.fill(BLACK)
+        
+        # Draw particles
         for particle in particles:
-            particle.update()
-            particle.draw(screen)
+            particle.draw(canvas, interpolation, pixel_scale)
         
         # Create hyperspace grid effect during lightspeed
         if phase == "lightspeed":
-            create_hyperspace_grid(screen, min(1.0, warp_speed / 10), time_factor)
+            create_hyperspace_grid(canvas, min(1.0, warp_speed / 10), time_factor, pixel_scale)
         
         # Create warp tunnel during flash phase
         if phase == "flash":
-            create_warp_tunnel_effect(screen, progress)
+            create_warp_tunnel_effect(canvas, progress, pixel_scale)
         
-        # Update and draw stars
-        for star in stars:
-            star.update(warp_speed, progress if phase == "lightspeed" else 0)
-            star.draw(screen, warp_speed)
+        # Draw stars
+        for star in active_stars:
+            star.draw(canvas, warp_speed, interpolation, low_detail,
+                      quality["trail_segments"], quality["glow_rings"], pixel_scale)
         
         # Screen flash effect
         if flash_intensity > 0:
-            create_screen_flash(screen, flash_intensity)
+            create_screen_flash(canvas, flash_intensity)
+        
+        render_target.present(screen)
         
         # Subtle controls hint (bottom right, very discrete)
         if not is_fullscreen:
@@ -490,6 +547,10 @@ def main():
         
         pygame.display.flip()
     
+    governor.log_summary()
+    if timestep.dropped_steps:
+        print(f"Transition fell behind: skipped {timestep.dropped_steps} simulation steps")
+    
     # After the transition, launch the globe and wait for it to complete
     pygame.quit()
     launch_globe()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Telemetry
+Compact performance records per session (start-up time, scene frame rates,
+game launch latency, peak memory), appended as JSON lines to a size-capped,
+rotating log under data/telemetry. Nothing leaves the machine; collect the
+files and summarize them offline.
+
+Every process of a session (launcher, render worker, games) writes to the same
+log with the same session id. Set CQ_TELEMETRY=0 to turn it off,
+CQ_TELEMETRY_DIR to move it and CQ_BUILD to label the build (default: a hash of
+the app's source files).
+
+Usage:
+    python telemetry.py summary [LOG_DIR_OR_FILE ...] [--by machine|build|both]
+"""
+
+import argparse
+import collections
+import glob
+import hashlib
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent
+LOG_DIR = Path(os.environ.get("CQ_TELEMETRY_DIR", APP_DIR / "data" / "telemetry"))
+LOG_NAME = "telemetry.jsonl"
+MAX_BYTES = 1024 * 1024  # per file
+BACKUPS = 4              # telemetry.jsonl.1 ... .4 are kept besides the live file
+SCHEMA = 1
+
+ENABLED = os.environ.get("CQ_TELEMETRY", "1").strip().lower() not in ("0", "false", "off")
+SESSION_ENV = "CQ_TELEMETRY_SESSION"
+
+_lock = threading.Lock()
+_build = None
+
+
+def session_id():
+    """Id shared by every process of this session (children inherit it)"""
+    session = os.environ.get(SESSION_ENV)
+    if not session:
+        session = os.environ[SESSION_ENV] = uuid.uuid4().hex[:12]
+    return session
+
+
+def build_id():
+    """CQ_BUILD, or a short hash of the app's Python sources"""
+    global _build
+    if _build is None:
+        _build = os.environ.get("CQ_BUILD")
+        if not _build:
+            digest = hashlib.sha1()
+            for path in sorted(APP_DIR.glob("*.py")):
+                try:
+                    digest.update(path.name.encode())
+                    digest.update(path.read_bytes())
+                except OSError:
+                    pass
+            _build = digest.hexdigest()[:10]
+    return _build
+
+
+def peak_memory_mb():
+    """This process's memory high-water mark in MB, or None where it can't be read"""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class Counters(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                            ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                            ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+            counters = Counters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return None
+            return round(counters.PeakWorkingSetSize / 2 ** 20, 1)
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS bytes
+        return round(peak / (2 ** 20 if sys.platform == "darwin" else 2 ** 10), 1)
+    except Exception:
+        return None
+
+
+class FrameStats:
+    """Frame-time histogram (1 ms buckets), constant memory however long a scene runs"""
+
+    def __init__(self):
+        self.buckets = collections.Counter()
+        self.frames = 0
+        self.seconds = 0.0
+
+    def add(self, dt):
+        self.frames += 1
+        self.seconds += dt
+        self.buckets[int(dt * 1000)] += 1
+
+    def frame_ms(self, fraction):
+        """Frame time that fraction of frames were at or under"""
+        target = fraction * self.frames
+        seen = 0
+        for ms in sorted(self.buckets):
+            seen += self.buckets[ms]
+            if seen >= target:
+                return ms + 0.5
+        return 0
+
+    def summary(self):
+        if not self.frames:
+            return {"frames": 0}
+        return {
+            "frames": self.frames,
+            "seconds": round(self.seconds, 2),
+            "fps_avg": round(self.frames / self.seconds, 1) if self.seconds else None,
+            "fps_p50": round(1000.0 / self.frame_ms(0.50), 1),
+            "fps_p5": round(1000.0 / self.frame_ms(0.95), 1),   # 5% of frames were slower than this
+            "fps_p1": round(1000.0 / self.frame_ms(0.99), 1),
+        }
+
+
+def _rotate(path):
+    for index in range(BACKUPS, 0, -1):
+        older = path.with_name(f"{path.name}.{index}")
+        newer = path.with_name(f"{path.name}.{index - 1}") if index > 1 else path
+        if newer.exists():
+            os.replace(newer, older)
+
+
+def record(kind, log_dir=LOG_DIR, **metrics):
+    """Append one record; returns it (or None when telemetry is off or the log can't be written)"""
+    if not ENABLED:
+        return None
+    entry = {
+        "v": SCHEMA,
+        "time": round(time.time(), 3),
+        "session": session_id(),
+        "machine": platform.node(),
+        "build": build_id(),
+        "pid": os.getpid(),
+        "kind": kind,
+        "metrics": dict(metrics, peak_mb=peak_memory_mb()),
+    }
+    line = json.dumps(entry, separators=(",", ":")) + "\n"
+    path = Path(log_dir) / LOG_NAME
+    try:
+        with _lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if path.exists() and path.stat().st_size + len(line) > MAX_BYTES:
+                _rotate(path)
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
+    except OSError as e:
+        print(f"⚠️ Could not write telemetry: {e}")
+        return None
+    return entry
+
+
+if ENABLED:
+    # Before any child process is started, so they all join this session
+    session_id()
+
+
+# ------------------ Offline summary ------------------
+
+def read_records(sources):
+    """Every record in the given log files/directories (rotated files included)"""
+    paths = []
+    for source in sources:
+        source = Path(source)
+        if source.is_dir():
+            paths.extend(sorted(source.glob(f"{LOG_NAME}*")))
+        else:
+            paths.extend(Path(p) for p in sorted(glob.glob(str(source))))
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    pass  # a line cut short by a crash
+    return records
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def summarize(records, by="both"):
+    """{group: {metric: [values]}}, grouping by machine and/or build"""
+    groups = collections.defaultdict(lambda: collections.defaultdict(list))
+    peaks = collections.defaultdict(dict)  # group -> {session: highest peak_mb}
+    for entry in records:
+        if by == "machine":
+            group = entry.get("machine", "?")
+        elif by == "build":
+            group = entry.get("build", "?")
+        else:
+            group = f"{entry.get('machine', '?')} @ {entry.get('build', '?')}"
+        metrics = entry.get("metrics", {})
+        label = entry.get("kind", "?")
+        if label == "scene":
+            label = metrics.get("scene", label)
+        elif label == "game_launch":
+            label = f"game_launch.{metrics.get('mode', '?')}"
+        for name, value in metrics.items():
+            if name == "peak_mb":
+                if value is not None:
+                    session = entry.get("session")
+                    peaks[group][session] = max(value, peaks[group].get(session, 0))
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                groups[group][f"{label}.{name}"].append(value)
+    for group, sessions in peaks.items():
+        groups[group]["session.peak_mb"] = list(sessions.values())
+    return groups
+
+
+def print_summary(groups):
+    for group in sorted(groups):
+        metrics = groups[group]
+        print(f"📊 {group}")
+        print(f"   {'metric':<32} {'n':>6} {'p50':>9} {'p90':>9} {'p99':>9} {'max':>9}")
+        for name in sorted(metrics):
+            values = metrics[name]
+            print(f"   {name:<32} {len(values):>6} {percentile(values, 0.5):>9.1f} "
+                  f"{percentile(values, 0.9):>9.1f} {percentile(values, 0.99):>9.1f} {max(values):>9.1f}")
+
+
+def main():
+    """Telemetry CLI entry point"""
+    parser = argparse.ArgumentParser(description="Summarize Continental Quest telemetry logs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    summary_parser = commands.add_parser("summary", help="percentiles per machine and/or build")
+    summary_parser.add_argument("sources", nargs="*", default=[str(LOG_DIR)],
+                                help="log files or directories (default: this machine's log)")
+    summary_parser.add_argument("--by", choices=("machine", "build", "both"), default="both")
+    args = parser.parse_args()
+
+    if args.command == "summary":
+        records = read_records(args.sources)
+        if not records:
+            print("No telemetry records found")
+            return
+        sessions = len({entry.get("session") for entry in records})
+        print(f"📁 {len(records)} records from {sessions} sessions")
+        print_summary(summarize(records, args.by))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Tracing
+Spans and instant events from every process of a session (launcher, render
+worker, games) in Chrome trace format, so one launch-to-gameplay journey can be
+opened in chrome://tracing or ui.perfetto.dev.
+
+Off unless CQ_TRACE_DIR is set. Each process buffers its own events and writes
+them to the session's directory when it exits; the first process (the one that
+started the session) merges them into trace.json there. Child processes inherit
+the session through the environment.
+
+Timestamps come from time.perf_counter_ns(), a system-wide monotonic clock on
+Windows, Linux and macOS, so events from different processes line up.
+
+Usage:
+    python tracing.py merge SESSION_DIR   (again, e.g. after a game outlived the launcher)
+"""
+
+import argparse
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+TRACE_DIR = os.environ.get("CQ_TRACE_DIR")
+SESSION_ENV = "CQ_TRACE_SESSION"
+
+# Events kept per process; a long kiosk session stops recording rather than growing forever
+MAX_EVENTS = 200000
+
+TRACE_FILE = "trace.json"
+
+ENABLED = bool(TRACE_DIR)
+
+_events = []
+_thread_names = {}
+_dropped = 0
+_process_name = None
+_is_root = False
+_session_dir = None
+_flushed = False
+
+
+def _now_us():
+    return time.perf_counter_ns() / 1000.0
+
+
+_native_id = getattr(threading, "get_native_id", threading.get_ident)
+
+
+def _record(event):
+    global _dropped
+    if len(_events) >= MAX_EVENTS:
+        _dropped += 1
+        return
+    tid = _native_id()
+    if tid not in _thread_names:
+        _thread_names[tid] = threading.current_thread().name
+    event["pid"] = os.getpid()
+    event["tid"] = tid
+    _events.append(event)
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = repr(exc)
+        _record({"name": self.name, "ph": "X", "ts": self.start, "dur": _now_us() - self.start,
+                 "args": self.args})
+        return False
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, **args):
+    """Context manager timing a block as one span"""
+    if not ENABLED:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def instant(name, **args):
+    """A point-in-time event (a mark on the thread's track)"""
+    if ENABLED:
+        _record({"name": name, "ph": "i", "s": "t", "ts": _now_us(), "args": args})
+
+
+def begin(name, **args):
+    """Open a span on this thread (for code that can't be wrapped in span()); close it with end()"""
+    if ENABLED:
+        _record({"name": name, "ph": "B", "ts": _now_us(), "args": args})
+
+
+def end(name, **args):
+    if ENABLED:
+        _record({"name": name, "ph": "E", "ts": _now_us(), "args": args})
+
+
+def complete(name, duration, **args):
+    """A span that ends now and lasted duration seconds (e.g. measured before tracing could)"""
+    if ENABLED:
+        now = _now_us()
+        _record({"name": name, "ph": "X", "ts": now - duration * 1e6, "dur": duration * 1e6, "args": args})
+
+
+def traced(name=None):
+    """Decorator: trace every call of a function as a span"""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            with _Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def set_process_name(name):
+    """How this process is labelled in the trace viewer"""
+    global _process_name
+    _process_name = name
+
+
+def _metadata():
+    pid = os.getpid()
+    events = []
+    if _process_name:
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0,
+                       "args": {"name": f"{_process_name} ({pid})"}})
+    for tid, thread_name in _thread_names.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+                       "args": {"name": thread_name}})
+    return events
+
+
+def flush():
+    """Write this process's events to the session directory (once; runs at exit)"""
+    global _flushed
+    if not ENABLED or _flushed or _session_dir is None:
+        return None
+    _flushed = True
+    events = _metadata() + list(_events)
+    if _dropped:
+        print(f"⚠️ Trace buffer full: dropped {_dropped} events")
+    path = _session_dir / f"{os.getpid()}.json"
+    try:
+        _session_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(events, f)
+    except OSError as e:
+        print(f"⚠️ Could not write trace events: {e}")
+        return None
+    return path
+
+
+def merge(session_dir):
+    """Combine every process's events in a session directory into trace.json"""
+    session_dir = Path(session_dir)
+    events = []
+    for path in sorted(session_dir.glob("*.json")):
+        if path.name == TRACE_FILE:
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                events.extend(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Skipping {path.name}: {e}")
+    events.sort(key=lambda event: event.get("ts", 0))
+    out = session_dir / TRACE_FILE
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    processes = len({event["pid"] for event in events})
+    print(f"🧭 Trace: {len(events)} events from {processes} processes -> {out}")
+    return out
+
+
+def finish():
+    """Flush this process, and in the session's first process merge everything
+
+    Called at exit; call it explicitly before os._exit().
+    """
+    if flush() is not None and _is_root:
+        merge(_session_dir)
+
+
+def _start():
+    global _is_root, _session_dir
+    session = os.environ.get(SESSION_ENV)
+    if not session:
+        # First traced process: start a session that child processes join
+        _is_root = True
+        session = f"session-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        os.environ[SESSION_ENV] = session
+        # Children may run from another directory
+        os.environ["CQ_TRACE_DIR"] = str(Path(TRACE_DIR).resolve())
+    _session_dir = Path(os.environ["CQ_TRACE_DIR"]) / session
+    atexit.register(finish)
+
+
+if ENABLED:
+    _start()
+
+
+def main():
+    """Tracing CLI entry point"""
+    parser = argparse.ArgumentParser(description="Merge per-process trace events")
+    commands = parser.add_subparsers(dest="command", required=True)
+    merge_parser = commands.add_parser("merge", help="(re)build trace.json for a session")
+    merge_parser.add_argument("session_dir")
+    args = parser.parse_args()
+
+    if args.command == "merge":
+        merge(args.session_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Transition Bake
+Renders the quantum space jump transition once into an on-disk frame store
+and plays it back from a memory map instead of simulating it live.
+
+Usage:
+    python transition_bake.py bake [--width 1200] [--height 800] [--quality 1.0] [--fps 30]
+                                   [--desktop-width W --desktop-height H]
+    python transition_bake.py list
+    python transition_bake.py clear [--all]
+
+The star field is spread over the whole display (like the live transition),
+so a bake is only valid for the desktop size it was made on; the CLI uses the
+current display unless --desktop-width/--desktop-height are given.
+
+Set CQ_TRANSITION_MODE=live to ignore baked sequences.
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+from pathlib import Path
+
+import pygame
+
+import transition_runtime
+from transition_runtime import FixedTimestep, QualityGovernor
+
+BAKE_FORMAT_VERSION = 1
+BAKE_MAGIC = b"CQTF"
+BAKE_DIR = Path(__file__).parent / "cache" / "transition"
+BAKE_SEED = 2024
+DEFAULT_FPS = 30
+
+# File layout: header | metadata JSON | frame index | zlib-compressed RGB frames
+HEADER = struct.Struct("<4sII")    # magic, format version, metadata length
+INDEX_ENTRY = struct.Struct("<QI")  # frame offset, compressed length
+
+
+def _effects_module():
+    """The module that defines the transition effect"""
+    main = sys.modules.get("__main__")
+    if main is not None and hasattr(main, "TransitionField"):
+        return main
+    import quantum_transition
+    return quantum_transition
+
+
+def desktop_size(fallback=(1200, 800)):
+    """Size of the display, as RenderHost.desktop_size reports it"""
+    if not pygame.display.get_init():
+        pygame.display.init()
+    info = pygame.display.Info()
+    if info.current_w <= 0 or info.current_h <= 0:
+        return tuple(fallback)
+    return (info.current_w, info.current_h)
+
+
+def effect_fingerprint(effects=None, field_size=None):
+    """Hash of everything that affects the baked pixels - a change invalidates old bakes"""
+    effects = effects or _effects_module()
+    digest = hashlib.sha256()
+    digest.update(str(BAKE_FORMAT_VERSION).encode())
+    if field_size is not None:
+        digest.update("field {}x{}".format(*field_size).encode())
+    digest.update(json.dumps(effects.TRANSITION_PHASES, sort_keys=True).encode())
+    digest.update(json.dumps(transition_runtime.QUALITY_BOUNDS, sort_keys=True).encode())
+    for obj in (effects.LightSpeedStar, effects.QuantumParticle, effects.TransitionField,
+                effects.create_warp_tunnel_effect, effects.create_hyperspace_grid,
+                effects.transition_phase, FixedTimestep, render_sequence):
+        digest.update(inspect.getsource(obj).encode())
+    return digest.hexdigest()[:16]
+
+
+def bake_filename(width, height, quality_level, fps, fingerprint):
+    return f"transition_{width}x{height}_q{int(round(quality_level * 100)):03d}_{fps}fps_{fingerprint}.cqf"
+
+
+def render_sequence(width, height, quality_level=1.0, fps=DEFAULT_FPS, effects=None, field_size=None):
+    """Yield every frame of the transition (without the flash overlay), deterministically
+
+    field_size is the screen size the star field is spread over - the live
+    TransitionScene uses the desktop size - and defaults to the frame size.
+    """
+    effects = effects or _effects_module()
+    quality = QualityGovernor(initial_quality=quality_level).params
+    field_width, field_height = field_size or (width, height)
+
+    # Seed the shared random module so every bake of the same code is identical
+    random_state = random.getstate()
+    random.seed(BAKE_SEED)
+    try:
+        field = effects.TransitionField(field_width, field_height, quality["star_count"])
+        timestep = FixedTimestep()
+        canvas = pygame.Surface((width, height))
+        frame_count = int(effects.TRANSITION_DURATION / 1000.0 * fps) + 1
+
+        for index in range(frame_count):
+            elapsed = index * 1000.0 / fps
+            phase, progress, warp_speed, _ = effects.transition_phase(elapsed)
+            if index:
+                for _ in range(timestep.advance(1.0 / fps)):
+                    field.step(phase, progress, warp_speed, (width, height), quality)
+            field.draw(canvas, phase, progress, warp_speed, elapsed / 1000.0, quality,
+                       timestep.alpha)
+            yield canvas
+    finally:
+        random.setstate(random_state)
+
+
+def bake(width, height, quality_level=1.0, fps=DEFAULT_FPS, bake_dir=BAKE_DIR, effects=None,
+         field_size=None):
+    """Render the sequence for one (resolution, quality, desktop size) and write it to the frame store"""
+    effects = effects or _effects_module()
+    field_size = tuple(field_size or (width, height))
+    fingerprint = effect_fingerprint(effects, field_size)
+    bake_dir = Path(bake_dir)
+    bake_dir.mkdir(parents=True, exist_ok=True)
+    path = bake_dir / bake_filename(width, height, quality_level, fps, fingerprint)
+
+    print(f"🔥 Baking transition {width}x{height} (desktop {field_size[0]}x{field_size[1]}) "
+          f"at quality {quality_level:.2f}, {fps} FPS...")
+    start = time.perf_counter()
+    frames = [zlib.compress(pygame.image.tostring(canvas, "RGB"), 6)
+              for canvas in render_sequence(width, height, quality_level, fps, effects, field_size)]
+
+    metadata = json.dumps({
+        "width": width,
+        "height": height,
+        "field_size": list(field_size),
+        "quality": quality_level,
+        "fps": fps,
+        "frames": len(frames),
+        "fingerprint": fingerprint,
+        "baked_at": time.time(),
+    }).encode()
+
+    offset = HEADER.size + len(metadata) + INDEX_ENTRY.size * len(frames)
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(BAKE_MAGIC, BAKE_FORMAT_VERSION, len(metadata)))
+        f.write(metadata)
+        for frame in frames:
+            f.write(INDEX_ENTRY.pack(offset, len(frame)))
+            offset += len(frame)
+        for frame in frames:
+            f.write(frame)
+    os.replace(temp_path, path)
+
+    size_mb = path.stat().st_size / (1024 * 1024)
+    print(f"✅ Baked {len(frames)} frames ({size_mb:.1f} MB) in {time.perf_counter() - start:.1f}s -> {path.name}")
+    remove_stale(bake_dir, fingerprint)
+    return path
+
+
+def remove_stale(bake_dir=BAKE_DIR, fingerprint=None):
+    """Delete bakes made from older effect code or for another desktop size (or all of them if fingerprint is None)"""
+    removed = 0
+    for path in Path(bake_dir).glob("transition_*.cqf"):
+        if fingerprint is None or not path.stem.endswith(fingerprint):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                print(f"⚠️ Could not remove {path.name}: {e}")
+    if removed:
+        print(f"🧹 Removed {removed} stale baked transition(s)")
+    return removed
+
+
+class BakedTransition:
+    """A baked sequence, memory-mapped and decoded one frame at a time"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, metadata_length = HEADER.unpack_from(self._map, 0)
+        if magic != BAKE_MAGIC or version != BAKE_FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"{self.path.name} is not a version {BAKE_FORMAT_VERSION} baked transition")
+
+        self.metadata = json.loads(self._map[HEADER.size:HEADER.size + metadata_length])
+        self.size = (self.metadata["width"], self.metadata["height"])
+        self.fps = self.metadata["fps"]
+        self.frame_count = self.metadata["frames"]
+
+        index_start = HEADER.size + metadata_length
+        self.index = [INDEX_ENTRY.unpack_from(self._map, index_start + i * INDEX_ENTRY.size)
+                      for i in range(self.frame_count)]
+        self._frame_number = None
+        self._frame = None
+
+    def frame_at(self, elapsed):
+        """Surface for the frame shown at elapsed milliseconds"""
+        frame_number = min(self.frame_count - 1, max(0, int(elapsed / 1000.0 * self.fps)))
+        if frame_number != self._frame_number:
+            offset, length = self.index[frame_number]
+            pixels = zlib.decompress(self._map[offset:offset + length])
+            self._frame = pygame.image.frombuffer(pixels, self.size, "RGB")
+            self._frame_number = frame_number
+        return self._frame
+
+    def draw(self, screen, elapsed):
+        """Blit the frame for elapsed milliseconds, scaled to the screen if needed"""
+        frame = self.frame_at(elapsed)
+        if frame.get_size() == screen.get_size():
+            screen.blit(frame, (0, 0))
+        else:
+            pygame.transform.smoothscale(frame, screen.get_size(), screen)
+
+    def close(self):
+        self._frame = None
+        try:
+            self._map.close()
+        finally:
+            self._file.close()
+
+
+def find_baked(width, height, bake_dir=BAKE_DIR, effects=None, field_size=None):
+    """Path of the best up-to-date bake for this resolution and desktop size, or None"""
+    bake_dir = Path(bake_dir)
+    if not bake_dir.exists():
+        return None
+    fingerprint = effect_fingerprint(effects, tuple(field_size or (width, height)))
+    candidates = sorted(bake_dir.glob(f"transition_{width}x{height}_q*_{fingerprint}.cqf"))
+    # Highest quality sorts last
+    return candidates[-1] if candidates else None
+
+
+def open_for_playback(width, height, bake_dir=BAKE_DIR, effects=None, field_size=None):
+    """Open the cached bake for this window and desktop size, or return None to render live"""
+    mode = os.environ.get("CQ_TRANSITION_MODE", "auto").strip().lower()
+    if mode == "live":
+        return None
+
+    field_size = tuple(field_size or (width, height))
+    path = find_baked(width, height, bake_dir, effects, field_size)
+    if path is None:
+        if mode == "baked":
+            print(f"⚠️ No baked transition for {width}x{height} on a {field_size[0]}x{field_size[1]} desktop. "
+                  f"Run: python transition_bake.py bake --width {width} --height {height} "
+                  f"--desktop-width {field_size[0]} --desktop-height {field_size[1]}")
+        return None
+
+    baked = BakedTransition(path)
+    print(f"🎞️ Playing baked transition {path.name}")
+    return baked
+
+
+def main():
+    """Bake CLI entry point"""
+    parser = argparse.ArgumentParser(description="Bake the quantum transition into a cached frame store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bake_parser = commands.add_parser("bake", help="render and store the transition")
+    bake_parser.add_argument("--width", type=int, default=1200)
+    bake_parser.add_argument("--height", type=int, default=800)
+    bake_parser.add_argument("--quality", type=float, default=1.0, help="quality level 0.0-1.0")
+    bake_parser.add_argument("--fps", type=int, default=DEFAULT_FPS)
+    bake_parser.add_argument("--desktop-width", type=int, help="display width (default: current display)")
+    bake_parser.add_argument("--desktop-height", type=int, help="display height (default: current display)")
+
+    commands.add_parser("list", help="show cached bakes")
+
+    clear_parser = commands.add_parser("clear", help="delete stale bakes")
+    clear_parser.add_argument("--all", action="store_true", help="delete every bake, not just stale ones")
+
+    args = parser.parse_args()
+
+    if args.command == "bake":
+        if args.desktop_width and args.desktop_height:
+            field_size = (args.desktop_width, args.desktop_height)
+        else:
+            field_size = desktop_size((args.width, args.height))
+        bake(args.width, args.height, min(1.0, max(0.0, args.quality)), args.fps, field_size=field_size)
+    elif args.command == "list":
+        fingerprint = effect_fingerprint(field_size=desktop_size())
+        paths = sorted(BAKE_DIR.glob("transition_*.cqf")) if BAKE_DIR.exists() else []
+        if not paths:
+            print("No baked transitions")
+        for path in paths:
+            status = "current" if path.stem.endswith(fingerprint) else "stale"
+            print(f"{path.name}  {path.stat().st_size / (1024 * 1024):.1f} MB  [{status}]")
+    elif args.command == "clear":
+        remove_stale(BAKE_DIR, None if args.all else effect_fingerprint(field_size=desktop_size()))
+
+
+if __name__ == "__main__":
+    main()
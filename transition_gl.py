@@ -0,0 +1,320 @@
+"""
+Continental Quest - OpenGL Transition Renderer
+Draws the quantum transition with OpenGL instead of pygame.draw.
+
+Stars and particles are point sprites, trails are line strips, and
+everything is streamed from vertex buffers each frame. Only fixed-function
+GL 1.5/2.0 features are used so it also runs on Mesa's llvmpipe/softpipe.
+"""
+
+import ctypes
+import math
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+import gl_resources
+
+SPRITE_SIZE = 64
+
+# Interleaved vertex layout: x, y, r, g, b, a (float32)
+VERTEX_FLOATS = 6
+VERTEX_STRIDE = VERTEX_FLOATS * 4
+
+
+def _disk_pixels(soft):
+    """Round sprite: a hard-edged disk for stars or a radial falloff for glows (luminance + alpha)"""
+    coords = (np.arange(SPRITE_SIZE, dtype=np.float32) + 0.5) / SPRITE_SIZE * 2.0 - 1.0
+    xx, yy = np.meshgrid(coords, coords)
+    radius = np.sqrt(xx * xx + yy * yy)
+    if soft:
+        alpha = np.clip(1.0 - radius, 0.0, 1.0) ** 2
+    else:
+        # Anti-aliased edge about one texel wide
+        alpha = np.clip((1.0 - radius) * SPRITE_SIZE / 2.0, 0.0, 1.0)
+    pixels = np.empty((SPRITE_SIZE, SPRITE_SIZE, 2), dtype=np.uint8)
+    pixels[..., 0] = 255
+    pixels[..., 1] = (alpha * 255).astype(np.uint8)
+    return pixels
+
+
+def _sprite_texture(resources, owner, soft):
+    """The shared sprite texture (kept loaded between transitions)"""
+    name = f"transition/{'glow' if soft else 'star'}-sprite"
+    handle = resources.acquire(name, owner)
+    if handle is None:
+        handle = resources.texture(name, _disk_pixels(soft), SPRITE_SIZE, SPRITE_SIZE, owner,
+                                   fmt=GL_LUMINANCE_ALPHA, wrap=GL_CLAMP_TO_EDGE, cache=True)
+    return handle
+
+
+class _VertexBatch:
+    """Vertices grouped by a size key (point size or line width) for one frame"""
+
+    def __init__(self):
+        self.groups = {}
+
+    def add(self, key, x, y, color, alpha=255):
+        self.groups.setdefault(key, []).extend(
+            (x + 0.5, y + 0.5, color[0] / 255.0, color[1] / 255.0, color[2] / 255.0, alpha / 255.0))
+
+    def clear(self):
+        self.groups.clear()
+
+
+class GLTransitionRenderer:
+    """OpenGL backend for TransitionField, the flash overlay and baked frames"""
+
+    def __init__(self, width, height, resources=None):
+        self.width = width
+        self.height = height
+        self.gl = resources or gl_resources.current()
+
+        # Streamed every frame, so a single buffer is reused for all draws
+        self._vbo_name = f"transition/vertices@{id(self):x}"
+        self._frame_name = f"transition/frame@{id(self):x}"
+        self.vbo = self.gl.buffer(self._vbo_name, self, usage=GL_STREAM_DRAW)
+        self.star_texture = _sprite_texture(self.gl, self, soft=False)
+        self.glow_texture = _sprite_texture(self.gl, self, soft=True)
+        self.frame_texture = None
+        self.frame_texture_size = None
+
+        point_range = glGetFloatv(GL_ALIASED_POINT_SIZE_RANGE)
+        self.max_point_size = float(point_range[1]) if point_range is not None else 64.0
+        line_range = glGetFloatv(GL_ALIASED_LINE_WIDTH_RANGE)
+        self.max_line_width = float(line_range[1]) if line_range is not None else 1.0
+
+        glDisable(GL_DEPTH_TEST)
+        glDisable(GL_LIGHTING)
+        glEnable(GL_BLEND)
+        glClearColor(0.0, 0.0, 0.0, 1.0)
+        self.resize(width, height)
+
+        print(f"🖥️ OpenGL transition renderer: {glGetString(GL_RENDERER).decode(errors='replace')}")
+
+    def resize(self, width, height):
+        """Pixel-space projection with pygame's top-left origin"""
+        self.width, self.height = max(1, width), max(1, height)
+        glViewport(0, 0, self.width, self.height)
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        glOrtho(0, self.width, self.height, 0, -1, 1)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+
+    # ------------------ Low level drawing ------------------
+
+    def _upload(self, vertices):
+        data = np.asarray(vertices, dtype=np.float32)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STREAM_DRAW)
+        self.gl.resize(self._vbo_name, data.nbytes)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(0))
+        glColorPointer(4, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(8))
+        return len(data) // VERTEX_FLOATS
+
+    def _finish_draw(self):
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def _draw_points(self, batch, texture, additive):
+        """Draw point sprites, one call per point size"""
+        if not batch.groups:
+            return
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, texture)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
+        glEnable(GL_POINT_SPRITE)
+        glTexEnvi(GL_POINT_SPRITE, GL_COORD_REPLACE, GL_TRUE)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE if additive else GL_ONE_MINUS_SRC_ALPHA)
+
+        for size in sorted(batch.groups, reverse=True):
+            count = self._upload(batch.groups[size])
+            glPointSize(min(self.max_point_size, size))
+            glDrawArrays(GL_POINTS, 0, count)
+        self._finish_draw()
+
+        glDisable(GL_POINT_SPRITE)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
+
+    def _draw_lines(self, vertices, width, additive, mode=GL_LINES, strips=None):
+        """Draw lines (or line strips given (first, count) pairs) from one buffer"""
+        if not vertices:
+            return
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE if additive else GL_ONE_MINUS_SRC_ALPHA)
+        glLineWidth(min(self.max_line_width, max(1.0, width)))
+        count = self._upload(vertices)
+        if strips:
+            firsts = np.array([first for first, _ in strips], dtype=np.int32)
+            counts = np.array([n for _, n in strips], dtype=np.int32)
+            glMultiDrawArrays(mode, firsts, counts, len(strips))
+        else:
+            glDrawArrays(mode, 0, count)
+        self._finish_draw()
+        glLineWidth(1.0)
+
+    # ------------------ Transition layers ------------------
+
+    def clear(self):
+        glClear(GL_COLOR_BUFFER_BIT)
+
+    def draw_field(self, field, phase, progress, warp_speed, time_factor, quality,
+                   interpolation=1.0, low_detail=False):
+        """Draw everything TransitionField.draw does, in the same order"""
+        self.clear()
+        self._draw_particles(field.particles, interpolation)
+        if phase == "lightspeed":
+            self._draw_grid(min(1.0, warp_speed / 10), time_factor)
+        if phase == "flash":
+            self._draw_tunnel(progress)
+        self._draw_stars(field, warp_speed, quality, interpolation, low_detail)
+
+    def _draw_particles(self, particles, interpolation):
+        glows, cores = _VertexBatch(), _VertexBatch()
+        for particle in particles:
+            projected = particle.project(interpolation)
+            if projected is None:
+                continue
+            x, y, size, color = projected
+            if size > 1:
+                glows.add((size + 2) * 2 + 1, x, y, (color[0] // 3, color[1] // 3, color[2] // 3))
+            cores.add(size * 2 + 1, x, y, color)
+        self._draw_points(glows, self.star_texture, additive=True)
+        self._draw_points(cores, self.star_texture, additive=False)
+
+    def _draw_grid(self, progress, time_factor):
+        vertices = []
+        for i in range(-5, 15):
+            x_offset = (time_factor * 200 + i * 100) % (self.width + 200) - 100
+            alpha = int(50 * progress * math.sin(time_factor + i) * 0.5 + 25)
+            if alpha > 5:
+                color = (alpha / 255.0, (alpha // 2) / 255.0, (alpha + 20) / 255.0, 1.0)
+                vertices.extend((x_offset, 0) + color)
+                vertices.extend((x_offset, self.height) + color)
+        for i in range(-3, 10):
+            y_offset = (time_factor * 150 + i * 120) % (self.height + 240) - 120
+            alpha = int(40 * progress * math.cos(time_factor + i) * 0.5 + 20)
+            if alpha > 5:
+                color = (alpha / 255.0, (alpha // 3) / 255.0, (alpha + 15) / 255.0, 1.0)
+                vertices.extend((0, y_offset) + color)
+                vertices.extend((self.width, y_offset) + color)
+        self._draw_lines(vertices, 1, additive=True)
+
+    def _draw_tunnel(self, progress, segments=96):
+        center_x, center_y = self.width // 2, self.height // 2
+        vertices, strips = [], []
+        for ring in range(8):
+            ring_progress = (progress + ring * 0.1) % 1.0
+            radius = int(ring_progress * max(self.width, self.height) * 1.5)
+            alpha = int(100 * (1 - ring_progress) * progress)
+            if radius > 10 and alpha > 5:
+                color = ((alpha // 2) / 255.0, (alpha // 3) / 255.0, alpha / 255.0, 1.0)
+                strips.append((len(vertices) // VERTEX_FLOATS, segments + 1))
+                for s in range(segments + 1):
+                    angle = 2 * math.pi * s / segments
+                    vertices.extend((center_x + math.cos(angle) * radius,
+                                     center_y + math.sin(angle) * radius) + color)
+        self._draw_lines(vertices, 3, additive=True, mode=GL_LINE_STRIP, strips=strips)
+
+    def _draw_stars(self, field, warp_speed, quality, interpolation, low_detail):
+        trails = {}     # line width -> (vertices, strips)
+        glows, cores, centers = _VertexBatch(), _VertexBatch(), _VertexBatch()
+        glow_rings = quality["glow_rings"]
+        surface_size = (self.width, self.height)
+
+        for star in field.stars[:quality["star_count"]]:
+            projected = star.project(surface_size, warp_speed, field.screen_width, field.screen_height,
+                                     interpolation, low_detail, quality["trail_segments"])
+            if projected is None:
+                continue
+            screen_x, screen_y, size, color, final_brightness, trail_points = projected
+
+            # Trail: the leading segments that are still bright enough, as one strip
+            if len(trail_points) > 1:
+                visible = 0
+                for i in range(len(trail_points) - 1):
+                    if int(255 * final_brightness * (1 - i / len(trail_points)) * 0.7) <= 10:
+                        break
+                    visible += 1
+                if visible:
+                    trail_color = (min(255, color[0] + 50) / 255.0, min(255, color[1] + 30) / 255.0,
+                                   min(255, color[2]) / 255.0, 1.0)
+                    vertices, strips = trails.setdefault(max(1, size), ([], []))
+                    strips.append((len(vertices) // VERTEX_FLOATS, visible + 1))
+                    for point in trail_points[:visible + 1]:
+                        vertices.extend((point[0] + 0.5, point[1] + 0.5) + trail_color)
+
+            # Glow rings collapse into one soft additive sprite tinted like the outermost ring
+            if size >= 2 and not low_detail and glow_rings > 0:
+                glow_alpha = max(10, int(final_brightness * 100 * (4 - glow_rings) / 4))
+                glow_color = (min(255, color[0] + glow_alpha // 3),
+                              min(255, color[1] + glow_alpha // 4),
+                              min(255, color[2] + glow_alpha // 5))
+                glows.add((size + glow_rings) * 2 + 1, screen_x, screen_y, glow_color)
+
+            cores.add(size * 2 + 1, screen_x, screen_y, color)
+            if size > 2:
+                centers.add(max(1, size // 2) * 2 + 1, screen_x, screen_y,
+                            (min(255, color[0] + 100), min(255, color[1] + 100), min(255, color[2] + 100)))
+
+        for width in sorted(trails):
+            vertices, strips = trails[width]
+            self._draw_lines(vertices, width, additive=False, mode=GL_LINE_STRIP, strips=strips)
+        self._draw_points(glows, self.glow_texture, additive=True)
+        self._draw_points(cores, self.star_texture, additive=False)
+        self._draw_points(centers, self.star_texture, additive=False)
+
+    def draw_flash(self, intensity):
+        """Full-screen flash with a blue tint, blended additively"""
+        if intensity <= 0:
+            return
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE)
+        glColor4f(min(1.0, intensity), min(1.0, intensity), min(1.0, intensity * 1.2),
+                  int(intensity * 200) / 255.0)
+        glBegin(GL_QUADS)
+        glVertex2f(0, 0)
+        glVertex2f(self.width, 0)
+        glVertex2f(self.width, self.height)
+        glVertex2f(0, self.height)
+        glEnd()
+        glColor4f(1, 1, 1, 1)
+
+    def draw_surface(self, surface):
+        """Stretch a pygame surface (e.g. a baked frame) over the whole window"""
+        size = surface.get_size()
+        pixels = pygame.image.tostring(surface, "RGB")
+        glEnable(GL_TEXTURE_2D)
+        if self.frame_texture is None:
+            self.frame_texture = self.gl.texture(self._frame_name, pixels, size[0], size[1], self,
+                                                 wrap=GL_CLAMP_TO_EDGE)
+            self.frame_texture_size = size
+            glBindTexture(GL_TEXTURE_2D, self.frame_texture)
+        elif self.frame_texture_size != size:
+            glBindTexture(GL_TEXTURE_2D, self.frame_texture)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, size[0], size[1], 0, GL_RGB, GL_UNSIGNED_BYTE, pixels)
+            self.gl.resize(self._frame_name, size[0] * size[1] * 3)
+            self.frame_texture_size = size
+        else:
+            glBindTexture(GL_TEXTURE_2D, self.frame_texture)
+            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, size[0], size[1], GL_RGB, GL_UNSIGNED_BYTE, pixels)
+        glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_REPLACE)
+        glDisable(GL_BLEND)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 0); glVertex2f(0, 0)
+        glTexCoord2f(1, 0); glVertex2f(self.width, 0)
+        glTexCoord2f(1, 1); glVertex2f(self.width, self.height)
+        glTexCoord2f(0, 1); glVertex2f(0, self.height)
+        glEnd()
+        glEnable(GL_BLEND)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
+
+    def release(self):
+        """Free the GL objects owned by the renderer (the sprites stay cached for the next transition)"""
+        self.gl.release_owner(self)
+        self.frame_texture = None
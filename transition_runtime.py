@@ -0,0 +1,230 @@
+"""
+Continental Quest - Transition Runtime
+Timing and quality helpers shared by the quantum space jump transition loops
+"""
+
+import math
+import os
+from collections import deque
+
+import pygame
+
+# Simulation rate the star/particle motion was tuned for (one step = one 60 FPS frame)
+SIM_RATE = 60
+SIM_STEP = 1.0 / SIM_RATE
+
+# Render frame cap for the transition loops
+TARGET_FPS = 60
+
+# Frame times above this (window drag, breakpoint, etc.) are clamped
+MAX_FRAME_TIME = 0.25
+
+# Never simulate more than this many steps for a single rendered frame.
+# Sized so a clamped frame is always fully simulated: the warp keeps real time
+# down to 1 / MAX_FRAME_TIME = 4 FPS and only loses time to the clamp above.
+MAX_STEPS_PER_FRAME = math.ceil(MAX_FRAME_TIME * SIM_RATE)
+
+# Frames needing more steps than this count as falling behind (low detail mode)
+OVERLOAD_STEPS = 5
+
+# How many frames to stay in low detail mode after falling behind
+LOW_DETAIL_HOLD_FRAMES = 30
+
+# (lowest, highest) value of each transition cost parameter the governor controls
+QUALITY_BOUNDS = {
+    "star_count": (120, 400),
+    "trail_segments": (3, 20),
+    "glow_rings": (0, 4),
+    "particle_spawn_rate": (0.03, 0.1),
+    "render_scale": (0.5, 1.0),
+}
+
+# Displays with more pixels than this render the transition at a reduced internal resolution
+RENDER_SCALE_REFERENCE_PIXELS = 1920 * 1080
+MIN_RENDER_SCALE = 0.25
+
+
+class FixedTimestep:
+    """Fixed-rate simulation clock driven by wall-clock frame times"""
+
+    def __init__(self, rate=SIM_RATE, max_steps=MAX_STEPS_PER_FRAME,
+                 overload_steps=OVERLOAD_STEPS):
+        self.step = 1.0 / rate
+        self.max_steps = max_steps
+        self.overload_steps = overload_steps
+        self.accumulator = 0.0
+        self.overloaded = False
+        self.dropped_steps = 0
+        self.low_detail_frames = 0
+
+    def advance(self, frame_time):
+        """Add one frame's elapsed time and return how many steps to simulate"""
+        self.accumulator += min(max(frame_time, 0.0), MAX_FRAME_TIME)
+
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+
+        # Catch up on the whole backlog so the warp keeps real time; only a cap
+        # tighter than MAX_FRAME_TIME (custom max_steps) ever drops steps
+        if steps > self.max_steps:
+            self.dropped_steps += steps - self.max_steps
+            steps = self.max_steps
+
+        # Falling behind switches to low detail so the next frames come sooner
+        self.overloaded = steps > self.overload_steps
+        if self.overloaded:
+            self.low_detail_frames = LOW_DETAIL_HOLD_FRAMES
+        elif self.low_detail_frames > 0:
+            self.low_detail_frames -= 1
+
+        return steps
+
+    @property
+    def alpha(self):
+        """Fraction of a step left over, used to interpolate rendering"""
+        return min(1.0, self.accumulator / self.step)
+
+    @property
+    def low_detail(self):
+        """True while recovering from an overloaded frame"""
+        return self.low_detail_frames > 0
+
+
+class QualityGovernor:
+    """Scales transition detail up or down to hold a target frame rate"""
+
+    def __init__(self, target_fps=TARGET_FPS, bounds=None, initial_quality=1.0,
+                 window=20, quality_step=0.1):
+        self.target_frame_time = 1.0 / target_fps
+        self.bounds = dict(QUALITY_BOUNDS)
+        if bounds:
+            self.bounds.update(bounds)
+        self.quality = min(1.0, max(0.0, initial_quality))
+        self.quality_step = quality_step
+        self.work_times = deque(maxlen=window)
+        self.frame_count = 0
+        self.total_time = 0.0
+        self.lowest_quality = self.quality
+        self.adjustments = 0
+
+    def record_frame(self, work_time, frame_time=None):
+        """Record one frame's busy time (excluding the frame cap sleep) and adapt"""
+        self.work_times.append(work_time)
+        self.frame_count += 1
+        self.total_time += frame_time if frame_time is not None else work_time
+
+        # Only re-evaluate once a full window has been measured at this level
+        if len(self.work_times) < self.work_times.maxlen:
+            return
+
+        average = sum(self.work_times) / len(self.work_times)
+        if average > self.target_frame_time * 0.9 and self.quality > 0.0:
+            self._set_quality(self.quality - self.quality_step)
+        elif average < self.target_frame_time * 0.5 and self.quality < 1.0:
+            self._set_quality(self.quality + self.quality_step)
+
+    def _set_quality(self, quality):
+        self.quality = round(min(1.0, max(0.0, quality)), 3)
+        self.lowest_quality = min(self.lowest_quality, self.quality)
+        self.adjustments += 1
+        self.work_times.clear()
+
+    def value(self, name):
+        """Current value of a governed parameter"""
+        low, high = self.bounds[name]
+        value = low + (high - low) * self.quality
+        return value if isinstance(low, float) or isinstance(high, float) else int(round(value))
+
+    @property
+    def params(self):
+        """All governed parameters at the current quality level"""
+        return {name: self.value(name) for name in self.bounds}
+
+    @property
+    def max_star_count(self):
+        return self.bounds["star_count"][1]
+
+    def summary(self):
+        """Quality level this session settled on, for logging"""
+        average_fps = self.frame_count / self.total_time if self.total_time > 0 else 0.0
+        return {
+            "quality": self.quality,
+            "lowest_quality": self.lowest_quality,
+            "adjustments": self.adjustments,
+            "frames": self.frame_count,
+            "average_fps": round(average_fps, 1),
+            "params": self.params,
+        }
+
+    def log_summary(self, label="Transition"):
+        summary = self.summary()
+        params = summary["params"]
+        print(f"🎚️ {label} quality settled at {summary['quality'] * 100:.0f}% "
+              f"(stars={params['star_count']}, trails={params['trail_segments']}, "
+              f"glow={params['glow_rings']}, particles={params['particle_spawn_rate']:.3f}, "
+              f"render scale={params['render_scale']:.2f}) "
+              f"- {summary['average_fps']} FPS over {summary['frames']} frames, "
+              f"{summary['adjustments']} adjustments")
+        return summary
+
+
+def configured_render_scale():
+    """Render scale forced through CQ_RENDER_SCALE, or None for automatic"""
+    value = os.environ.get("CQ_RENDER_SCALE", "auto").strip().lower()
+    if value in ("", "auto"):
+        return None
+    try:
+        return min(1.0, max(MIN_RENDER_SCALE, float(value)))
+    except ValueError:
+        print(f"⚠️ Ignoring invalid CQ_RENDER_SCALE={value!r}")
+        return None
+
+
+def requested_backend():
+    """Transition backend forced through CQ_TRANSITION_BACKEND: 'gl', 'software' or 'auto'"""
+    value = os.environ.get("CQ_TRANSITION_BACKEND", "auto").strip().lower()
+    if value in ("", "auto", "gl", "software"):
+        return value or "auto"
+    print(f"⚠️ Ignoring invalid CQ_TRANSITION_BACKEND={value!r}")
+    return "auto"
+
+
+def choose_render_scale(width, height, reference_pixels=RENDER_SCALE_REFERENCE_PIXELS):
+    """Pick an internal render scale that keeps the drawn pixel count near 1080p"""
+    pixels = width * height
+    if pixels <= reference_pixels:
+        return 1.0
+    return max(MIN_RENDER_SCALE, round(math.sqrt(reference_pixels / pixels), 2))
+
+
+class ScaledRenderTarget:
+    """Offscreen canvas at a fraction of the display size, upscaled once per frame"""
+
+    def __init__(self, scale=None):
+        self.fixed_scale = scale  # None picks the scale from the resolution and governor
+        self.scale = 1.0
+        self.canvas = None
+
+    def begin(self, screen, governor_scale=1.0):
+        """Return the surface to draw this frame into"""
+        width, height = screen.get_size()
+        if self.fixed_scale is not None:
+            scale = self.fixed_scale
+        else:
+            scale = min(choose_render_scale(width, height), governor_scale)
+
+        # Full resolution draws straight to the display
+        if scale >= 0.99:
+            self.scale = 1.0
+            return screen
+
+        size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        if self.canvas is None or self.canvas.get_size() != size:
+            self.canvas = pygame.Surface(size, 0, screen)
+        self.scale = size[0] / width
+        return self.canvas
+
+    def present(self, screen):
+        """Upscale this frame's canvas onto the display"""
+        if self.scale < 1.0 and self.canvas is not None:
+            pygame.transform.smoothscale(self.canvas, screen.get_size(), screen)
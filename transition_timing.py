@@ -0,0 +1,14 @@
+"""
+Continental Quest - Transition Timing
+Phase timings of the quantum space jump. Kept free of pygame so the launcher
+can follow the transition's clock without loading the graphics stack.
+"""
+
+# Phase timings (in milliseconds)
+TRANSITION_PHASES = {
+    "acceleration": 2000,      # 0-2s: Gradual acceleration
+    "lightspeed": 4000,        # 2-6s: Full light speed travel
+    "flash": 1000,             # 6-7s: Intense flash
+    "arrival": 1000            # 7-8s: Arrival and completion
+}
+TRANSITION_DURATION = 8000  # 8 seconds total
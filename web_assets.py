@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Continental Quest - Web Assets
+Build step for the landing page: minifies style.css and script.js, names them
+by content hash, precompresses everything (gzip, plus brotli when installed)
+and writes a manifest. The launcher's HTTP server serves the build from memory
+with strong ETags and immutable caching; the desktop app loads the built page
+straight from disk.
+
+Usage:
+    python web_assets.py build [--force]
+    python web_assets.py clear
+    python web_assets.py measure [--url http://127.0.0.1:8765/] [--runs 20]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import shutil
+import statistics
+import time
+import urllib.parse
+from pathlib import Path
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+ASSET_FORMAT_VERSION = 1
+APP_DIR = Path(__file__).parent
+ASSET_DIR = APP_DIR / "cache" / "web"
+MANIFEST_NAME = "manifest.json"
+
+ENTRY_PAGE = "continental_quest_landing.html"
+# Files the entry page links to; fingerprinted so browsers can keep them forever
+LINKED_ASSETS = ("style.css", "script.js")
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+# Smaller files aren't worth compressing
+MIN_COMPRESS_SIZE = 256
+
+
+def minify_css(text):
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    text = re.sub(r"([{;])\s*([\w-]+)\s*:\s*", r"\1\2:", text)
+    return text.replace(";}", "}").strip()
+
+
+def minify_js(text):
+    """Conservative: drop indentation, blank lines and whole-line // comments, keep line breaks"""
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def minify_html(text):
+    text = re.sub(r"<!--.*?-->", "", text, flags=re.S)
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js, ".html": minify_html}
+
+
+def source_fingerprint(app_dir=APP_DIR):
+    """Hash of everything that goes into a build - a change means rebuilding"""
+    digest = hashlib.sha256()
+    digest.update(f"{ASSET_FORMAT_VERSION}:{BROTLI_AVAILABLE}".encode())
+    for name in (ENTRY_PAGE,) + LINKED_ASSETS:
+        digest.update(name.encode())
+        digest.update((app_dir / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def load_manifest(out_dir=ASSET_DIR):
+    try:
+        manifest = json.loads((out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != ASSET_FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def _is_complete(manifest, out_dir):
+    for name, entry in manifest["files"].items():
+        files = [name] + [variant["file"] for variant in entry["encodings"].values()]
+        if not all((out_dir / file).exists() for file in files):
+            return False
+    return True
+
+
+def _write_asset(out_dir, name, body, immutable):
+    """Write an asset and its compressed variants; returns its manifest entry"""
+    digest = hashlib.sha256(body).hexdigest()
+    (out_dir / name).write_bytes(body)
+    entry = {
+        "type": CONTENT_TYPES[Path(name).suffix],
+        "etag": digest[:20],
+        "cache": IMMUTABLE if immutable else REVALIDATE,
+        "size": len(body),
+        "encodings": {},
+    }
+    if len(body) >= MIN_COMPRESS_SIZE:
+        variants = {"gzip": (".gz", lambda data: gzip.compress(data, 9, mtime=0))}
+        if BROTLI_AVAILABLE:
+            variants["br"] = (".br", lambda data: brotli.compress(data, quality=11))
+        for encoding, (suffix, compress) in variants.items():
+            compressed = compress(body)
+            (out_dir / (name + suffix)).write_bytes(compressed)
+            entry["encodings"][encoding] = {"file": name + suffix, "size": len(compressed)}
+    return entry
+
+
+def build(app_dir=APP_DIR, out_dir=ASSET_DIR, force=False):
+    """Build the landing page assets unless the last build is still current; returns the manifest"""
+    source = source_fingerprint(app_dir)
+    manifest = load_manifest(out_dir)
+    if (not force and manifest is not None and manifest["source"] == source
+            and _is_complete(manifest, out_dir)):
+        return manifest
+
+    start = time.perf_counter()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    page = (app_dir / ENTRY_PAGE).read_text(encoding="utf-8")
+    for name in LINKED_ASSETS:
+        path = Path(name)
+        body = MINIFIERS[path.suffix]((app_dir / name).read_text(encoding="utf-8")).encode("utf-8")
+        fingerprinted = f"{path.stem}.{hashlib.sha256(body).hexdigest()[:12]}{path.suffix}"
+        files[fingerprinted] = _write_asset(out_dir, fingerprinted, body, immutable=True)
+        if page.count(f'"{name}"') != 1:
+            raise ValueError(f"{ENTRY_PAGE} should link to {name} exactly once")
+        page = page.replace(f'"{name}"', f'"{fingerprinted}"')
+    files[ENTRY_PAGE] = _write_asset(out_dir, ENTRY_PAGE, minify_html(page).encode("utf-8"),
+                                     immutable=False)
+
+    manifest = {
+        "version": ASSET_FORMAT_VERSION,
+        "source": source,
+        "built_at": time.time(),
+        "entry": ENTRY_PAGE,
+        "files": files,
+    }
+    temp = out_dir / (MANIFEST_NAME + ".tmp")
+    temp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    temp.replace(out_dir / MANIFEST_NAME)
+    remove_stale(out_dir, manifest)
+
+    source_size = sum((app_dir / name).stat().st_size for name in (ENTRY_PAGE,) + LINKED_ASSETS)
+    built_size = sum(entry["size"] for entry in files.values())
+    gzip_size = sum(entry["encodings"].get("gzip", entry)["size"] for entry in files.values())
+    print(f"📦 Built landing assets in {(time.perf_counter() - start) * 1000:.0f} ms: "
+          f"{source_size / 1024:.1f} KB → {built_size / 1024:.1f} KB minified, "
+          f"{gzip_size / 1024:.1f} KB gzipped{'' if BROTLI_AVAILABLE else ' (brotli not installed)'}")
+    return manifest
+
+
+def remove_stale(out_dir=ASSET_DIR, manifest=None):
+    """Delete built files the manifest no longer refers to (all of them if manifest is None)"""
+    keep = {MANIFEST_NAME} if manifest is not None else set()
+    for name, entry in (manifest or {}).get("files", {}).items():
+        keep.add(name)
+        keep.update(variant["file"] for variant in entry["encodings"].values())
+    if not out_dir.exists():
+        return
+    for path in out_dir.iterdir():
+        if path.name not in keep and path.is_file():
+            path.unlink()
+
+
+def entry_page(app_dir=APP_DIR, out_dir=ASSET_DIR):
+    """Path of the built landing page, building it first if needed"""
+    manifest = build(app_dir, out_dir)
+    return out_dir / manifest["entry"]
+
+
+def _accepted_encodings(accept_encoding):
+    accepted = set()
+    for token in (accept_encoding or "").split(","):
+        name, _, params = token.strip().partition(";")
+        if name and params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def _etag_matches(if_none_match, etag):
+    """Whether If-None-Match names etag, the ETag of the representation being served"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().replace("W/", "", 1) for tag in if_none_match.split(",")}
+    return etag in tags
+
+
+class AssetStore:
+    """The built landing assets held in memory, ready to serve"""
+
+    def __init__(self, manifest, out_dir=ASSET_DIR):
+        self.manifest = manifest
+        self.entry = manifest["entry"]
+        self.files = {}
+        for name, entry in manifest["files"].items():
+            bodies = {"identity": (out_dir / name).read_bytes()}
+            for encoding, variant in entry["encodings"].items():
+                bodies[encoding] = (out_dir / variant["file"]).read_bytes()
+            self.files[name] = (entry, bodies)
+
+    @classmethod
+    def load(cls, app_dir=APP_DIR, out_dir=ASSET_DIR):
+        return cls(build(app_dir, out_dir), out_dir)
+
+    def lookup(self, path, accept_encoding=None, if_none_match=None):
+        """(status, body, headers) for a GET of path, or None if it isn't a built asset"""
+        name = path.lstrip("/") or self.entry
+        if name not in self.files:
+            return None
+        entry, bodies = self.files[name]
+
+        encoding = "identity"
+        accepted = _accepted_encodings(accept_encoding)
+        for candidate in ("br", "gzip"):
+            if candidate in bodies and candidate in accepted:
+                encoding = candidate
+                break
+
+        # Each encoding is a different representation, so each gets its own strong ETag
+        etag = f'"{entry["etag"]}"' if encoding == "identity" else f'"{entry["etag"]}-{encoding}"'
+        headers = {"ETag": etag, "Cache-Control": entry["cache"], "Vary": "Accept-Encoding"}
+        # Only the selected encoding's ETag counts: a client holding another encoding doesn't have this one
+        if _etag_matches(if_none_match, etag):
+            return 304, b"", headers
+
+        headers["Content-Type"] = entry["type"]
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return 200, bodies[encoding], headers
+
+
+def _fetch_page(host, port, cache):
+    """Load the landing page the way a browser would, reading and filling cache
+    (path -> {"etag", "immutable", "body"})
+
+    Returns (seconds, bytes transferred, requests made).
+    """
+    import http.client
+
+    start = time.perf_counter()
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    transferred = requests = 0
+
+    def get(path):
+        nonlocal transferred, requests
+        cached = cache.get(path)
+        if cached is not None and cached["immutable"]:
+            return cached["body"]
+        headers = {"Accept-Encoding": "br, gzip" if BROTLI_AVAILABLE else "gzip"}
+        if cached is not None and cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        requests += 1
+        transferred += len(body)
+        if response.status == 304:
+            return cached["body"]
+        encoding = response.getheader("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "br":
+            body = brotli.decompress(body)
+        cache[path] = {
+            "etag": response.getheader("ETag"),
+            "immutable": "immutable" in (response.getheader("Cache-Control") or ""),
+            "body": body,
+        }
+        return body
+
+    page = get("/").decode("utf-8")
+    for link in re.findall(r'(?:href|src)="([^":]+\.(?:css|js))"', page):
+        get("/" + link.lstrip("/"))
+    connection.close()
+    return time.perf_counter() - start, transferred, requests
+
+
+def measure(url, runs=20):
+    """Cold (empty cache) vs warm (browser cache primed) page loads against a running launcher"""
+    parts = urllib.parse.urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    primed = {}
+    _fetch_page(host, port, primed)
+
+    results = {}
+    for label in ("cold", "warm"):
+        times = []
+        for _ in range(runs):
+            cache = dict(primed) if label == "warm" else {}
+            seconds, transferred, requests = _fetch_page(host, port, cache)
+            times.append(seconds)
+        results[label] = {
+            "median_ms": round(statistics.median(times) * 1000, 2),
+            "bytes": transferred,
+            "requests": requests,
+        }
+        print(f"⏱️ {label.capitalize()} load: median {results[label]['median_ms']:.2f} ms, "
+              f"{transferred / 1024:.1f} KB over {requests} requests ({runs} runs)")
+    return results
+
+
+def main():
+    """Asset CLI entry point"""
+    parser = argparse.ArgumentParser(description="Build the landing page assets")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="minify, fingerprint and precompress the landing page")
+    build_parser.add_argument("--force", action="store_true", help="rebuild even if up to date")
+
+    commands.add_parser("clear", help="delete the built assets")
+
+    measure_parser = commands.add_parser("measure", help="time cold and warm page loads over HTTP")
+    measure_parser.add_argument("--url", default="http://127.0.0.1:8765/", help="running launcher URL")
+    measure_parser.add_argument("--runs", type=int, default=20)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        manifest = build(force=args.force)
+        for name, entry in manifest["files"].items():
+            sizes = ", ".join(f"{encoding} {variant['size'] / 1024:.1f} KB"
+                              for encoding, variant in entry["encodings"].items())
+            print(f"{name}  {entry['size'] / 1024:.1f} KB" + (f"  ({sizes})" if sizes else ""))
+    elif args.command == "clear":
+        if ASSET_DIR.exists():
+            shutil.rmtree(ASSET_DIR)
+        print("🧹 Removed built landing assets")
+    elif args.command == "measure":
+        measure(args.url, args.runs)
+
+
+if __name__ == "__main__":
+    main()